@@ -2,8 +2,8 @@ from datetime import timedelta
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.core.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.session import get_async_db
 from app.core.security.auth import SecurityService
 from app.core.security.dependencies import get_current_user
 from app.services.master.user import UserService
@@ -19,7 +19,7 @@ router = APIRouter()
 @router.post("/register", response_model=UserInDB)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Register a new user.
@@ -28,14 +28,14 @@ async def register(
     audit_service = AuditService(db)
     
     # Check if email exists
-    if user_service.get_user_by_email(user_data.email):
+    if await user_service.get_user_by_email(user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Create user
-    user = user_service.create_user(user_data)
+    user = await user_service.create_user(user_data)
     
     # Log audit
     await audit_service.log_action(
@@ -52,7 +52,7 @@ async def register(
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OAuth2 compatible token login, get an access token for future requests.
@@ -61,7 +61,7 @@ async def login(
     audit_service = AuditService(db)
     security_service = SecurityService(db)
     
-    user = user_service.authenticate_user(form_data.username, form_data.password)
+    user = await user_service.authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -110,7 +110,7 @@ async def login(
 async def verify_2fa(
     code: str,
     email: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Verify 2FA code and get access token.
@@ -119,7 +119,7 @@ async def verify_2fa(
     audit_service = AuditService(db)
     security_service = SecurityService(db)
     
-    user = user_service.get_user_by_email(email)
+    user = await user_service.get_user_by_email(email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -166,7 +166,7 @@ async def verify_2fa(
 @router.post("/refresh-token", response_model=Token)
 async def refresh_token(
     refresh_token_data: RefreshToken,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a new access token using refresh token.
@@ -185,7 +185,7 @@ async def refresh_token(
         )
     
     # Get user
-    user = user_service.get_user_by_id(user_id)
+    user = await user_service.get_user_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -223,7 +223,7 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Logout current user.
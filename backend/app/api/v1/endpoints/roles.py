@@ -1,7 +1,7 @@
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.db.session import get_db
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.session import get_async_db
 from app.core.security.dependencies import get_current_user, get_current_admin_user, get_tenant_id
 from app.core.security.permissions import get_permission_checker
 from app.services.master.role import RoleService
@@ -21,16 +21,21 @@ router = APIRouter()
 
 @router.get("/", response_model=List[RoleInDB])
 async def list_roles(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
     List all roles.
     Requires LIST_ROLES permission.
+
+    Pass the X-Next-Cursor header of a page as ``cursor`` to get the next
+    page; ``skip`` is kept for offset paging.
     """
     await permission_checker.require_permission(
         "LIST_ROLES",
@@ -39,7 +44,9 @@ async def list_roles(
     )
     
     role_service = RoleService(db)
-    return role_service.get_roles(tenant_id, skip=skip, limit=limit)
+    roles = await role_service.get_roles(tenant_id, skip=skip, limit=limit, cursor=cursor)
+    RoleService.keyset.set_next_cursor(response, roles, limit)
+    return roles
 
 
 @router.post("/", response_model=RoleInDB, status_code=status.HTTP_201_CREATED)
@@ -47,7 +54,7 @@ async def create_role(
     role_data: RoleCreate,
     current_user: Annotated[User, Depends(get_current_admin_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -64,17 +71,17 @@ async def create_role(
     audit_service = AuditService(db)
     
     # Check if role name exists
-    if role_service.get_role_by_name(role_data.name):
+    if await role_service.get_role_by_name(role_data.name):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Role name already exists"
         )
     
     # Create role
-    role = role_service.create_role(role_data, tenant_id)
+    role = await role_service.create_role(role_data, tenant_id)
     
     # Log the creation
-    audit_service.log_action(
+    await audit_service.log_action(
         user=current_user,
         tenant_id=tenant_id,
         action="CREATE_ROLE",
@@ -91,7 +98,7 @@ async def get_role(
     role_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -105,7 +112,7 @@ async def get_role(
     )
     
     role_service = RoleService(db)
-    role = role_service.get_role(role_id, tenant_id)
+    role = await role_service.get_role(role_id, tenant_id)
     if not role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -120,7 +127,7 @@ async def update_role(
     role_data: RoleUpdate,
     current_user: Annotated[User, Depends(get_current_admin_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -137,7 +144,7 @@ async def update_role(
     audit_service = AuditService(db)
     
     # Get current role data for audit
-    old_role = role_service.get_role(role_id, tenant_id)
+    old_role = await role_service.get_role_for_update(role_id, tenant_id)
     if not old_role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -145,7 +152,7 @@ async def update_role(
         )
     
     # Update role
-    updated_role = role_service.update_role(role_id, role_data, tenant_id)
+    updated_role = await role_service.update_role(role_id, role_data, tenant_id)
     if not updated_role:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -153,7 +160,7 @@ async def update_role(
         )
     
     # Log the change
-    audit_service.log_action(
+    await audit_service.log_action(
         user=current_user,
         tenant_id=tenant_id,
         action="UPDATE_ROLE",
@@ -171,7 +178,7 @@ async def delete_role(
     role_id: int,
     current_user: Annotated[User, Depends(get_current_admin_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -188,7 +195,7 @@ async def delete_role(
     audit_service = AuditService(db)
     
     # Get role data for audit
-    role = role_service.get_role(role_id, tenant_id)
+    role = await role_service.get_role_for_update(role_id, tenant_id)
     if not role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -196,14 +203,14 @@ async def delete_role(
         )
     
     # Delete role
-    if not role_service.delete_role(role_id, tenant_id):
+    if not await role_service.delete_role(role_id, tenant_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Could not delete role"
         )
     
     # Log the change
-    audit_service.log_action(
+    await audit_service.log_action(
         user=current_user,
         tenant_id=tenant_id,
         action="DELETE_ROLE",
@@ -217,7 +224,7 @@ async def delete_role(
 async def list_permissions(
     current_user: Annotated[User, Depends(get_current_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     skip: int = 0,
     limit: int = 100,
     tenant_id: int = Depends(get_tenant_id)
@@ -233,7 +240,7 @@ async def list_permissions(
     )
     
     role_service = RoleService(db)
-    return role_service.get_permissions(tenant_id, skip=skip, limit=limit)
+    return await role_service.get_permissions(tenant_id, skip=skip, limit=limit)
 
 
 @router.post("/permissions", response_model=PermissionInDB)
@@ -241,7 +248,7 @@ async def create_permission(
     permission_data: PermissionCreate,
     current_user: Annotated[User, Depends(get_current_admin_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -258,21 +265,21 @@ async def create_permission(
     audit_service = AuditService(db)
     
     # Check if permission code exists
-    if role_service.get_permission_by_code(permission_data.code):
+    if await role_service.get_permission_by_code(permission_data.code):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Permission code already exists"
         )
     
     # Create permission
-    permission = role_service.create_permission(
+    permission = await role_service.create_permission(
         code=permission_data.code,
         description=permission_data.description,
         tenant_id=tenant_id
     )
     
     # Log the creation
-    audit_service.log_action(
+    await audit_service.log_action(
         user=current_user,
         tenant_id=tenant_id,
         action="CREATE_PERMISSION",
@@ -1,7 +1,7 @@
 from typing import Annotated, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.session import get_async_db
 from app.core.security.dependencies import get_current_admin_user
 from app.services.master.tenant_wizard import TenantWizardService
 from app.schemas.master.tenant import TenantCreate
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.post("/wizard/validate-name")
 async def validate_tenant_name(
     name: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Validate if tenant name is available
@@ -27,7 +27,7 @@ async def validate_tenant_name(
 @router.get("/wizard/templates")
 async def list_templates(
     current_user: Annotated[User, Depends(get_current_admin_user)],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List available tenant templates.
@@ -43,7 +43,7 @@ async def create_tenant(
     tenant_data: TenantCreate,
     admin_data: UserCreate,
     current_user: Annotated[User, Depends(get_current_admin_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     template_id: int = None
 ):
     """
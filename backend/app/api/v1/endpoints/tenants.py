@@ -1,7 +1,7 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.db.session import get_db
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.session import get_async_db
 from app.core.security.dependencies import get_current_user, get_current_admin_user, get_tenant_id
 from app.core.security.permissions import get_permission_checker
 from app.services.master.tenant import TenantService
@@ -15,24 +15,31 @@ router = APIRouter()
 
 @router.get("/", response_model=List[TenantInDB])
 async def list_tenants(
+    response: Response,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None
 ):
     """
     List all tenants.
     Requires admin access.
+
+    Pass the X-Next-Cursor header of a page as ``cursor`` to get the next
+    page; ``skip`` is kept for offset paging.
     """
     tenant_service = TenantService(db)
-    return tenant_service.get_tenants(skip=skip, limit=limit)
+    tenants = await tenant_service.get_tenants(skip=skip, limit=limit, cursor=cursor)
+    TenantService.keyset.set_next_cursor(response, tenants, limit)
+    return tenants
 
 
 @router.post("/", response_model=TenantInDB, status_code=status.HTTP_201_CREATED)
 async def create_tenant(
     tenant_data: TenantCreate,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create new tenant.
@@ -42,14 +49,14 @@ async def create_tenant(
     audit_service = AuditService(db)
     
     # Check if tenant name exists
-    if tenant_service.get_tenant_by_name(tenant_data.name):
+    if await tenant_service.get_tenant_by_name(tenant_data.name):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Tenant name already exists"
         )
     
     # Create tenant
-    tenant = tenant_service.create_tenant(tenant_data, current_user)
+    tenant = await tenant_service.create_tenant(tenant_data, current_user)
     
     # Log audit
     await audit_service.log_action(
@@ -69,7 +76,7 @@ async def get_tenant(
     tenant_id: int,
     current_user: User = Depends(get_current_user),
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get specific tenant details.
@@ -82,7 +89,7 @@ async def get_tenant(
     )
     
     tenant_service = TenantService(db)
-    tenant = tenant_service.get_tenant(tenant_id)
+    tenant = await tenant_service.get_tenant(tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -96,7 +103,7 @@ async def update_tenant(
     tenant_id: int,
     tenant_data: TenantUpdate,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update tenant details.
@@ -106,7 +113,7 @@ async def update_tenant(
     audit_service = AuditService(db)
     
     # Get existing tenant
-    tenant = tenant_service.get_tenant(tenant_id)
+    tenant = await tenant_service.get_tenant(tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -114,7 +121,7 @@ async def update_tenant(
         )
     
     # Update tenant
-    updated_tenant = tenant_service.update_tenant(tenant_id, tenant_data)
+    updated_tenant = await tenant_service.update_tenant(tenant_id, tenant_data)
     
     # Log audit
     await audit_service.log_action(
@@ -133,7 +140,7 @@ async def update_tenant(
 async def delete_tenant(
     tenant_id: int,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete tenant (soft delete).
@@ -143,7 +150,7 @@ async def delete_tenant(
     audit_service = AuditService(db)
     
     # Get existing tenant
-    tenant = tenant_service.get_tenant(tenant_id)
+    tenant = await tenant_service.get_tenant(tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -151,7 +158,7 @@ async def delete_tenant(
         )
     
     # Delete tenant
-    tenant_service.delete_tenant(tenant_id)
+    await tenant_service.delete_tenant(tenant_id)
     
     # Log audit
     await audit_service.log_action(
@@ -168,7 +175,7 @@ async def get_tenant_users(
     tenant_id: int,
     current_user: User = Depends(get_current_user),
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     skip: int = 0,
     limit: int = 100
 ):
@@ -183,4 +190,4 @@ async def get_tenant_users(
     )
     
     tenant_service = TenantService(db)
-    return tenant_service.get_tenant_users(tenant_id, skip=skip, limit=limit)
+    return await tenant_service.get_tenant_users(tenant_id, skip=skip, limit=limit)
@@ -1,7 +1,7 @@
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.db.session import get_db
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.session import get_async_db
 from app.core.security.dependencies import get_current_user, get_current_admin_user, get_tenant_id
 from app.core.security.permissions import get_permission_checker
 from app.services.master.user import UserService
@@ -14,16 +14,21 @@ router = APIRouter()
 
 @router.get("/", response_model=List[UserInDB])
 async def list_users(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
     List users in tenant.
     Requires LIST_USERS permission.
+
+    Pass the X-Next-Cursor header of a page as ``cursor`` to get the next
+    page; ``skip`` is kept for offset paging.
     """
     await permission_checker.require_permission(
         "LIST_USERS",
@@ -32,7 +37,9 @@ async def list_users(
     )
     
     user_service = UserService(db)
-    return user_service.get_users(skip=skip, limit=limit)
+    users = await user_service.get_users(skip=skip, limit=limit, cursor=cursor)
+    UserService.keyset.set_next_cursor(response, users, limit)
+    return users
 
 
 @router.get("/{user_id}", response_model=UserInDB)
@@ -40,7 +47,7 @@ async def get_user(
     user_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -54,7 +61,7 @@ async def get_user(
     )
 
     user_service = UserService(db)
-    user = user_service.get_user(user_id)
+    user = await user_service.get_user(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,7 +76,7 @@ async def update_user(
     user_data: UserUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -86,7 +93,7 @@ async def update_user(
     audit_service = AuditService(db)
 
     # Get current user data for audit
-    current_data = user_service.get_user(user_id)
+    current_data = await user_service.get_user(user_id)
     if not current_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -94,7 +101,7 @@ async def update_user(
         )
 
     # Update user
-    updated_user = user_service.update_user(user_id, user_data)
+    updated_user = await user_service.update_user(user_id, user_data)
 
     # Log audit
     await audit_service.log_change(
@@ -115,7 +122,7 @@ async def delete_user(
     user_id: int,
     current_user: Annotated[User, Depends(get_current_admin_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -132,7 +139,7 @@ async def delete_user(
     audit_service = AuditService(db)
 
     # Get current user data for audit
-    current_data = user_service.get_user(user_id)
+    current_data = await user_service.get_user(user_id)
     if not current_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -140,7 +147,7 @@ async def delete_user(
         )
 
     # Delete user
-    user_service.delete_user(user_id)
+    await user_service.delete_user(user_id)
 
     # Log audit
     await audit_service.log_change(
@@ -160,7 +167,7 @@ async def assign_role(
     role_id: int,
     current_user: Annotated[User, Depends(get_current_admin_user)],
     permission_checker = Depends(get_permission_checker),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: int = Depends(get_tenant_id)
 ):
     """
@@ -177,7 +184,7 @@ async def assign_role(
     audit_service = AuditService(db)
 
     # Assign role
-    user_service.assign_role(user_id, role_id)
+    await user_service.assign_role(user_id, role_id)
 
     # Log audit
     await audit_service.log_change(
@@ -5,12 +5,13 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-from app.core.db.session import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.session import get_async_db
 from app.core.auth.jwt import ALGORITHM
 from app.core.config.settings import get_settings
 from app.schemas.master.token import TokenData
-from app.services.master import user_service
+from app.core.security.principal_cache import principal_cache
 from app.models.master.user import User
 
 settings = get_settings()
@@ -35,9 +36,9 @@ def get_tenant_id(x_tenant_id: Optional[str] = Header(None)) -> UUID:
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get current user from token."""
+    """Get current user from token, served from the principal cache when possible."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -55,7 +56,13 @@ async def get_current_user(
         token_data = TokenData(username=username)
     except JWTError:
         raise credentials_exception
-    user = user_service.get_user_by_username(username)
+
+    async def load_user():
+        result = await db.execute(select(User).where(User.Username == username))
+        return result.scalars().first()
+
+    # Login puts the username in ``sub``
+    user = await principal_cache.get(db, f"username:{username}", load_user)
     if user is None:
         raise credentials_exception
     return user
@@ -65,7 +72,7 @@ async def get_current_active_user(
     current_user = Depends(get_current_user)
 ):
     """Get current active user."""
-    if not current_user.is_active:
+    if not current_user.IsActive:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
@@ -76,7 +83,7 @@ async def get_current_active_superuser(
     """
     Get the current authenticated user and verify if they are a superuser.
     """
-    if not current_user.is_superuser:
+    if not current_user.IsSuperuser:
         raise HTTPException(
             status_code=403, detail="The user doesn't have enough privileges"
         )
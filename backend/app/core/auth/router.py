@@ -3,15 +3,18 @@ from datetime import timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.core.db.session import get_db
+from app.core.db.session import get_async_db
 from app.core.auth.jwt import create_access_token, create_refresh_token
 from app.core.auth.dependencies import get_current_user, get_tenant_id
 from app.core.auth.schemas import Token, RefreshToken as RefreshTokenSchema
 from app.core.auth.schemas import TwoFactorSetup, TwoFactorEnable, TwoFactorVerify
 from app.core.auth.totp import generate_totp_secret, get_totp_uri, verify_totp
 from app.core.auth.security import verify_password
+from app.core.concurrency.executor import run_crypto
 from app.core.config.settings import get_settings
 from app.models.master.user import User
 from app.models.master.auth import RefreshToken
@@ -22,19 +25,26 @@ settings = get_settings()
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: Optional[int] = Depends(get_tenant_id)
 ) -> Token:
     """
     OAuth2 compatible token login, get an access token for future requests.
     """
     # Authenticate user
-    user = db.query(User).filter(
-        User.Username == form_data.username,
-        User.TenantID == tenant_id
-    ).first()
+    result = await db.execute(
+        select(User)
+        .options(selectinload(User.two_factor_auth))
+        .where(
+            User.Username == form_data.username,
+            User.TenantID == tenant_id
+        )
+    )
+    user = result.scalars().first()
     
-    if not user or not verify_password(form_data.password, user.HashedPassword):
+    if not user or not await run_crypto(
+        verify_password, form_data.password, user.HashedPassword
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -81,7 +91,7 @@ async def login(
         expires_at=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     db.add(db_refresh_token)
-    db.commit()
+    await db.commit()
 
     return Token(
         access_token=access_token,
@@ -93,16 +103,19 @@ async def login(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     refresh_token: RefreshTokenSchema,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Token:
     """
     Get a new access token using a refresh token.
     """
     # Verify refresh token exists and is valid
-    db_refresh_token = db.query(RefreshToken).filter(
-        RefreshToken.token == refresh_token.refresh_token,
-        RefreshToken.is_valid == True
-    ).first()
+    result = await db.execute(
+        select(RefreshToken).where(
+            RefreshToken.token == refresh_token.refresh_token,
+            RefreshToken.is_valid == True
+        )
+    )
+    db_refresh_token = result.scalars().first()
 
     if not db_refresh_token:
         raise HTTPException(
@@ -111,7 +124,8 @@ async def refresh_token(
         )
 
     # Get user
-    user = db.query(User).filter(User.id == db_refresh_token.user_id).first()
+    result = await db.execute(select(User).where(User.id == db_refresh_token.user_id))
+    user = result.scalars().first()
     if not user or not user.IsActive:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -148,7 +162,7 @@ async def refresh_token(
         expires_at=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     db.add(new_db_refresh_token)
-    db.commit()
+    await db.commit()
 
     return Token(
         access_token=access_token,
@@ -160,7 +174,7 @@ async def refresh_token(
 @router.post("/2fa/setup", response_model=TwoFactorSetup)
 async def setup_2fa(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> TwoFactorSetup:
     """
     Setup two-factor authentication for the current user.
@@ -177,7 +191,7 @@ async def setup_2fa(
     # Store secret temporarily (it will be saved permanently when 2FA is enabled)
     current_user.two_factor_secret = secret
     db.add(current_user)
-    db.commit()
+    await db.commit()
 
     # Generate QR code
     qr_code = get_totp_uri(
@@ -193,7 +207,7 @@ async def setup_2fa(
 async def enable_2fa(
     data: TwoFactorEnable,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Enable two-factor authentication for the current user.
@@ -220,7 +234,7 @@ async def enable_2fa(
     # Enable 2FA
     current_user.two_factor_auth.is_enabled = True
     db.add(current_user)
-    db.commit()
+    await db.commit()
 
     return {"message": "Two-factor authentication enabled successfully"}
 
@@ -229,19 +243,26 @@ async def enable_2fa(
 async def verify_2fa(
     data: TwoFactorVerify,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     tenant_id: Optional[int] = Depends(get_tenant_id)
 ) -> Token:
     """
     Verify two-factor authentication code and get access token.
     """
     # Authenticate user
-    user = db.query(User).filter(
-        User.Username == form_data.username,
-        User.TenantID == tenant_id
-    ).first()
+    result = await db.execute(
+        select(User)
+        .options(selectinload(User.two_factor_auth))
+        .where(
+            User.Username == form_data.username,
+            User.TenantID == tenant_id
+        )
+    )
+    user = result.scalars().first()
     
-    if not user or not verify_password(form_data.password, user.HashedPassword):
+    if not user or not await run_crypto(
+        verify_password, form_data.password, user.HashedPassword
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password"
@@ -292,7 +313,7 @@ async def verify_2fa(
         expires_at=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     db.add(db_refresh_token)
-    db.commit()
+    await db.commit()
 
     return Token(
         access_token=access_token,
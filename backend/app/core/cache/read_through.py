@@ -0,0 +1,281 @@
+"""
+Read-Through Service Cache
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+from uuid import UUID
+import inspect
+import json
+import logging
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
+from app.core.cache.redis import RedisCache
+from app.core.concurrency.single_flight import SingleFlight
+from app.core.config.settings import get_settings
+from app.core.monitoring.metrics import SERVICE_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+Row = Dict[str, Any]
+
+
+class JsonSerializer:
+    """Standard library JSON; UUIDs, dates and decimals become strings."""
+
+    @staticmethod
+    def dumps(row: Row) -> str:
+        return json.dumps(row, default=_to_str, separators=(",", ":"))
+
+    @staticmethod
+    def loads(payload: str) -> Row:
+        return json.loads(payload)
+
+
+class OrjsonSerializer:
+    """orjson: same format as ``JsonSerializer``, several times faster."""
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, row: Row) -> str:
+        return self._orjson.dumps(row, default=_to_str).decode()
+
+    def loads(self, payload: str) -> Row:
+        return self._orjson.loads(payload)
+
+
+SERIALIZERS = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+}
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def _python_types(model: Type) -> Dict[str, type]:
+    """Python type of each mapped column, for restoring decoded values."""
+    types = {}
+    for attr in sa_inspect(model).column_attrs:
+        try:
+            types[attr.key] = attr.columns[0].type.python_type
+        except NotImplementedError:
+            types[attr.key] = object
+    return types
+
+
+def to_row(model: Type, instance: Any, exclude: Iterable[str] = ()) -> Optional[Row]:
+    """
+    Column values of a loaded instance, or None if any is not loaded.
+
+    Columns in ``exclude`` (e.g. password hashes) are left out, so they
+    never reach the cache.
+    """
+    loaded = sa_inspect(instance).dict
+    row = {}
+    for attr in sa_inspect(model).column_attrs:
+        if attr.key in exclude:
+            continue
+        if attr.key not in loaded:
+            return None
+        row[attr.key] = loaded[attr.key]
+    return row
+
+
+def _restore(value: Any, python_type: type) -> Any:
+    if value is None or isinstance(value, python_type):
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type in (UUID, Decimal):
+        return python_type(str(value))
+    return value
+
+
+async def from_row(db, model: Type, row: Row, exclude: Iterable[str] = ()) -> Any:
+    """
+    Attach a cached row to a session without SQL.
+
+    Excluded columns are not loaded on the returned instance; callers that
+    need them must query the database.
+
+    Args:
+        db: Session to merge into (``AsyncSession``)
+        model: ORM class of the row
+        row: Column values, as returned by ``to_row`` or decoded JSON
+        exclude: Columns to drop, even if an older entry holds them
+
+    Returns:
+        Any: Persistent ``model`` instance in ``db``
+    """
+    # Resolved on first use; mappers may not be configured at import time
+    python_types = _python_types(model)
+    instance = model(**{
+        name: _restore(value, python_types.get(name, object))
+        for name, value in row.items()
+        if name not in exclude
+    })
+    make_transient_to_detached(instance)
+    return await db.merge(instance, load=False)
+
+
+class ReadThroughCache:
+    """
+    Redis read-through cache for service lookups returning one ORM row.
+
+    Usage::
+
+        @service_cache.cached("tenant", "id:{tenant_id}", Tenant, tags=("tenant:{TenantID}",))
+        async def get_tenant(self, tenant_id): ...
+
+        await service_cache.invalidate("tenant:42")
+
+    Features:
+    1. Key templates formatted with the call's arguments, prefixed with
+       ``cache:{namespace}:``
+    2. TTL per namespace (``CACHE_TTLS``, else ``CACHE_DEFAULT_TTL``)
+    3. Rows are stored as their column values; a hit is merged into the
+       caller's session with ``load=False``, so it is a normal persistent
+       instance and no SQL is issued
+    4. Tag templates are formatted with the row's columns, so every key
+       of one row (by id, by name...) is invalidated by one tag
+    5. Concurrent misses for the same key in this process share one load
+    6. Redis errors fall back to the database; ``None`` is never cached
+
+    Decorated methods must belong to a service with an ``AsyncSession``
+    in ``self.db``.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[RedisCache] = None,
+        ttls: Optional[Dict[str, int]] = None,
+        default_ttl: int = 60,
+        serializer: str = "json"
+    ):
+        self.redis = redis or RedisCache()
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        try:
+            self.serializer = SERIALIZERS[serializer]()
+        except KeyError:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        self._flight = SingleFlight("service_cache")
+
+    def ttl_for(self, namespace: str) -> int:
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def cached(
+        self,
+        namespace: str,
+        key: str,
+        model: Type,
+        tags: Iterable[str] = (),
+        exclude: Iterable[str] = ()
+    ) -> Callable:
+        """
+        Cache a service method returning one ``model`` row or None.
+
+        Args:
+            namespace: Cache namespace, also selects the TTL
+            key: Key template, formatted with the method's arguments
+            model: ORM class of the returned row
+            tags: Tag templates, formatted with the row's column values
+            exclude: Columns never written to the cache; not loaded on
+                instances served from it
+        """
+        tags = tuple(tags)
+        exclude = frozenset(exclude)
+
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+
+            @wraps(func)
+            async def wrapper(service, *args, **kwargs):
+                bound = signature.bind(service, *args, **kwargs)
+                bound.apply_defaults()
+                cache_key = f"cache:{namespace}:{key.format(**bound.arguments)}"
+
+                row = await self._get(namespace, cache_key)
+                if row is None:
+                    async def load():
+                        result = await func(service, *args, **kwargs)
+                        return result, to_row(model, result, exclude) if result is not None else None
+
+                    (result, row), shared = await self._flight.do(cache_key, load)
+                    if not shared:
+                        if row is not None:
+                            await self._store(namespace, cache_key, tags, row)
+                        return result
+                    # Loaded by a concurrent call in another session
+                    if result is None:
+                        return None
+                    if row is None:
+                        # Some columns were not loaded; nothing to share
+                        return await func(service, *args, **kwargs)
+                return await from_row(service.db, model, row, exclude)
+
+            return wrapper
+
+        return decorator
+
+    async def _store(
+        self,
+        namespace: str,
+        cache_key: str,
+        tags: Tuple[str, ...],
+        row: Row
+    ) -> None:
+        try:
+            await self.redis.set(
+                cache_key,
+                self.serializer.dumps(row),
+                expire=self.ttl_for(namespace),
+                tags=[tag.format(**row) for tag in tags]
+            )
+        except Exception as e:
+            logger.error(f"Error caching {cache_key}: {str(e)}")
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every cached row registered under any of the tags."""
+        try:
+            await self.redis.invalidate_tags(*tags)
+        except Exception as e:
+            logger.error(f"Error invalidating cache tags {tags}: {str(e)}")
+
+    async def _get(self, namespace: str, cache_key: str) -> Optional[Row]:
+        payload = await self.redis.get(cache_key)
+        if payload is None:
+            SERVICE_CACHE_REQUESTS.labels(namespace=namespace, result="miss").inc()
+            return None
+        try:
+            row = self.serializer.loads(payload)
+        except Exception as e:
+            logger.error(f"Error decoding cached {cache_key}: {str(e)}")
+            SERVICE_CACHE_REQUESTS.labels(namespace=namespace, result="error").inc()
+            return None
+        SERVICE_CACHE_REQUESTS.labels(namespace=namespace, result="hit").inc()
+        return row
+
+
+settings = get_settings()
+
+# Shared cache for the master services
+service_cache = ReadThroughCache(
+    ttls=settings.CACHE_TTLS,
+    default_ttl=settings.CACHE_DEFAULT_TTL,
+    serializer=settings.CACHE_SERIALIZER
+)
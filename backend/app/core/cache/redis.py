@@ -1,20 +1,64 @@
 """Redis cache implementation."""
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
+from uuid import uuid4
 import redis.asyncio as redis
 from fastapi import Depends
 from app.core.config.settings import Settings, get_settings
+from app.core.monitoring.metrics import REDIS_POOL_CONNECTIONS, REDIS_POOL_MAX_CONNECTIONS
 import json
 import logging
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Keys are visited and unlinked in batches of this size
+SCAN_BATCH_SIZE = 500
+
+# Set a value and register it in its tag sets in one round trip. A tag
+# set lives as long as its longest-lived entry.
+# KEYS[1] entry, KEYS[2..] tag sets; ARGV: value, TTL in seconds (0 = none)
+SET_WITH_TAGS_SCRIPT = """
+local expire = tonumber(ARGV[2])
+if expire > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', expire)
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+for i = 2, #KEYS do
+    local existed = redis.call('EXISTS', KEYS[i])
+    local ttl = redis.call('TTL', KEYS[i])
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if expire == 0 then
+        redis.call('PERSIST', KEYS[i])
+    elseif existed == 0 or (ttl >= 0 and ttl < expire) then
+        redis.call('EXPIRE', KEYS[i], expire)
+    end
+end
+return 1
+"""
+
 class RedisCache:
-    """Redis cache implementation."""
+    """
+    Redis cache implementation.
+
+    Groups of entries are invalidated through tags: ``set(..., tags=...)``
+    adds the key to one set per tag and ``invalidate_tags`` unlinks the
+    members of those sets, so invalidating e.g. one tenant's entries
+    never walks the keyspace. ``keys`` and ``clear_pattern`` use
+    incremental SCAN instead of KEYS and are meant for maintenance only.
+    """
 
-    def __init__(self, client: redis.Redis):
-        """Initialize Redis cache."""
-        self._client = client
+    def __init__(self, client: Optional[redis.Redis] = None):
+        """Initialize Redis cache; without a client, use the shared pool."""
+        self._own_client = client
+        self._set_with_tags = None
+
+    @property
+    def _client(self) -> redis.Redis:
+        # Resolved on each use so the cache follows the pool across restarts
+        if self._own_client is not None:
+            return self._own_client
+        return get_redis_client()
 
     async def ping(self) -> bool:
         try:
@@ -36,15 +80,74 @@ class RedisCache:
         self,
         key: str,
         value: Union[str, bytes, int, float],
-        expire: Optional[int] = None
+        expire: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None
     ) -> bool:
-        """Set value in cache."""
+        """
+        Set value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            expire: TTL in seconds
+            tags: Tags to register the key under for ``invalidate_tags``
+        """
         try:
-            return await self._client.set(key, value, ex=expire)
+            tag_keys = [self.tag_key(tag) for tag in tags or ()]
+            if not tag_keys:
+                return await self._client.set(key, value, ex=expire)
+            if self._set_with_tags is None:
+                self._set_with_tags = self.register_script(SET_WITH_TAGS_SCRIPT)
+            return bool(await self._set_with_tags(
+                keys=[key, *tag_keys],
+                args=[value, expire or 0]
+            ))
         except Exception as e:
             logger.error(f"Error setting key {key} in Redis: {str(e)}")
             return False
 
+    @staticmethod
+    def tag_key(tag: str) -> str:
+        """Redis key of the set holding the keys registered under a tag."""
+        return f"tag:{tag}"
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every entry registered under any of the tags.
+
+        The tag set is renamed first, so entries tagged while this runs
+        land in a fresh set and are not lost. Members are then read with
+        SSCAN and removed with UNLINK in batches, so a large group never
+        blocks Redis.
+
+        Returns:
+            int: Number of keys removed
+        """
+        removed = 0
+        for tag in tags:
+            pending = f"{self.tag_key(tag)}:invalidating:{uuid4()}"
+            try:
+                await self._client.rename(self.tag_key(tag), pending)
+            except redis.ResponseError:
+                # No entry carries this tag
+                continue
+            except Exception as e:
+                logger.error(f"Error invalidating tag {tag} in Redis: {str(e)}")
+                continue
+            try:
+                batch: List[str] = []
+                async for key in self._client.sscan_iter(pending, count=SCAN_BATCH_SIZE):
+                    batch.append(key)
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        removed += await self._client.unlink(*batch)
+                        batch = []
+                if batch:
+                    removed += await self._client.unlink(*batch)
+                await self._client.unlink(pending)
+            except Exception as e:
+                logger.error(f"Error invalidating tag {tag} in Redis: {str(e)}")
+        return removed
+
     async def delete(self, key: str) -> int:
         """Delete value from cache."""
         try:
@@ -94,9 +197,9 @@ class RedisCache:
             return -2
 
     async def keys(self, pattern: str) -> list:
-        """Get keys matching pattern."""
+        """Get keys matching pattern (incremental SCAN, not KEYS)."""
         try:
-            return await self._client.keys(pattern)
+            return [key async for key in self._client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE)]
         except Exception as e:
             logger.error(f"Error getting keys matching pattern {pattern} from Redis: {str(e)}")
             return []
@@ -117,10 +220,21 @@ class RedisCache:
             return 0
 
     async def clear_pattern(self, pattern: str) -> bool:
+        """
+        Delete keys matching pattern with SCAN and batched UNLINK.
+
+        Prefer tags for anything on a request path; this still visits the
+        whole keyspace, just without blocking Redis while doing so.
+        """
         try:
-            keys = await self._client.keys(pattern)
-            if keys:
-                return await self._client.delete(*keys) > 0
+            batch: List[str] = []
+            async for key in self._client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    await self._client.unlink(*batch)
+                    batch = []
+            if batch:
+                await self._client.unlink(*batch)
             return True
         except Exception as e:
             logger.error(f"Error clearing pattern {pattern} from Redis: {str(e)}")
@@ -148,26 +262,93 @@ class RedisCache:
             logger.error(f"Error removing members from sorted set {key} by score in Redis: {str(e)}")
             return 0
 
+    def register_script(self, script: str):
+        """
+        Register a Lua script.
+
+        The returned callable runs the script with EVALSHA, caching its SHA
+        and loading it again if the server answers NOSCRIPT. Errors are
+        raised to the caller.
+        """
+        registered = self._client.register_script(script)
+
+        async def run(keys=None, args=None):
+            return await registered(keys=keys, args=args, client=self._client)
+
+        return run
+
     async def close(self):
         """Close Redis connection."""
         await self._client.close()
 
+# Process-wide pool and client, see init_redis/close_redis
+_pool: Optional[redis.BlockingConnectionPool] = None
+_client: Optional[redis.Redis] = None
+
+
 def get_redis_client() -> redis.Redis:
-    """Get Redis client."""
-    settings = get_settings()
-    try:
-        client = redis.from_url(
-            settings.REDIS_URL or f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}",
-            decode_responses=True,
-            retry_on_timeout=True,
-            socket_keepalive=True
-        )
-        return client
-    except Exception as e:
-        logger.error(f"Error connecting to Redis: {str(e)}")
-        raise
+    """
+    Get the shared Redis client.
+
+    Every caller shares one connection pool per process. It is created by
+    ``init_redis`` at startup, or on first use outside the application
+    lifespan (scripts, tests). When all ``REDIS_MAX_CONNECTIONS`` are in
+    use, commands wait up to ``REDIS_POOL_TIMEOUT`` seconds for one.
+    """
+    global _pool, _client
+    if _client is None:
+        settings = get_settings()
+        try:
+            _pool = redis.BlockingConnectionPool.from_url(
+                settings.REDIS_URL or f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}",
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                decode_responses=True,
+                retry_on_timeout=True,
+                socket_keepalive=True
+            )
+            _client = redis.Redis(connection_pool=_pool)
+        except Exception as e:
+            logger.error(f"Error connecting to Redis: {str(e)}")
+            raise
+    return _client
 
 def get_redis_cache() -> RedisCache:
-    """Get Redis cache."""
-    client = get_redis_client()
-    return RedisCache(client)
+    """Get Redis cache on the shared pool."""
+    return RedisCache()
+
+def init_redis() -> redis.Redis:
+    """Create the shared pool at application startup."""
+    return get_redis_client()
+
+async def close_redis() -> None:
+    """Close every pooled connection at application shutdown."""
+    global _pool, _client
+    pool = _pool
+    _pool = None
+    _client = None
+    if pool is not None:
+        await pool.disconnect()
+
+def _pool_connections(state: str) -> int:
+    # redis-py has no public accessor for pool usage
+    if _pool is None:
+        return 0
+    if state == "in_use":
+        return len(_pool._in_use_connections)
+    return len(_pool._available_connections)
+
+def redis_pool_stats() -> Dict[str, int]:
+    """Connections of the shared pool, without touching Redis."""
+    return {
+        "in_use": _pool_connections("in_use"),
+        "idle": _pool_connections("idle"),
+        "max": _pool.max_connections if _pool is not None else 0,
+    }
+
+REDIS_POOL_CONNECTIONS.labels(state="in_use").set_function(lambda: _pool_connections("in_use"))
+REDIS_POOL_CONNECTIONS.labels(state="idle").set_function(lambda: _pool_connections("idle"))
+REDIS_POOL_MAX_CONNECTIONS.set_function(lambda: _pool.max_connections if _pool is not None else 0)
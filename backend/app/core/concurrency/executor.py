@@ -0,0 +1,125 @@
+"""
+Blocking Executors
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+import asyncio
+import contextvars
+import threading
+import time
+
+from app.core.config.settings import get_settings
+from app.core.monitoring.metrics import (
+    EXECUTOR_ACTIVE,
+    EXECUTOR_QUEUE_DEPTH,
+    EXECUTOR_WAIT_TIME,
+)
+
+T = TypeVar("T")
+
+
+class BlockingExecutor:
+    """
+    Sized thread pool for blocking calls made from async handlers.
+
+    Features:
+    1. Fixed number of worker threads, so a burst of blocking calls queues
+       instead of spawning threads or stalling the event loop
+    2. Context variables (tenant context) are propagated to the worker
+    3. Queue depth, active workers and queue wait time metrics per pool
+
+    Separate pools keep one kind of work (e.g. bcrypt during a login burst)
+    from starving another (e.g. permission lookups).
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queue_depth = EXECUTOR_QUEUE_DEPTH.labels(pool=name)
+        self._active = EXECUTOR_ACTIVE.labels(pool=name)
+        self._wait_time = EXECUTOR_WAIT_TIME.labels(pool=name)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=f"{self.name}-worker"
+                    )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable on the pool and await its result.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        submitted = time.perf_counter()
+        # Claimed exactly once, by the worker or by a cancellation
+        queued = [True]
+
+        def dequeue() -> bool:
+            try:
+                queued.pop()
+            except IndexError:
+                return False
+            self._queue_depth.dec()
+            return True
+
+        def call() -> T:
+            dequeue()
+            self._wait_time.observe(time.perf_counter() - submitted)
+            self._active.inc()
+            try:
+                return context.run(func, *args, **kwargs)
+            finally:
+                self._active.dec()
+
+        self._queue_depth.inc()
+        try:
+            return await loop.run_in_executor(self._get_executor(), call)
+        except BaseException:
+            # Cancelled or rejected before a worker picked the call up
+            dequeue()
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads; the pool is recreated on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+settings = get_settings()
+
+# Sync ORM work that has not moved to AsyncSession yet
+db_executor = BlockingExecutor("db", settings.BLOCKING_DB_WORKERS)
+
+# bcrypt hashing and verification
+crypto_executor = BlockingExecutor("crypto", settings.BLOCKING_CRYPTO_WORKERS)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database call on the shared db executor."""
+    return await db_executor.run(func, *args, **kwargs)
+
+
+async def run_crypto(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a password hashing call on the shared crypto executor."""
+    return await crypto_executor.run(func, *args, **kwargs)
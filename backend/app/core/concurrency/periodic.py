@@ -0,0 +1,112 @@
+"""
+Periodic Background Tasks
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from typing import Awaitable, Callable, Optional
+import asyncio
+import logging
+import random
+import time
+
+from app.core.monitoring.metrics import BACKGROUND_TASK_DURATION, BACKGROUND_TASK_RUNS
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    Run a coroutine function in the background at a jittered interval.
+
+    Features:
+    1. Each wait is ``interval`` ± ``jitter`` (a fraction of the interval),
+       and the first run is delayed by up to one jitter, so workers started
+       together do not hit the database in lockstep
+    2. Runs never overlap: the loop waits for a run to finish before
+       sleeping, and ``run_once`` skips if a run is already in progress
+    3. Each run is bounded by ``timeout``; failures are logged and the
+       schedule continues
+    4. Runs are counted in ``background_task_runs_total`` by result
+       (``ok``, ``error``, ``timeout``, ``skipped``) and timed in
+       ``background_task_duration_seconds``
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[None]],
+        interval: float,
+        jitter: float = 0.1,
+        timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self.last_success: Optional[float] = None
+        self._in_progress = False
+        self._task: Optional[asyncio.Task] = None
+        self._duration = BACKGROUND_TASK_DURATION.labels(name=name)
+
+    def _delay(self) -> float:
+        """Next wait: the interval with random jitter."""
+        spread = self.interval * self.jitter
+        return max(0.0, self.interval + random.uniform(-spread, spread))
+
+    async def run_once(self) -> bool:
+        """
+        Run the function now unless a run is already in progress.
+
+        Returns:
+            bool: True if the run completed successfully
+        """
+        if self._in_progress:
+            BACKGROUND_TASK_RUNS.labels(name=self.name, result="skipped").inc()
+            return False
+        # A flag rather than asyncio.Lock, which binds to the loop current
+        # at creation on Python < 3.10; instances are module singletons
+        self._in_progress = True
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.func(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Background task {self.name} timed out after {self.timeout}s")
+            BACKGROUND_TASK_RUNS.labels(name=self.name, result="timeout").inc()
+            return False
+        except Exception as e:
+            logger.error(f"Background task {self.name} failed: {str(e)}")
+            BACKGROUND_TASK_RUNS.labels(name=self.name, result="error").inc()
+            return False
+        finally:
+            self._in_progress = False
+            self._duration.observe(time.perf_counter() - start)
+        self.last_success = time.monotonic()
+        BACKGROUND_TASK_RUNS.labels(name=self.name, result="ok").inc()
+        return True
+
+    async def _run_forever(self) -> None:
+        await asyncio.sleep(random.uniform(0, self.interval * self.jitter))
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self._delay())
+
+    def start(self) -> None:
+        """Start the schedule on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Stop the schedule, cancelling a run in progress."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
@@ -0,0 +1,118 @@
+"""
+Single-Flight Request Coalescing
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+import asyncio
+import inspect
+
+from app.core.monitoring.metrics import SINGLE_FLIGHT_CALLS
+
+T = TypeVar("T")
+
+# Flight result when the shared call failed or was cancelled
+_FAILED = object()
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into one.
+
+    The first caller for a key runs its call; callers arriving while it
+    is in flight wait for it and get the same result. If the shared call
+    raises or is cancelled, each waiter runs its own call instead of
+    inheriting an error that may belong to the first caller's request
+    (e.g. its database session).
+
+    Calls are counted in ``single_flight_calls_total`` by role: ``leader``
+    (ran the call), ``coalesced`` (reused a result) and ``retried`` (ran
+    its own call after the shared one failed).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self._leader = SINGLE_FLIGHT_CALLS.labels(name=name, role="leader")
+        self._coalesced = SINGLE_FLIGHT_CALLS.labels(name=name, role="coalesced")
+        self._retried = SINGLE_FLIGHT_CALLS.labels(name=name, role="retried")
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identity of the call
+            func: This caller's call, run if it leads or the leader fails
+
+        Returns:
+            Tuple[T, bool]: (result, shared); shared is True when the
+            result came from another caller's call
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            result = await asyncio.shield(flight)
+            if result is not _FAILED:
+                self._coalesced.inc()
+                return result, True
+            self._retried.inc()
+            return await func(), False
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self._leader.inc()
+        try:
+            result = await func()
+        except BaseException:
+            flight.set_result(_FAILED)
+            raise
+        finally:
+            self._flights.pop(key, None)
+        flight.set_result(result)
+        return result, False
+
+
+def coalesce(name: str) -> Callable:
+    """
+    Coalesce concurrent identical calls of a service method.
+
+    The key is the method name and its arguments, which must be hashable.
+    ORM instances loaded by another caller's session are merged into this
+    caller's ``self.db`` with ``load=False`` (no SQL), so each caller
+    works with its own session's objects.
+
+    Args:
+        name: Metrics label for this flight group
+    """
+    flight = SingleFlight(name)
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(service, *args, **kwargs):
+            bound = signature.bind(service, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop(next(iter(signature.parameters)))
+            key = (func.__qualname__, tuple(sorted(arguments.items())))
+
+            result, shared = await flight.do(key, lambda: func(service, *args, **kwargs))
+            if not shared:
+                return result
+            return await _merge(service.db, result)
+
+        return wrapper
+
+    return decorator
+
+
+async def _merge(db, result: Any) -> Any:
+    """Attach ORM results loaded by another session to ``db``."""
+    if result is None:
+        return None
+    if isinstance(result, (list, tuple)):
+        return [await db.merge(instance, load=False) for instance in result]
+    return await db.merge(result, load=False)
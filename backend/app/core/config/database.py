@@ -18,7 +18,7 @@ class DatabaseSettings(BaseSettings):
     1. Environment variable support
     2. Type validation
     3. Default values
-    4. Connection string generation
+    4. Connection string generation (pyodbc and aioodbc)
     5. Tenant database support
     """
 
@@ -37,10 +37,15 @@ class DatabaseSettings(BaseSettings):
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
 
-    def _build_connection_string(self, database: str) -> str:
+    # Tenant Engine Registry
+    TENANT_ENGINE_CACHE_SIZE: int = 100
+    TENANT_ENGINE_IDLE_TIMEOUT: int = 900  # seconds
+    TENANT_ENGINE_REAP_INTERVAL: int = 60  # seconds
+
+    def _build_connection_string(self, database: str, driver: str = "pyodbc") -> str:
         """Build SQL Server connection string with proper configuration."""
         return (
-            f"mssql+pyodbc:///?odbc_connect="
+            f"mssql+{driver}:///?odbc_connect="
             f"Driver={{ODBC Driver 18 for SQL Server}};"
             f"Server=tcp:{self.SQL_SERVER},{self.SQL_PORT};"
             f"Database={database};"
@@ -65,6 +70,15 @@ class DatabaseSettings(BaseSettings):
         """Generate tenant-specific database connection string."""
         return self._build_connection_string(tenant_db_name)
 
+    @property
+    def MASTER_ASYNC_DATABASE_URL(self) -> str:
+        """Generate master database connection string for the asyncio driver."""
+        return self._build_connection_string(self.SQL_PROD_DB, driver="aioodbc")
+
+    def get_tenant_async_database_url(self, tenant_db_name: str) -> str:
+        """Generate tenant-specific connection string for the asyncio driver."""
+        return self._build_connection_string(tenant_db_name, driver="aioodbc")
+
     model_config = ConfigDict(env_file=".env.test", extra="allow")
 
 
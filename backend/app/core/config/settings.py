@@ -4,7 +4,7 @@ Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
 All rights reserved.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import RedisDsn, validator
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
@@ -41,11 +41,28 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "your-secret-key"  # Change in production
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+
+    # Sessions
+    SESSION_TIMEOUT_MINUTES: int = 30
+    SESSION_EXCLUDE_PATHS: List[str] = ["/health", "/api/v1/auth/login"]
+    SESSION_ACTIVITY_INTERVAL: int = 60
+    SESSION_LOCAL_CACHE_TTL: float = 2.0
+    SESSION_LOCAL_CACHE_SIZE: int = 10000
     
     # Rate Limiting
     RATE_LIMIT_REQUESTS_PER_MINUTE: int = 60
-    RATE_LIMIT_BURST_SIZE: int = 10
+    RATE_LIMIT_BURST_SIZE: int = 40
     RATE_LIMIT_WINDOW_SIZE: int = 60
+    # Tokens each worker leases from Redis at a time; at most a quarter
+    # of RATE_LIMIT_BURST_SIZE, larger values are clamped
+    RATE_LIMIT_LEASE_SIZE: int = 10
+    RATE_LIMIT_LEASE_TTL: float = 1.0
+    RATE_LIMIT_LOCAL_KEYS: int = 10000
+    RATE_LIMIT_EXCLUDE_PATHS: List[str] = ["/health", "/livez", "/readyz", "/metrics"]
+    RATE_LIMIT_WORKERS: int = 1
+    RATE_LIMIT_REDIS_TIMEOUT: float = 0.1
+    RATE_LIMIT_BREAKER_FAILURES: int = 5
+    RATE_LIMIT_BREAKER_RECOVERY: int = 30
     
     # Database
     SQL_SERVER: str
@@ -84,6 +101,11 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_URI: Optional[RedisDsn] = None
     REDIS_URL: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 2.0
+    REDIS_SOCKET_TIMEOUT: float = 2.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
     
     @validator("REDIS_URI", pre=True)
     def assemble_redis_connection(cls, v: Optional[str], values: Dict[str, Any]) -> Any:
@@ -99,6 +121,51 @@ class Settings(BaseSettings):
             return f"redis://:{password}@{host}:{port}/{db}"
         return f"redis://{host}:{port}/{db}"
     
+    # Blocking executors (threads for sync DB work and password hashing)
+    BLOCKING_DB_WORKERS: int = 16
+    BLOCKING_CRYPTO_WORKERS: int = 4
+
+    # Service read-through cache (TTLs in seconds per namespace)
+    CACHE_DEFAULT_TTL: int = 60
+    CACHE_TTLS: Dict[str, int] = {"tenant": 300, "permission": 600, "user": 60}
+    CACHE_SERIALIZER: str = "orjson"
+
+    # Permission cache
+    PERMISSION_CACHE_SIZE: int = 10000
+    PERMISSION_CACHE_LOCAL_TTL: int = 5
+    PERMISSION_CACHE_TTL: int = 3600
+
+    # Principal cache (user behind a token subject)
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_LOCAL_TTL: int = 5
+    PRINCIPAL_CACHE_TTL: int = 300
+
+    # Business metrics refresh (interval and timeout in seconds, jitter
+    # as a fraction of the interval)
+    BUSINESS_METRICS_INTERVAL: float = 60.0
+    BUSINESS_METRICS_JITTER: float = 0.1
+    BUSINESS_METRICS_TIMEOUT: float = 30.0
+
+    # Health sampler (seconds between rounds, per-service timeout)
+    HEALTH_SAMPLE_INTERVAL: float = 10.0
+    HEALTH_SAMPLE_TIMEOUT: float = 2.0
+
+    # Readiness checks (seconds between rounds, per-check timeout, age
+    # after which a result no longer counts; tenant databases sampled)
+    READINESS_CHECK_INTERVAL: float = 5.0
+    READINESS_CHECK_TIMEOUT: float = 1.0
+    READINESS_TTL: float = 15.0
+    READINESS_TENANT_SAMPLE: int = 3
+
+    # Audit writer
+    AUDIT_QUEUE_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL: float = 1.0
+    AUDIT_ENQUEUE_TIMEOUT: float = 2.0
+    AUDIT_SPOOL_DIR: str = "var/audit-spool"
+    AUDIT_SPOOL_SEGMENT_BYTES: int = 8 * 1024 * 1024
+    AUDIT_SPOOL_REPLAY_INTERVAL: float = 5.0
+
     # Tenant
     TENANT_HEADER_KEY: str = "X-Tenant-ID"
     
@@ -0,0 +1,47 @@
+"""Add audit log event ID
+
+Revision ID: 005_add_audit_event_id
+Revises: 004_add_tenant_audit_constraints
+Create Date: 2025-03-10 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_add_audit_event_id'
+down_revision = '004_add_tenant_audit_constraints'
+branch_labels = None
+depends_on = None
+
+
+def _has_event_id() -> bool:
+    """Whether AuditLogs exists and already has the EventID column."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('AuditLogs', schema='dbo'):
+        # create_tables creates the table, column included
+        return True
+    return any(
+        column['name'] == 'EventID'
+        for column in inspector.get_columns('AuditLogs', schema='dbo')
+    )
+
+
+def upgrade() -> None:
+    # The audit writer inserts a client-generated EventID so that replaying
+    # the spool skips events already written
+    if _has_event_id():
+        return
+    op.add_column(
+        'AuditLogs',
+        sa.Column('EventID', sa.String(length=36), nullable=True),
+        schema='dbo'
+    )
+    op.create_index('ix_dbo_AuditLogs_EventID', 'AuditLogs', ['EventID'], unique=False, schema='dbo')
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('AuditLogs', schema='dbo'):
+        return
+    op.drop_index('ix_dbo_AuditLogs_EventID', table_name='AuditLogs', schema='dbo')
+    op.drop_column('AuditLogs', 'EventID', schema='dbo')
@@ -0,0 +1,347 @@
+"""
+Tenant Engine Registry
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set
+import asyncio
+import logging
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from app.core.config.database import DatabaseSettings, get_database_settings
+from app.core.monitoring.metrics import (
+    TENANT_ENGINE_HITS,
+    TENANT_ENGINE_MISSES,
+    TENANT_ENGINE_EVICTIONS,
+    TENANT_ENGINES_ACTIVE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _EngineEntry:
+    """Engine and session factory cached for one tenant database."""
+
+    __slots__ = ("engine", "session_factory", "last_used")
+
+    def __init__(self, engine: Engine, session_factory: Callable[[], Session]):
+        self.engine = engine
+        self.session_factory = session_factory
+        self.last_used = time.monotonic()
+
+
+class TenantEngineRegistry:
+    """
+    Bounded registry of tenant database engines and session factories.
+
+    Features:
+    1. At most ``max_engines`` live engines (and connection pools)
+    2. One cached sessionmaker per engine, so acquiring a session is cheap
+    3. LRU eviction that disposes the evicted engine's pool
+    4. Idle reaping of engines unused for ``idle_timeout`` seconds
+    5. Hit, miss and eviction counters
+
+    Engines are keyed by tenant database name. Disposing an engine closes
+    its idle connections; connections still checked out are closed when
+    they are returned.
+    """
+
+    def __init__(
+        self,
+        max_engines: int,
+        idle_timeout: float,
+        url_builder: Callable[[str], str],
+        engine_options: Optional[Dict[str, Any]] = None
+    ):
+        self.max_engines = max_engines
+        self.idle_timeout = idle_timeout
+        self._url_builder = url_builder
+        self._engine_options = engine_options or {}
+        self._entries: "OrderedDict[str, _EngineEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._reaper_task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_engine(self, db_name: str) -> Engine:
+        """
+        Get the engine for a tenant database, creating it on a miss.
+
+        Args:
+            db_name: Name of tenant database
+
+        Returns:
+            Engine: Engine bound to the tenant database
+        """
+        return self._get_entry(db_name).engine
+
+    def get_session_factory(self, db_name: str) -> sessionmaker:
+        """
+        Get the cached session factory for a tenant database.
+
+        Args:
+            db_name: Name of tenant database
+
+        Returns:
+            sessionmaker: Session factory bound to the tenant engine
+        """
+        return self._get_entry(db_name).session_factory
+
+    def get_session(self, db_name: str) -> Session:
+        """
+        Open a new session on a tenant database.
+
+        Args:
+            db_name: Name of tenant database
+
+        Returns:
+            Session: Database session for tenant
+        """
+        return self._get_entry(db_name).session_factory()
+
+    def _get_entry(self, db_name: str) -> _EngineEntry:
+        """Look up a registry entry, creating it on a miss."""
+        evicted = []
+        with self._lock:
+            entry = self._entries.get(db_name)
+            if entry is not None:
+                self._entries.move_to_end(db_name)
+                entry.last_used = time.monotonic()
+                self.hits += 1
+                TENANT_ENGINE_HITS.inc()
+                return entry
+
+            self.misses += 1
+            TENANT_ENGINE_MISSES.inc()
+            engine = self._create_engine(db_name)
+            entry = _EngineEntry(engine, self._create_session_factory(engine))
+            self._entries[db_name] = entry
+            while len(self._entries) > self.max_engines:
+                evicted.append(self._entries.popitem(last=False))
+            TENANT_ENGINES_ACTIVE.set(len(self._entries))
+
+        # Dispose outside the lock so slow socket teardown does not block lookups
+        for evicted_name, evicted_entry in evicted:
+            self._dispose_entry(evicted_name, evicted_entry, reason="lru")
+        return entry
+
+    def _create_engine(self, db_name: str) -> Engine:
+        """Create a pooled engine for a tenant database."""
+        return create_engine(self._url_builder(db_name), **self._engine_options)
+
+    def _create_session_factory(self, engine: Engine) -> sessionmaker:
+        """Create the session factory cached next to an engine."""
+        return sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=engine
+        )
+
+    def _dispose_engine(self, engine: Engine) -> None:
+        """Close the connection pool of an engine."""
+        engine.dispose()
+
+    def _dispose_entry(self, db_name: str, entry: _EngineEntry, reason: str) -> None:
+        """Dispose an engine that has been removed from the registry."""
+        self.evictions += 1
+        TENANT_ENGINE_EVICTIONS.labels(reason=reason).inc()
+        try:
+            self._dispose_engine(entry.engine)
+        except Exception as e:
+            logger.error(f"Error disposing engine for {db_name}: {str(e)}")
+
+    def dispose(self, db_name: str) -> bool:
+        """
+        Remove and dispose the engine of a tenant database.
+
+        Returns:
+            bool: True if an engine was registered for the database
+        """
+        with self._lock:
+            entry = self._entries.pop(db_name, None)
+            TENANT_ENGINES_ACTIVE.set(len(self._entries))
+        if entry is None:
+            return False
+        self._dispose_entry(db_name, entry, reason="explicit")
+        return True
+
+    def dispose_all(self) -> None:
+        """Dispose every registered engine."""
+        with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+            TENANT_ENGINES_ACTIVE.set(0)
+        for db_name, entry in entries:
+            self._dispose_entry(db_name, entry, reason="shutdown")
+
+    def reap_idle(self) -> int:
+        """
+        Dispose engines that have not been used for ``idle_timeout`` seconds.
+
+        Returns:
+            int: Number of engines reaped
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        reaped = []
+        with self._lock:
+            # Entries are kept in LRU order, so idle ones are at the front
+            for db_name, entry in self._entries.items():
+                if entry.last_used > cutoff:
+                    break
+                reaped.append((db_name, entry))
+            for db_name, _ in reaped:
+                del self._entries[db_name]
+            TENANT_ENGINES_ACTIVE.set(len(self._entries))
+        for db_name, entry in reaped:
+            self._dispose_entry(db_name, entry, reason="idle")
+        if reaped:
+            logger.info(f"Reaped {len(reaped)} idle tenant engines")
+        return len(reaped)
+
+    async def _reap_forever(self, interval: float) -> None:
+        """Reap idle engines every ``interval`` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.reap_idle()
+            except Exception as e:
+                logger.error(f"Tenant engine reaper failed: {str(e)}")
+
+    def start_reaper(self, interval: float) -> None:
+        """Start the background idle reaper on the running event loop."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.get_running_loop().create_task(
+                self._reap_forever(interval)
+            )
+
+    async def stop_reaper(self) -> None:
+        """Stop the background idle reaper."""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+
+    def sample(self, count: int) -> Dict[str, Engine]:
+        """
+        Up to ``count`` cached engines, most recently used first.
+
+        Unlike ``get_engine`` this neither creates engines nor refreshes
+        their LRU position, so health checks do not keep idle engines alive.
+        """
+        with self._lock:
+            names = list(reversed(self._entries))[:count]
+            return {name: self._entries[name].engine for name in names}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, db_name: str) -> bool:
+        return db_name in self._entries
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Registry size and counters."""
+        return {
+            "engines": len(self._entries),
+            "max_engines": self.max_engines,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class AsyncTenantEngineRegistry(TenantEngineRegistry):
+    """
+    Bounded registry of asyncio tenant engines and AsyncSession factories.
+
+    Evicted engines are disposed in a task on the running event loop;
+    ``wait_closed`` awaits any disposals still in flight.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._disposals: Set[asyncio.Task] = set()
+
+    def _create_engine(self, db_name: str) -> AsyncEngine:
+        """Create a pooled asyncio engine for a tenant database."""
+        return create_async_engine(self._url_builder(db_name), **self._engine_options)
+
+    def _create_session_factory(self, engine: AsyncEngine) -> async_sessionmaker:
+        """Create the AsyncSession factory cached next to an engine."""
+        return async_sessionmaker(
+            engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    def _dispose_engine(self, engine: AsyncEngine) -> None:
+        """Close the connection pool of an asyncio engine."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to close connections on; just drop the pool
+            engine.sync_engine.dispose(close=False)
+            return
+        task = loop.create_task(engine.dispose())
+        self._disposals.add(task)
+        task.add_done_callback(self._disposals.discard)
+
+    async def wait_closed(self) -> None:
+        """Wait for pending engine disposals to finish."""
+        if self._disposals:
+            await asyncio.gather(*self._disposals, return_exceptions=True)
+
+
+def _engine_options(settings: DatabaseSettings) -> Dict[str, Any]:
+    """Pool options shared by every tenant engine."""
+    return {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+    }
+
+
+def create_tenant_engine_registry(
+    settings: Optional[DatabaseSettings] = None
+) -> TenantEngineRegistry:
+    """Create a registry configured from database settings."""
+    settings = settings or get_database_settings()
+    return TenantEngineRegistry(
+        max_engines=settings.TENANT_ENGINE_CACHE_SIZE,
+        idle_timeout=settings.TENANT_ENGINE_IDLE_TIMEOUT,
+        url_builder=settings.get_tenant_database_url,
+        engine_options={"poolclass": QueuePool, **_engine_options(settings)}
+    )
+
+
+def create_async_tenant_engine_registry(
+    settings: Optional[DatabaseSettings] = None
+) -> AsyncTenantEngineRegistry:
+    """Create an asyncio registry configured from database settings."""
+    settings = settings or get_database_settings()
+    return AsyncTenantEngineRegistry(
+        max_engines=settings.TENANT_ENGINE_CACHE_SIZE,
+        idle_timeout=settings.TENANT_ENGINE_IDLE_TIMEOUT,
+        url_builder=settings.get_tenant_async_database_url,
+        engine_options=_engine_options(settings)
+    )
+
+
+# Shared registries for every tenant session manager in the process
+tenant_engine_registry = create_tenant_engine_registry()
+async_tenant_engine_registry = create_async_tenant_engine_registry()
@@ -0,0 +1,155 @@
+"""
+Keyset Pagination
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence
+from uuid import UUID
+import base64
+import json
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> List[Any]:
+    """Tag a key value with its type so it round-trips through JSON."""
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["uuid", str(value)]
+    if isinstance(value, Decimal):
+        return ["dec", str(value)]
+    return ["v", value]
+
+
+def _decode_value(tagged: List[Any]) -> Any:
+    tag, value = tagged
+    if tag == "dt":
+        return datetime.fromisoformat(value)
+    if tag == "uuid":
+        return UUID(value)
+    if tag == "dec":
+        return Decimal(value)
+    if tag == "v":
+        return value
+    raise ValueError(f"Unknown cursor value type {tag}")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the key of the last row of a page as an opaque cursor.
+
+    Args:
+        values: Key column values of the last row
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Opaque cursor from a previous page
+        size: Number of key columns expected
+
+    Returns:
+        List of key values
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = [
+            _decode_value(tagged)
+            for tagged in json.loads(base64.urlsafe_b64decode(padded.encode()))
+        ]
+        if len(values) != size:
+            raise ValueError("Cursor does not match the listing key")
+        return values
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {str(e)}"
+        )
+
+
+class Keyset:
+    """
+    Keyset (seek) pagination over a unique, ordered set of columns.
+
+    Instead of ``OFFSET n``, which makes SQL Server scan and discard ``n``
+    rows, each page starts strictly after the key of the previous page's
+    last row and is served by an index seek. The last column must be
+    unique (normally the primary key) to break ties.
+    """
+
+    def __init__(self, *columns: ColumnElement, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def apply(self, query: Select, cursor: Optional[str] = None) -> Select:
+        """
+        Order a query by the key and start it after a cursor.
+
+        Args:
+            query: Listing query
+            cursor: Cursor of the previous page, or None for the first page
+
+        Returns:
+            Select: Ordered (and filtered) query; the caller applies the limit
+        """
+        query = query.order_by(*(
+            column.desc() if self.descending else column.asc()
+            for column in self.columns
+        ))
+        if cursor:
+            query = query.where(self._after(decode_cursor(cursor, len(self.columns))))
+        return query
+
+    def _after(self, values: List[Any]) -> ColumnElement:
+        """
+        Build ``(c1, c2, ...) > (v1, v2, ...)`` without row-value syntax,
+        which SQL Server does not support.
+        """
+        clauses = []
+        for index, column in enumerate(self.columns):
+            equal = [self.columns[i] == values[i] for i in range(index)]
+            beyond = column < values[index] if self.descending else column > values[index]
+            clauses.append(and_(*equal, beyond))
+        return or_(*clauses)
+
+    def cursor_for(self, row: Any) -> str:
+        """Cursor pointing just after ``row``."""
+        return encode_cursor([getattr(row, column.key) for column in self.columns])
+
+    def next_cursor(self, rows: Sequence[Any], limit: int) -> Optional[str]:
+        """
+        Cursor of the page after ``rows``.
+
+        Returns:
+            Optional[str]: None when the page was not full, i.e. it was the last
+        """
+        if not rows or len(rows) < limit:
+            return None
+        return self.cursor_for(rows[-1])
+
+    def set_next_cursor(self, response: Response, rows: Sequence[Any], limit: int) -> None:
+        """Expose the next page cursor on a listing response."""
+        cursor = self.next_cursor(rows, limit)
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,73 @@
+"""
+Query Counter
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from typing import Any, List, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryCounter:
+    """
+    Count the SQL statements executed on one or more engines.
+
+    Used as a context manager, typically in tests to catch N+1 query
+    patterns::
+
+        with QueryCounter(engine) as counter:
+            service.get_roles()
+        counter.assert_at_most(2)
+    """
+
+    def __init__(self, *engines: Union[Engine, AsyncEngine]):
+        # Events are registered on the sync engine behind an AsyncEngine
+        self.engines = [
+            engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+            for engine in engines
+        ]
+        self.statements: List[str] = []
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool
+    ) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed so far."""
+        return len(self.statements)
+
+    def assert_at_most(self, limit: int) -> None:
+        """
+        Fail if more than ``limit`` statements were executed.
+
+        Raises:
+            AssertionError: With every executed statement listed
+        """
+        if self.count > limit:
+            executed = "\n".join(
+                f"{index}. {statement}"
+                for index, statement in enumerate(self.statements, start=1)
+            )
+            raise AssertionError(
+                f"Expected at most {limit} queries, {self.count} were executed:\n{executed}"
+            )
@@ -1,8 +1,10 @@
 """Database session configuration."""
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config.database import get_database_settings
+from app.core.db.engine_registry import TenantEngineRegistry, tenant_engine_registry
 
 settings = get_database_settings()
 
@@ -17,6 +19,20 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create asyncio engine and session factory
+async_engine = create_async_engine(
+    settings.MASTER_ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -32,12 +48,22 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get asyncio database session.
+    
+    Yields:
+        AsyncSession: Database session that does not block the event loop
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 class DBSessionManager:
     """Manager for tenant-specific database sessions."""
     
-    def __init__(self):
-        self.engines = {}
-        self.session_factories = {}
+    def __init__(self, registry: TenantEngineRegistry = tenant_engine_registry):
+        self.registry = registry
     
     def get_tenant_session(self, tenant_db_name: str) -> Session:
         """
@@ -49,19 +75,4 @@ class DBSessionManager:
         Returns:
             Session: Database session for tenant
         """
-        if tenant_db_name not in self.engines:
-            # Create new engine for tenant
-            engine = create_engine(
-                settings.get_tenant_database_url(tenant_db_name),
-                pool_pre_ping=True,
-                pool_size=settings.DB_POOL_SIZE,
-                max_overflow=settings.DB_MAX_OVERFLOW
-            )
-            self.engines[tenant_db_name] = engine
-            self.session_factories[tenant_db_name] = sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=engine
-            )
-        
-        return self.session_factories[tenant_db_name]()
+        return self.registry.get_session(tenant_db_name)
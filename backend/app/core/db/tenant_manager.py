@@ -1,16 +1,13 @@
-from typing import Dict, Optional
+from typing import Optional
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import Session
 from app.core.config.database import get_database_url
+from app.core.db.engine_registry import tenant_engine_registry
 from app.core.security.crypto import encrypt_connection_string
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Cache of tenant database engines
-tenant_engines: Dict[int, 'Engine'] = {}
-
 
 async def create_tenant_database(db_name: str, encryption_key: str) -> bool:
     """
@@ -59,26 +56,14 @@ def get_tenant_session(tenant_id: int) -> Session:
     """
     Get a database session for a specific tenant
     """
-    if tenant_id not in tenant_engines:
-        # Create new engine for tenant
-        db_url = get_tenant_database_url(tenant_id)
-        engine = create_engine(
-            db_url,
-            poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
-            pool_recycle=1800
-        )
-        tenant_engines[tenant_id] = engine
-    
-    # Create session
-    SessionLocal = sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=tenant_engines[tenant_id]
-    )
-    return SessionLocal()
+    return tenant_engine_registry.get_session(get_tenant_database_name(tenant_id))
+
+
+def get_tenant_database_name(tenant_id: int) -> str:
+    """
+    Get database name for tenant
+    """
+    return f"tenant_{tenant_id}"
 
 
 def get_tenant_database_url(tenant_id: int) -> str:
@@ -96,9 +81,7 @@ def close_tenant_connections():
     """
     Close all tenant database connections
     """
-    for engine in tenant_engines.values():
-        engine.dispose()
-    tenant_engines.clear()
+    tenant_engine_registry.dispose_all()
 
 
 class TenantDatabaseManager:
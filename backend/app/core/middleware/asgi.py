@@ -0,0 +1,45 @@
+"""
+ASGI Middleware Helpers
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from typing import Callable, Mapping
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Send
+
+
+def send_with_headers(send: Send, headers: Mapping[str, str]) -> Send:
+    """
+    Wrap ``send`` to set headers on the response start message.
+
+    Pure ASGI middlewares use this instead of ``BaseHTTPMiddleware``, which
+    runs the app in a separate task and buffers the response body.
+
+    Args:
+        send: ASGI send callable
+        headers: Headers to set, replacing any the app set
+    """
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response_headers = MutableHeaders(scope=message)
+            for key, value in headers.items():
+                response_headers[key] = value
+        await send(message)
+
+    return wrapped
+
+
+def on_response_start(send: Send, callback: Callable[[Message], None]) -> Send:
+    """
+    Wrap ``send`` to call ``callback`` with the response start message.
+
+    The callback may modify the message (e.g. its headers) before it is sent.
+    """
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            callback(message)
+        await send(message)
+
+    return wrapped
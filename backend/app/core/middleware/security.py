@@ -1,111 +1,125 @@
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import Response
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import time
-from app.core.security.rate_limit import RateLimiter
-from app.core.security.audit import AuditTrail
-from app.core.db.session import get_db
+from app.core.cache.redis import get_redis_cache
+from app.core.middleware.asgi import on_response_start, send_with_headers
+from app.core.security.rate_limit import RateLimitConfig, create_rate_limiter
+from app.core.security.audit_writer import audit_writer
 import logging
 
 logger = logging.getLogger(__name__)
 
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "Content-Security-Policy": "default-src 'self'",
+}
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+
+class SecurityMiddleware:
     def __init__(
         self,
         app: ASGIApp,
         rate_limit_requests: int = 100,
         rate_limit_window: int = 60
     ):
-        super().__init__(app)
-        self.rate_limiter = RateLimiter(
-            requests=rate_limit_requests,
-            window=rate_limit_window
+        self.app = app
+        self.rate_limiter = create_rate_limiter(
+            get_redis_cache(),
+            RateLimitConfig(
+                requests_per_minute=rate_limit_requests,
+                burst_size=rate_limit_requests,
+                window_size=rate_limit_window
+            ),
+            "sliding_window"
         )
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get client IP
-        client_ip = request.client.host if request.client else None
-        
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+
         # Check rate limit
-        if not await self.rate_limiter.check_rate_limit(client_ip):
-            return Response(
+        is_allowed, _ = await self.rate_limiter.check_rate_limit(client_ip)
+        if not is_allowed:
+            response = Response(
                 content="Rate limit exceeded",
                 status_code=429
             )
-        
+            await response(scope, receive, send)
+            return
+
         # Security headers
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
-        
-        return response
+        await self.app(scope, receive, send_with_headers(send, SECURITY_HEADERS))
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
+class AuditMiddleware:
+    def __init__(self, app: ASGIApp, writer=audit_writer):
+        self.app = app
+        self.writer = writer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable
-    ) -> Response:
         # Start timing
         start_time = time.time()
-        
+
         # Get request details
-        method = request.method
-        url = str(request.url)
-        client_ip = request.client.host if request.client else None
-        user_agent = request.headers.get("user-agent")
-        
+        method = scope["method"]
+        url = str(URL(scope=scope))
+        client = scope.get("client")
+        client_ip = client[0] if client else None
+        user_agent = None
+        for key, value in scope["headers"]:
+            if key == b"user-agent":
+                user_agent = value.decode("latin-1")
+                break
+
+        # Status and time to first byte, taken from the response start
+        started = {}
+
+        def record(message: Message) -> None:
+            started["status_code"] = message["status"]
+            started["duration"] = time.time() - start_time
+
         try:
             # Get current user if authenticated
             user_id = None
-            if hasattr(request.state, "user"):
-                user_id = request.state.user.id
-            
+            user = scope.get("state", {}).get("user")
+            if user is not None:
+                user_id = user.id
+
             # Process request
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
+            await self.app(scope, receive, on_response_start(send, record))
+
             # Log successful request
-            if 200 <= response.status_code < 400:
-                # Get database session
-                db = next(get_db())
-                
-                # Log audit trail
-                AuditTrail.log_change(
-                    session=db,
+            status_code = started.get("status_code")
+            if status_code is not None and 200 <= status_code < 400:
+                # Queue the audit entry; it is written in a later batch
+                await self.writer.log(
                     user_id=user_id,
                     action=f"{method} {url}",
-                    table_name="http_requests",
-                    record_id=str(int(time.time())),
+                    entity_type="http_requests",
+                    entity_id=str(int(time.time())),
                     new_values={
                         "method": method,
                         "url": url,
-                        "status_code": response.status_code,
-                        "duration": duration
+                        "status_code": status_code,
+                        "duration": started["duration"]
                     },
                     ip_address=client_ip,
                     user_agent=user_agent
                 )
-                
-                db.commit()
-            
-            return response
-            
+
         except Exception as e:
             # Log error
             logger.error(
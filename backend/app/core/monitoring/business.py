@@ -0,0 +1,28 @@
+"""
+Business Metrics Refresh
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from app.core.concurrency.periodic import PeriodicTask
+from app.core.config.settings import get_settings
+from app.core.db.session import AsyncSessionLocal
+from app.core.monitoring.metrics import update_business_metrics
+
+
+async def refresh_business_metrics() -> None:
+    """Refresh the business gauges from the master database."""
+    async with AsyncSessionLocal() as db:
+        await update_business_metrics(db)
+
+
+settings = get_settings()
+
+# Started and stopped by the application lifespan
+business_metrics_task = PeriodicTask(
+    "business_metrics",
+    refresh_business_metrics,
+    interval=settings.BUSINESS_METRICS_INTERVAL,
+    jitter=settings.BUSINESS_METRICS_JITTER,
+    timeout=settings.BUSINESS_METRICS_TIMEOUT
+)
@@ -1,4 +1,8 @@
-from prometheus_client import Counter, Histogram, Gauge
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Histogram, Gauge, generate_latest
+from starlette.requests import Request
+from typing import Dict, Set
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import time
 
 # Request metrics
@@ -14,6 +18,32 @@ REQUEST_LATENCY = Histogram(
     ['method', 'endpoint']
 )
 
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+REQUEST_SIZE = Histogram(
+    'http_request_size_bytes',
+    'HTTP request body size in bytes',
+    ['method', 'endpoint'],
+    buckets=SIZE_BUCKETS
+)
+
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes',
+    'HTTP response body size in bytes',
+    ['method', 'endpoint'],
+    buckets=SIZE_BUCKETS
+)
+
+REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    'Number of HTTP requests being processed',
+    ['method']
+)
+
+# Endpoint label for requests no route matched (404s, requests rejected
+# by a middleware), so unknown paths cannot create new series
+UNMATCHED_ENDPOINT = "unmatched"
+
 # Database metrics
 DB_CONNECTION_COUNT = Gauge(
     'database_connections',
@@ -33,6 +63,155 @@ DB_QUERY_DURATION = Histogram(
     ['operation', 'table']
 )
 
+# Tenant engine registry metrics
+TENANT_ENGINE_HITS = Counter(
+    'tenant_engine_cache_hits_total',
+    'Number of tenant engine lookups served from the registry'
+)
+
+TENANT_ENGINE_MISSES = Counter(
+    'tenant_engine_cache_misses_total',
+    'Number of tenant engine lookups that created a new engine'
+)
+
+TENANT_ENGINE_EVICTIONS = Counter(
+    'tenant_engine_evictions_total',
+    'Number of tenant engines disposed by the registry',
+    ['reason']
+)
+
+TENANT_ENGINES_ACTIVE = Gauge(
+    'tenant_engines_active',
+    'Number of live tenant engines in the registry'
+)
+
+# Blocking executor metrics
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    'blocking_executor_queue_depth',
+    'Number of blocking calls waiting for a worker thread',
+    ['pool']
+)
+
+EXECUTOR_ACTIVE = Gauge(
+    'blocking_executor_active',
+    'Number of blocking calls running on a worker thread',
+    ['pool']
+)
+
+EXECUTOR_WAIT_TIME = Histogram(
+    'blocking_executor_wait_seconds',
+    'Time blocking calls spend queued before a worker picks them up',
+    ['pool'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+# Permission cache metrics
+PERMISSION_CACHE_HITS = Counter(
+    'permission_cache_hits_total',
+    'Number of permission set lookups served from cache',
+    ['tier']
+)
+
+PERMISSION_CACHE_MISSES = Counter(
+    'permission_cache_misses_total',
+    'Number of permission set lookups resolved from the database'
+)
+
+PRINCIPAL_CACHE_HITS = Counter(
+    'principal_cache_hits_total',
+    'Number of authenticated principals served from cache',
+    ['tier']
+)
+
+PRINCIPAL_CACHE_MISSES = Counter(
+    'principal_cache_misses_total',
+    'Number of authenticated principals loaded from the database'
+)
+
+# Single-flight metrics
+SINGLE_FLIGHT_CALLS = Counter(
+    'single_flight_calls_total',
+    'Calls through single-flight groups by whether they ran or reused a result',
+    ['name', 'role']
+)
+
+# Service cache metrics
+SERVICE_CACHE_REQUESTS = Counter(
+    'service_cache_requests_total',
+    'Read-through service cache lookups',
+    ['namespace', 'result']
+)
+
+# Audit writer metrics
+AUDIT_QUEUE_DEPTH = Gauge(
+    'audit_queue_depth',
+    'Number of audit events waiting to be written'
+)
+
+AUDIT_EVENTS_WRITTEN = Counter(
+    'audit_events_written_total',
+    'Number of audit events written to the database'
+)
+
+AUDIT_EVENTS_DROPPED = Counter(
+    'audit_events_dropped_total',
+    'Number of audit events that could not be queued or written',
+    ['reason']
+)
+
+AUDIT_FLUSH_DURATION = Histogram(
+    'audit_flush_duration_seconds',
+    'Time spent writing one batch of audit events'
+)
+
+AUDIT_SPOOL_DEPTH = Gauge(
+    'audit_spool_depth',
+    'Number of audit events in the local spool waiting for replay'
+)
+
+AUDIT_SPOOL_SEGMENTS = Gauge(
+    'audit_spool_segments',
+    'Number of audit spool segment files on disk'
+)
+
+AUDIT_SPOOL_REPLAYED = Counter(
+    'audit_spool_replayed_total',
+    'Number of spooled audit events replayed to the database',
+    ['result']
+)
+
+# Redis pool metrics
+REDIS_POOL_CONNECTIONS = Gauge(
+    'redis_pool_connections',
+    'Connections in the shared Redis pool',
+    ['state']
+)
+
+REDIS_POOL_MAX_CONNECTIONS = Gauge(
+    'redis_pool_max_connections',
+    'Maximum connections in the shared Redis pool'
+)
+
+# Rate limiting metrics
+RATE_LIMIT_DECISIONS = Counter(
+    'rate_limit_decisions_total',
+    'Number of rate limit decisions by where they were made',
+    ['source']
+)
+
+# Background task metrics
+BACKGROUND_TASK_RUNS = Counter(
+    'background_task_runs_total',
+    'Runs of periodic background tasks by result',
+    ['name', 'result']
+)
+
+BACKGROUND_TASK_DURATION = Histogram(
+    'background_task_duration_seconds',
+    'Duration of periodic background task runs',
+    ['name']
+)
+
 # Business metrics
 TENANT_COUNT = Gauge(
     'tenant_count',
@@ -64,40 +243,77 @@ CPU_USAGE = Gauge(
 
 
 class MetricsMiddleware:
-    """Middleware to collect request metrics"""
-    
-    def __init__(self, app):
+    """
+    Middleware to collect request metrics.
+
+    Requests are labelled by the matched route template (e.g.
+    ``/api/v1/users/{user_id}``), never the raw path, so the number of
+    series is bounded by the number of routes. The status is taken from
+    the ``http.response.start`` message and sizes from the body messages;
+    the response is streamed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
         self.app = app
 
-    async def __call__(self, scope, receive, send):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
-            return await self.app(scope, receive, send)
-        
-        start_time = time.time()
-        
-        # Get request details
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
         method = scope["method"]
-        path = scope["path"]
-        
-        # Process request
-        response = await self.app(scope, receive, send)
-        
-        # Record metrics
-        duration = time.time() - start_time
-        status = response.status_code
-        
-        REQUEST_COUNT.labels(
-            method=method,
-            endpoint=path,
-            status=status
-        ).inc()
-        
-        REQUEST_LATENCY.labels(
-            method=method,
-            endpoint=path
-        ).observe(duration)
-        
-        return response
+        # Server errors are recorded as 500 when no response was started
+        state = {"status": 500, "request_size": 0, "response_size": 0}
+
+        async def receive_counted() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                state["request_size"] += len(message.get("body", b""))
+            return message
+
+        async def send_counted(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                state["response_size"] += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive_counted, send_counted)
+        finally:
+            in_progress.dec()
+            duration = time.perf_counter() - start_time
+            endpoint = route_template(scope)
+
+            REQUEST_COUNT.labels(
+                method=method,
+                endpoint=endpoint,
+                status=state["status"]
+            ).inc()
+            REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(duration)
+            REQUEST_SIZE.labels(method=method, endpoint=endpoint).observe(state["request_size"])
+            RESPONSE_SIZE.labels(method=method, endpoint=endpoint).observe(state["response_size"])
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the route that handled the request."""
+    route = scope.get("route")
+    path = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if path is None:
+        return UNMATCHED_ENDPOINT
+    return scope.get("root_path", "") + path
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """
+    Prometheus exposition of the process registry.
+
+    Only renders the current values; nothing is queried during a scrape.
+    """
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
 
 
 class DatabaseMetrics:
@@ -124,37 +340,43 @@ class DatabaseMetrics:
         ).observe(duration)
 
 
-def update_business_metrics(db_session):
-    """Update business metrics"""
+async def update_business_metrics(db) -> None:
+    """
+    Refresh the tenant and per-tenant user gauges with one aggregate query.
+
+    Series of tenants that are no longer active are removed. The gauges
+    are updated without awaiting in between, so a scrape on the event
+    loop sees either the previous or the new values, never a mix.
+
+    Args:
+        db: Master database ``AsyncSession``
+    """
+    from sqlalchemy import and_, func, select
     from app.models.master.tenant import Tenant
     from app.models.master.user import User
-    
-    # Update tenant count
-    tenant_count = db_session.query(Tenant).filter(
-        Tenant.is_active == True
-    ).count()
+
+    result = await db.execute(
+        select(Tenant.Name, func.count(User.UserID))
+        .select_from(Tenant)
+        .outerjoin(User, and_(User.TenantID == Tenant.TenantID, User.IsActive == True))
+        .where(Tenant.IsActive == True)
+        .group_by(Tenant.TenantID, Tenant.Name)
+    )
+    tenant_count = 0
+    user_counts: Dict[str, int] = {}
+    for name, user_count in result.all():
+        tenant_count += 1
+        # Names are not unique; tenants sharing one share its series
+        user_counts[name] = user_counts.get(name, 0) + user_count
+
+    for name in _user_count_tenants - user_counts.keys():
+        USER_COUNT.remove(name)
+    for name, user_count in user_counts.items():
+        USER_COUNT.labels(tenant=name).set(user_count)
     TENANT_COUNT.set(tenant_count)
-    
-    # Update user count per tenant
-    tenants = db_session.query(Tenant).filter(
-        Tenant.is_active == True
-    ).all()
-    
-    for tenant in tenants:
-        user_count = db_session.query(User).filter(
-            User.tenant_id == tenant.tenant_id,
-            User.is_active == True
-        ).count()
-        USER_COUNT.labels(tenant=tenant.name).set(user_count)
+    _user_count_tenants.clear()
+    _user_count_tenants.update(user_counts)
 
 
-def update_system_metrics():
-    """Update system metrics"""
-    import psutil
-    
-    # Memory usage
-    memory = psutil.virtual_memory()
-    MEMORY_USAGE.set(memory.used)
-    
-    # CPU usage
-    CPU_USAGE.set(psutil.cpu_percent())
+# Tenant labels currently exported by USER_COUNT
+_user_count_tenants: Set[str] = set()
@@ -0,0 +1,204 @@
+"""
+Liveness and Readiness Probes
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import logging
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from app.core.cache.redis import get_redis_client
+from app.core.concurrency.periodic import PeriodicTask
+from app.core.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+Check = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class CheckFailed(Exception):
+    """A dependency check failed, with details to report alongside."""
+
+    def __init__(self, message: str, details: Dict[str, Any]):
+        super().__init__(message)
+        self.details = details
+
+
+class ReadinessChecker:
+    """
+    Run dependency checks in the background and serve their last results.
+
+    ``/readyz`` reads ``status``, which only compares timestamps, so a
+    probe never does I/O however often it is called.
+
+    Features:
+    1. Checks registered with ``add_check`` run concurrently every
+       ``interval`` seconds, each bounded by ``timeout``
+    2. A result older than ``ttl`` counts as failed, so a stuck schedule
+       cannot keep reporting a dependency as up
+    3. Only critical checks decide readiness; non-critical ones are
+       reported in the breakdown
+    """
+
+    def __init__(self, interval: float, timeout: float, ttl: float):
+        self.interval = interval
+        self.timeout = timeout
+        self.ttl = ttl
+        self._checks: Dict[str, Tuple[Check, bool]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._task = PeriodicTask("readiness", self.run_checks, interval=interval)
+
+    def add_check(self, name: str, check: Check, critical: bool = True) -> None:
+        """Register a coroutine function that raises if a dependency is down."""
+        self._checks[name] = (check, critical)
+
+    async def run_checks(self) -> None:
+        """Run every check once and record its result."""
+        names = list(self._checks)
+        results = await asyncio.gather(*(
+            self._run(name, self._checks[name][0]) for name in names
+        ))
+        self._results.update(zip(names, results))
+
+    async def _run(self, name: str, check: Check) -> Dict[str, Any]:
+        start = time.perf_counter()
+        result: Dict[str, Any] = {"status": "ok"}
+        try:
+            details = await asyncio.wait_for(check(), timeout=self.timeout)
+            if details:
+                result["details"] = details
+        except asyncio.TimeoutError:
+            logger.error(f"Readiness check {name} timed out after {self.timeout}s")
+            result = {"status": "error", "error": f"timed out after {self.timeout}s"}
+        except CheckFailed as e:
+            logger.error(f"Readiness check {name} failed: {str(e)}")
+            result = {"status": "error", "error": str(e), "details": e.details}
+        except Exception as e:
+            logger.error(f"Readiness check {name} failed: {str(e)}")
+            result = {"status": "error", "error": str(e)}
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        result["checked_at"] = time.monotonic()
+        return result
+
+    def status(self) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
+        """
+        Readiness from the last recorded results.
+
+        Returns:
+            Tuple[bool, Dict[str, Dict[str, Any]]]: Whether every critical
+            check passed within ``ttl``, and the per-check breakdown
+        """
+        now = time.monotonic()
+        ready = True
+        checks = {}
+        for name, (_, critical) in self._checks.items():
+            result = self._results.get(name)
+            if result is None:
+                report = {"status": "pending"}
+            else:
+                report = {k: v for k, v in result.items() if k != "checked_at"}
+                report["age"] = round(now - result["checked_at"], 3)
+                if report["status"] == "ok" and report["age"] > self.ttl:
+                    report["status"] = "stale"
+            report["critical"] = critical
+            if critical and report["status"] != "ok":
+                ready = False
+            checks[name] = report
+        return ready, checks
+
+    async def start(self) -> None:
+        """Run the checks once, then keep running them in the background."""
+        await self.run_checks()
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+async def check_database() -> None:
+    """Master database accepts queries."""
+    from app.core.db.session import async_engine
+
+    async with async_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def check_redis() -> None:
+    """Redis answers PING."""
+    await get_redis_client().ping()
+
+
+async def check_tenant_databases() -> Dict[str, Any]:
+    """
+    A sample of the tenant databases this process has engines for.
+
+    Only engines already in the registry are checked, most recently used
+    first, so probing never opens pools for tenants nobody is using.
+    """
+    from app.core.db.engine_registry import async_tenant_engine_registry
+    from app.core.monitoring.sampler import pool_stats
+
+    engines = async_tenant_engine_registry.sample(settings.READINESS_TENANT_SAMPLE)
+
+    async def ping(engine) -> Dict[str, Any]:
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            return {"status": "ok", "pool": pool_stats(engine.pool)}
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+
+    results = await asyncio.gather(*(ping(engine) for engine in engines.values()))
+    databases = dict(zip(engines, results))
+    failed = [name for name, result in databases.items() if result["status"] != "ok"]
+    if failed:
+        raise CheckFailed(
+            f"{len(failed)} of {len(databases)} tenant databases unreachable",
+            {"databases": databases}
+        )
+    return {"databases": databases}
+
+
+settings = get_settings()
+
+# Shared checker, started and stopped by the application lifespan
+readiness_checker = ReadinessChecker(
+    interval=settings.READINESS_CHECK_INTERVAL,
+    timeout=settings.READINESS_CHECK_TIMEOUT,
+    ttl=settings.READINESS_TTL
+)
+readiness_checker.add_check("database", check_database)
+readiness_checker.add_check("redis", check_redis)
+# One tenant database being down should not take every tenant out of rotation
+readiness_checker.add_check("tenant_databases", check_tenant_databases, critical=False)
+
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/livez")
+async def livez() -> JSONResponse:
+    """
+    Liveness probe: the event loop is serving requests.
+
+    Never checks dependencies, so an outage elsewhere does not get the
+    process restarted.
+    """
+    return JSONResponse({"status": "ok"})
+
+
+@router.get("/readyz")
+async def readyz() -> JSONResponse:
+    """
+    Readiness probe: 200 if every critical dependency passed its last
+    background check within the TTL, 503 otherwise.
+    """
+    ready, checks = readiness_checker.status()
+    return JSONResponse(
+        {"status": "ok" if ready else "error", "checks": checks},
+        status_code=200 if ready else 503
+    )
@@ -0,0 +1,176 @@
+"""
+Health Sampler
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import logging
+
+import psutil
+from pydantic import BaseModel
+from sqlalchemy import text
+from app.core.cache.redis import get_redis_client, redis_pool_stats
+from app.core.concurrency.periodic import PeriodicTask
+from app.core.config.settings import get_settings
+from app.core.monitoring.metrics import CPU_USAGE, MEMORY_USAGE
+
+logger = logging.getLogger(__name__)
+
+Collector = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class HealthSnapshot(BaseModel):
+    """System and service statistics from one sampling round."""
+    sampled_at: Optional[datetime] = None
+    system: Dict[str, Any] = {}
+    services: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def status(self) -> str:
+        """``ok`` if every service was reachable in this round."""
+        if self.sampled_at is None:
+            return "error"
+        return "ok" if all(s["status"] == "ok" for s in self.services.values()) else "error"
+
+
+class HealthSampler:
+    """
+    Collect system and service statistics in the background.
+
+    Health endpoints read ``snapshot``, which is replaced as a whole after
+    each round, so a probe costs a pointer read and never does I/O.
+    Database and Redis are queried once per ``interval`` per process,
+    however often the endpoints are probed.
+
+    Features:
+    1. System statistics (CPU, memory, disk) read once per round; CPU is
+       the average since the previous round, never a blocking sample
+    2. Service collectors registered with ``add_service`` run
+       concurrently, each bounded by ``timeout``
+    3. A failing or slow service is reported as ``error`` with the reason
+       instead of failing the round
+    """
+
+    def __init__(self, interval: float, timeout: float):
+        self.interval = interval
+        self.timeout = timeout
+        self.snapshot = HealthSnapshot()
+        self._services: Dict[str, Collector] = {}
+        self._task = PeriodicTask("health_sampler", self.sample, interval=interval)
+        # The first call only starts psutil's CPU measurement
+        psutil.cpu_percent(interval=None)
+
+    def add_service(self, name: str, collector: Collector) -> None:
+        """Register a coroutine function returning a service's statistics."""
+        self._services[name] = collector
+
+    async def sample(self) -> HealthSnapshot:
+        """Run one sampling round and publish its snapshot."""
+        names = list(self._services)
+        results = await asyncio.gather(*(
+            self._collect(name, self._services[name]) for name in names
+        ))
+        self.snapshot = HealthSnapshot(
+            sampled_at=datetime.utcnow(),
+            system=collect_system(),
+            services=dict(zip(names, results))
+        )
+        return self.snapshot
+
+    async def _collect(self, name: str, collector: Collector) -> Dict[str, Any]:
+        try:
+            details = await asyncio.wait_for(collector(), timeout=self.timeout)
+            return {"status": "ok", "details": details}
+        except asyncio.TimeoutError:
+            logger.error(f"Health sample of {name} timed out after {self.timeout}s")
+            return {"status": "error", "details": {"error": f"timed out after {self.timeout}s"}}
+        except Exception as e:
+            logger.error(f"Health sample of {name} failed: {str(e)}")
+            return {"status": "error", "details": {"error": str(e)}}
+
+    async def start(self) -> None:
+        """Take a first sample, then keep sampling in the background."""
+        await self.sample()
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+def collect_system() -> Dict[str, Any]:
+    """CPU, memory and disk usage, one psutil call each."""
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage("/")
+    cpu_percent = psutil.cpu_percent(interval=None)
+    MEMORY_USAGE.set(memory.used)
+    CPU_USAGE.set(cpu_percent)
+    return {
+        "cpu": {
+            "percent": cpu_percent,
+            "count": psutil.cpu_count()
+        },
+        "memory": {
+            "total": memory.total,
+            "available": memory.available,
+            "percent": memory.percent
+        },
+        "disk": {
+            "total": disk.total,
+            "used": disk.used,
+            "free": disk.free,
+            "percent": disk.percent
+        }
+    }
+
+
+def pool_stats(pool: Any) -> Dict[str, int]:
+    """Connection counts of a SQLAlchemy queue pool, without I/O."""
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow()
+    }
+
+
+async def database_stats() -> Dict[str, Any]:
+    """Master database version and connection pool usage."""
+    from app.core.db.engine_registry import async_tenant_engine_registry, tenant_engine_registry
+    from app.core.db.session import async_engine, engine
+
+    async with async_engine.connect() as connection:
+        version = (await connection.execute(text("SELECT @@VERSION"))).scalar()
+    return {
+        "version": version,
+        "connection": "active",
+        "pool": pool_stats(async_engine.pool),
+        "sync_pool": pool_stats(engine.pool),
+        "tenant_engines": async_tenant_engine_registry.stats,
+        "sync_tenant_engines": tenant_engine_registry.stats
+    }
+
+
+async def redis_stats() -> Dict[str, Any]:
+    """Redis server statistics and shared pool usage."""
+    info = await get_redis_client().info()
+    return {
+        "version": info.get("redis_version", "unknown"),
+        "used_memory": info.get("used_memory_human", "unknown"),
+        "connected_clients": info.get("connected_clients", "unknown"),
+        "uptime_days": info.get("uptime_in_days", "unknown"),
+        "pool": redis_pool_stats()
+    }
+
+
+settings = get_settings()
+
+# Shared sampler, started and stopped by the application lifespan
+health_sampler = HealthSampler(
+    interval=settings.HEALTH_SAMPLE_INTERVAL,
+    timeout=settings.HEALTH_SAMPLE_TIMEOUT
+)
+health_sampler.add_service("database", database_stats)
+health_sampler.add_service("redis", redis_stats)
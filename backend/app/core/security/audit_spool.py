@@ -0,0 +1,165 @@
+"""
+Audit Spool
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import json
+import logging
+import os
+import threading
+
+from app.core.monitoring.metrics import AUDIT_SPOOL_DEPTH, AUDIT_SPOOL_SEGMENTS
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class AuditSpool:
+    """
+    Append-only, segment-rotated local spool for audit events.
+
+    Features:
+    1. Events are appended as JSON lines and fsync'ed once per batch
+    2. The active segment is sealed once it reaches ``segment_bytes``;
+       replay only ever reads sealed segments
+    3. Segments are deleted only after every event in them was replayed
+    4. A torn last line (crash during a write) is skipped on replay
+
+    Methods do blocking file IO; call them from a worker thread, except
+    ``depth`` and ``pending``, which the event loop reads without locking.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._segments: List[int] = []
+        self._active: Optional[int] = None
+        self._depth = 0
+        self._opened = False
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{seq:012d}{SEGMENT_SUFFIX}")
+
+    def open(self) -> None:
+        """Create the directory and recover segments left by a previous run."""
+        with self._lock:
+            self._open_locked()
+
+    def _open_locked(self) -> None:
+        if self._opened:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                seq = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+                self._segments.append(seq)
+                with open(self._path(seq), "rb") as segment:
+                    self._depth += sum(1 for _ in segment)
+        self._segments.sort()
+        # Never append to a segment from a previous run; it may end torn
+        self._active = None
+        self._opened = True
+        self._update_metrics()
+
+    def _update_metrics(self) -> None:
+        AUDIT_SPOOL_DEPTH.set(self._depth)
+        AUDIT_SPOOL_SEGMENTS.set(len(self._segments))
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of events waiting for replay, 0 until ``open`` has run.
+
+        Read without the lock, which ``append`` holds across fsync; the
+        counter is only written under the lock, so a read may lag an
+        append in progress by one batch but never blocks.
+        """
+        return self._depth
+
+    @property
+    def pending(self) -> bool:
+        """True while any event is waiting for replay."""
+        return self.depth > 0
+
+    def append(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Durably append a batch of events.
+
+        Args:
+            events: ``AuditLogs`` rows, each with an ``EventID``
+        """
+        if not events:
+            return
+        data = "".join(
+            json.dumps(event, default=_json_default, separators=(",", ":")) + "\n"
+            for event in events
+        ).encode()
+        with self._lock:
+            self._open_locked()
+            if self._active is None:
+                self._active = (self._segments[-1] + 1) if self._segments else 1
+                self._segments.append(self._active)
+            path = self._path(self._active)
+            with open(path, "ab") as segment:
+                segment.write(data)
+                segment.flush()
+                os.fsync(segment.fileno())
+                size = segment.tell()
+            self._depth += len(events)
+            if size >= self.segment_bytes:
+                self._active = None
+            self._update_metrics()
+
+    def oldest_segment(self) -> Optional[str]:
+        """
+        Seal and return the oldest segment for replay.
+
+        Returns:
+            Optional[str]: Segment path, or None if the spool is empty
+        """
+        with self._lock:
+            self._open_locked()
+            if not self._segments:
+                return None
+            seq = self._segments[0]
+            if seq == self._active:
+                # New appends go to a fresh segment while this one replays
+                self._active = None
+            return self._path(seq)
+
+    def read_segment(self, path: str) -> List[Dict[str, Any]]:
+        """Read every intact event of a sealed segment."""
+        events = []
+        with open(path, "rb") as segment:
+            for line_number, line in enumerate(segment, start=1):
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    logger.error(f"Skipping torn audit spool line {path}:{line_number}")
+                    continue
+                if event.get("CreatedAt"):
+                    event["CreatedAt"] = datetime.fromisoformat(event["CreatedAt"])
+                events.append(event)
+        return events
+
+    def remove_segment(self, path: str) -> None:
+        """Delete a segment whose events have all been replayed."""
+        with self._lock:
+            with open(path, "rb") as segment:
+                lines = sum(1 for _ in segment)
+            os.remove(path)
+            self._segments = [seq for seq in self._segments if self._path(seq) != path]
+            self._depth = max(self._depth - lines, 0)
+            self._update_metrics()
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,292 @@
+"""
+Audit Writer
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+import asyncio
+import logging
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.concurrency.executor import run_blocking
+from app.core.config.settings import get_settings
+from app.core.monitoring.metrics import (
+    AUDIT_EVENTS_DROPPED,
+    AUDIT_EVENTS_WRITTEN,
+    AUDIT_FLUSH_DURATION,
+    AUDIT_QUEUE_DEPTH,
+    AUDIT_SPOOL_REPLAYED,
+)
+from app.core.security.audit_spool import AuditSpool
+from app.models.master.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+AuditEvent = Dict[str, Any]
+
+# Queued by stop() to tell the writer task to flush and exit
+_STOP = object()
+
+
+class AuditWriter:
+    """
+    Batched, asynchronous writer for ``AuditLogs`` rows.
+
+    Features:
+    1. Request handlers only enqueue an event (no round trip, no commit)
+    2. A background task bulk-inserts events when ``batch_size`` events
+       are waiting or ``flush_interval`` seconds after the first one
+    3. Bounded queue: when it is full, ``log`` waits up to
+       ``enqueue_timeout`` seconds for room (backpressure), then drops
+       the event and counts it
+    4. ``stop`` flushes everything still queued before returning
+    5. Batches that cannot be written (database slow or down) go to a
+       durable local spool, replayed in order once the database is back;
+       replay skips events whose ``EventID`` is already stored
+
+    While events are waiting in the spool, new batches are spooled too,
+    so they stay ordered and requests do not wait on a failing database.
+    While the writer is not running (scripts, tests without the
+    application lifespan) events are written immediately.
+    """
+
+    def __init__(
+        self,
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        enqueue_timeout: float,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        spool: Optional[AuditSpool] = None,
+        replay_interval: float = 5.0
+    ):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.spool = spool
+        self.replay_interval = replay_interval
+        self._session_factory = session_factory
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._replay_task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def log(
+        self,
+        action: str,
+        user_id: Any = None,
+        tenant_id: Any = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        old_values: Optional[Dict[str, Any]] = None,
+        new_values: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Queue one audit event.
+
+        Returns:
+            bool: False if the event was dropped because the queue stayed full
+        """
+        event = {
+            "EventID": str(uuid4()),
+            "UserID": user_id,
+            "TenantID": tenant_id,
+            "Action": action,
+            "EntityType": entity_type,
+            "EntityID": str(entity_id) if entity_id is not None else None,
+            "OldValues": old_values,
+            "NewValues": new_values,
+            "IPAddress": ip_address,
+            "UserAgent": user_agent,
+            # Stamped now, not when the batch reaches the database
+            "CreatedAt": datetime.utcnow(),
+            "AdditionalData": additional_data,
+        }
+        return await self.enqueue(event)
+
+    async def enqueue(self, event: AuditEvent) -> bool:
+        """Queue a prepared ``AuditLogs`` row, waiting for room if needed."""
+        if not self.running:
+            await self._flush([event])
+            return True
+
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(event), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                AUDIT_EVENTS_DROPPED.labels(reason="queue_full").inc()
+                logger.error(f"Audit queue full, dropped event {event['Action']}")
+                return False
+        AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+        return True
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = loop.create_task(self._run())
+        if self.spool is not None:
+            self._replay_task = loop.create_task(self._replay_forever())
+
+    async def stop(self) -> None:
+        """Flush queued events and stop the writer and replay tasks."""
+        if not self.running:
+            return
+        # The sentinel may wait for room, which the running task makes
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        if self._replay_task is not None:
+            # Anything not yet replayed stays in the spool for the next start
+            self._replay_task.cancel()
+            try:
+                await self._replay_task
+            except asyncio.CancelledError:
+                pass
+            self._replay_task = None
+
+    async def _run(self) -> None:
+        """Collect events into batches and write them until stopped."""
+        if self.spool is not None:
+            await run_blocking(self.spool.open)
+        stopping = False
+        while not stopping:
+            batch: List[AuditEvent] = []
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch.append(first)
+
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is _STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[AuditEvent]) -> None:
+        """Write a batch, spooling it instead of raising on failure."""
+        start = time.perf_counter()
+        try:
+            if self.spool is None or not self.spool.pending:
+                try:
+                    await self._write_batch(batch)
+                    AUDIT_EVENTS_WRITTEN.inc(len(batch))
+                    return
+                except Exception as e:
+                    logger.error(f"Error writing {len(batch)} audit events: {str(e)}")
+
+            if self.spool is None:
+                AUDIT_EVENTS_DROPPED.labels(reason="write_failed").inc(len(batch))
+                return
+            try:
+                await run_blocking(self.spool.append, batch)
+            except Exception as e:
+                AUDIT_EVENTS_DROPPED.labels(reason="spool_failed").inc(len(batch))
+                logger.error(f"Error spooling {len(batch)} audit events: {str(e)}")
+        finally:
+            AUDIT_FLUSH_DURATION.observe(time.perf_counter() - start)
+
+    async def replay_spool(self) -> int:
+        """
+        Replay sealed spool segments to the database, oldest first.
+
+        Returns:
+            int: Number of events replayed
+
+        Raises:
+            Exception: If the database is still unavailable; segments that
+                were not fully replayed are kept and retried later
+        """
+        replayed = 0
+        while True:
+            path = await run_blocking(self.spool.oldest_segment)
+            if path is None:
+                return replayed
+            events = await run_blocking(self.spool.read_segment, path)
+            for offset in range(0, len(events), self.batch_size):
+                chunk = events[offset:offset + self.batch_size]
+                written = await self._write_batch(chunk, skip_existing=True)
+                AUDIT_SPOOL_REPLAYED.labels(result="written").inc(written)
+                AUDIT_SPOOL_REPLAYED.labels(result="duplicate").inc(len(chunk) - written)
+            await run_blocking(self.spool.remove_segment, path)
+            replayed += len(events)
+            logger.info(f"Replayed {len(events)} spooled audit events")
+
+    async def _replay_forever(self) -> None:
+        """Replay the spool every ``replay_interval`` seconds while it has events."""
+        while True:
+            await asyncio.sleep(self.replay_interval)
+            try:
+                if self.spool.pending:
+                    await self.replay_spool()
+            except Exception as e:
+                logger.error(f"Audit spool replay failed: {str(e)}")
+
+    async def _write_batch(self, batch: List[AuditEvent], skip_existing: bool = False) -> int:
+        """
+        Insert a batch of rows in one executemany and one commit.
+
+        Args:
+            batch: ``AuditLogs`` rows
+            skip_existing: Skip rows whose EventID is already stored (replay)
+
+        Returns:
+            int: Number of rows inserted
+        """
+        session_factory = self._session_factory
+        if session_factory is None:
+            # Imported here so that importing the writer does not create engines
+            from app.core.db.session import AsyncSessionLocal
+            session_factory = AsyncSessionLocal
+        async with session_factory() as session:
+            if skip_existing:
+                result = await session.execute(
+                    select(AuditLog.EventID)
+                    .where(AuditLog.EventID.in_([event["EventID"] for event in batch]))
+                )
+                stored = set(result.scalars().all())
+                batch = [event for event in batch if event["EventID"] not in stored]
+            if batch:
+                await session.execute(insert(AuditLog), batch)
+                await session.commit()
+        return len(batch)
+
+
+settings = get_settings()
+
+# Shared audit writer, started and stopped by the application lifespan
+audit_writer = AuditWriter(
+    queue_size=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+    enqueue_timeout=settings.AUDIT_ENQUEUE_TIMEOUT,
+    spool=AuditSpool(settings.AUDIT_SPOOL_DIR, settings.AUDIT_SPOOL_SEGMENT_BYTES),
+    replay_interval=settings.AUDIT_SPOOL_REPLAY_INTERVAL
+)
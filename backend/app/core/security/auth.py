@@ -6,8 +6,10 @@ from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import HTTPException, status
 from jose import jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
+from app.core.concurrency.executor import run_crypto
 from app.core.security.password import get_password_hash, verify_password
 from app.models.master.user import User
 from app.schemas.master.user import UserCreate
@@ -18,10 +20,10 @@ settings = get_settings()
 class SecurityService:
     """Security service for authentication and authorization."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def authenticate_user(self, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """
         Authenticate user with username and password.
         
@@ -33,18 +35,18 @@ class SecurityService:
             User if authenticated, None otherwise
         """
         # Try to find user by username or email
-        user = (
-            self.db.query(User)
-            .filter(
+        result = await self.db.execute(
+            select(User)
+            .where(
                 (User.username == username) | (User.email == username)
             )
-            .first()
         )
+        user = result.scalars().first()
         
         if not user:
             return None
             
-        if not verify_password(password, user.hashed_password):
+        if not await run_crypto(verify_password, password, user.hashed_password):
             return None
             
         return user
@@ -81,7 +83,7 @@ class SecurityService:
             algorithm=settings.jwt_algorithm
         )
 
-    def create_user(self, user_data: UserCreate) -> User:
+    async def create_user(self, user_data: UserCreate) -> User:
         """
         Create new user.
         
@@ -92,39 +94,38 @@ class SecurityService:
             Created user
         """
         # Check if username exists
-        if (
-            self.db.query(User)
-            .filter(User.username == user_data.username)
-            .first()
-        ):
+        result = await self.db.execute(
+            select(User).where(User.username == user_data.username)
+        )
+        if result.scalars().first():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already registered"
             )
 
         # Check if email exists
-        if (
-            self.db.query(User)
-            .filter(User.email == user_data.email)
-            .first()
-        ):
+        result = await self.db.execute(
+            select(User).where(User.email == user_data.email)
+        )
+        if result.scalars().first():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
 
         # Create user
+        hashed_password = await run_crypto(get_password_hash, user_data.password)
         db_user = User(
             username=user_data.username,
             email=user_data.email,
-            hashed_password=get_password_hash(user_data.password),
+            hashed_password=hashed_password,
             is_active=user_data.is_active,
             is_superuser=user_data.is_superuser,
             tenant_id=user_data.tenant_id
         )
         
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
         
         return db_user
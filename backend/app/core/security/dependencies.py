@@ -4,23 +4,29 @@ from typing import Optional, List, Annotated
 from fastapi import Depends, HTTPException, status, Request, Header
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-from app.core.db.session import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.session import get_async_db
 from app.core.security.auth import SecurityService
 from app.core.tenant.context import TenantContext
 from app.services.master.user import UserService
 from app.models.master.user import User
-from app.core.cache.redis import RedisCache, get_redis_client
+from app.core.cache.redis import get_redis_cache
+from app.core.security.principal_cache import principal_cache
+from app.core.security.rate_limit import (
+    RATE_LIMIT_ALGORITHMS,
+    RateLimitConfig,
+    create_rate_limiter,
+)
 from app.schemas.master.user import TokenData
 from app.core.config.settings import get_settings
-import time
 
 settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
 def get_security_service(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> SecurityService:
     """
     Get security service instance.
@@ -28,61 +34,63 @@ def get_security_service(
     return SecurityService(db)
 
 
-def rate_limit(max_requests: int, window_seconds: int):
+def rate_limit(
+    max_requests: int,
+    window_seconds: int,
+    algorithm: str = "sliding_window"
+):
     """
     Rate limiting dependency.
     
     Args:
         max_requests: Maximum number of requests allowed in the time window
         window_seconds: Time window in seconds
+        algorithm: ``sliding_window`` (smooth limit, constant memory per
+            key) or ``token_bucket`` (allows bursts of ``max_requests``)
         
     Returns:
         Dependency function
     """
-    async def dependency(
-        request: Request,
-        redis: RedisCache = Depends(get_redis_client)
-    ):
+    config = RateLimitConfig(
+        requests_per_minute=max_requests,
+        burst_size=max_requests,
+        window_size=window_seconds
+    )
+    # Validate the algorithm when the route is declared
+    if algorithm not in RATE_LIMIT_ALGORITHMS:
+        raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+    limiter = None
+
+    async def dependency(request: Request):
+        nonlocal limiter
+        if limiter is None:
+            limiter = create_rate_limiter(get_redis_cache(), config, algorithm)
+
         # Get client IP or use test client IP if None
         client_ip = request.client.host if request.client else "test-client"
-        
-        # Create Redis key
-        key = f"rate_limit:{client_ip}:{request.url.path}"
-        
-        # Get current timestamp
-        now = int(time.time())
-        
-        # Get request count in window
-        window_start = now - window_seconds
-        
-        # Remove old requests
-        await redis.zremrangebyscore(key, 0, window_start)
-        
-        # Count requests in window
-        request_count = await redis.zcard(key)
-        
-        if request_count >= max_requests:
+        key = f"{client_ip}:{request.url.path}"
+
+        is_allowed, info = await limiter.check_rate_limit(key)
+        if not is_allowed:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many requests"
+                detail="Too many requests",
+                headers={"Retry-After": str(info.reset)}
             )
-            
-        # Add current request
-        await redis.zadd(key, {str(now): now})
-        
-        # Set expiry
-        await redis.expire(key, window_seconds)
         
     return dependency
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """
     Get current authenticated user from token.
 
+    The user is served from the principal cache when possible, so most
+    requests run no user query.
+
     Args:
         token: JWT token
         db: Database session
@@ -115,7 +123,14 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.username == token_data.username).first()
+    async def load_user():
+        result = await db.execute(
+            select(User).where(User.Email == token_data.username)
+        )
+        return result.scalars().first()
+
+    # Login puts the user's email in ``sub``
+    user = await principal_cache.get(db, f"email:{token_data.username}", load_user)
     if user is None:
         raise credentials_exception
     return user
@@ -136,7 +151,7 @@ async def get_current_active_user(
     Raises:
         HTTPException: If user is inactive
     """
-    if not current_user.is_active:
+    if not current_user.IsActive:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
@@ -156,7 +171,7 @@ async def get_current_admin_user(
     Raises:
         HTTPException: If user is not admin
     """
-    if not current_user.is_superuser:
+    if not current_user.IsSuperuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough privileges"
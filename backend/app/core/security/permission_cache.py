@@ -0,0 +1,176 @@
+"""
+Permission Cache
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, FrozenSet, Iterable, Tuple
+import json
+import logging
+import time
+
+import redis.asyncio as redis
+from app.core.cache.redis import get_redis_client
+from app.core.config.settings import get_settings
+from app.core.monitoring.metrics import PERMISSION_CACHE_HITS, PERMISSION_CACHE_MISSES
+
+logger = logging.getLogger(__name__)
+
+PermissionSet = FrozenSet[str]
+_CacheKey = Tuple[str, str]
+
+
+class PermissionCache:
+    """
+    Two-tier cache of effective permission codes per (user, tenant).
+
+    Features:
+    1. In-process LRU with a short TTL in front of Redis
+    2. Redis entries tagged with the tenant and user versions they were
+       resolved at; a version bump makes every older entry stale
+    3. ``bump_tenant`` after role or role-permission changes and
+       ``bump_user`` after role assignment changes
+    4. Redis failures fall back to the loader instead of failing the check
+
+    Bumps clear matching local entries immediately in this process; other
+    processes pick them up once their local entries expire
+    (``local_ttl`` seconds). The cache is used from the event loop only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        local_ttl: float,
+        ttl: int,
+        client_factory: Callable[[], redis.Redis] = get_redis_client
+    ):
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.ttl = ttl
+        self._client_factory = client_factory
+        self._entries: "OrderedDict[_CacheKey, Tuple[PermissionSet, float]]" = OrderedDict()
+
+    @property
+    def client(self) -> redis.Redis:
+        """Redis client (the shared pool by default)."""
+        return self._client_factory()
+
+    @staticmethod
+    def _tenant_version_key(tenant_id: Any) -> str:
+        return f"perm:ver:tenant:{tenant_id}"
+
+    @staticmethod
+    def _user_version_key(user_id: Any) -> str:
+        return f"perm:ver:user:{user_id}"
+
+    @staticmethod
+    def _set_key(user_id: Any, tenant_id: Any) -> str:
+        return f"perm:set:{tenant_id}:{user_id}"
+
+    async def get(
+        self,
+        user_id: Any,
+        tenant_id: Any,
+        loader: Callable[[], Awaitable[Iterable[str]]]
+    ) -> PermissionSet:
+        """
+        Get the permission codes of a user in a tenant.
+
+        Args:
+            user_id: User ID
+            tenant_id: Tenant ID
+            loader: Coroutine function resolving the codes from the database
+
+        Returns:
+            PermissionSet: Effective permission codes
+        """
+        key = (str(user_id), str(tenant_id))
+        entry = self._entries.get(key)
+        if entry is not None:
+            codes, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                PERMISSION_CACHE_HITS.labels(tier="local").inc()
+                return codes
+            del self._entries[key]
+
+        version = None
+        try:
+            # Versions and the cached set in one round trip
+            tenant_version, user_version, cached = await self.client.mget(
+                self._tenant_version_key(tenant_id),
+                self._user_version_key(user_id),
+                self._set_key(user_id, tenant_id)
+            )
+            version = [int(tenant_version or 0), int(user_version or 0)]
+            if cached:
+                payload = json.loads(cached)
+                if payload["v"] == version:
+                    codes = frozenset(payload["codes"])
+                    self._store_local(key, codes)
+                    PERMISSION_CACHE_HITS.labels(tier="redis").inc()
+                    return codes
+        except Exception as e:
+            logger.error(f"Error reading permission cache from Redis: {str(e)}")
+
+        PERMISSION_CACHE_MISSES.inc()
+        codes = frozenset(await loader())
+        self._store_local(key, codes)
+
+        # Versions were read before loading, so a concurrent bump leaves
+        # this entry stale instead of resurrecting old permissions
+        if version is not None:
+            try:
+                await self.client.set(
+                    self._set_key(user_id, tenant_id),
+                    json.dumps({"v": version, "codes": sorted(codes)}),
+                    ex=self.ttl
+                )
+            except Exception as e:
+                logger.error(f"Error writing permission cache to Redis: {str(e)}")
+        return codes
+
+    def _store_local(self, key: _CacheKey, codes: PermissionSet) -> None:
+        """Store an entry in the in-process LRU."""
+        self._entries[key] = (codes, time.monotonic() + self.local_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def bump_tenant(self, tenant_id: Any) -> None:
+        """Invalidate every cached permission set of a tenant."""
+        tenant = str(tenant_id)
+        for key in [key for key in self._entries if key[1] == tenant]:
+            del self._entries[key]
+        await self._bump(self._tenant_version_key(tenant_id))
+
+    async def bump_user(self, user_id: Any) -> None:
+        """Invalidate every cached permission set of a user."""
+        user = str(user_id)
+        for key in [key for key in self._entries if key[0] == user]:
+            del self._entries[key]
+        await self._bump(self._user_version_key(user_id))
+
+    async def _bump(self, version_key: str) -> None:
+        try:
+            await self.client.incr(version_key)
+        except Exception as e:
+            logger.error(f"Error bumping permission cache version {version_key}: {str(e)}")
+
+    def clear_local(self) -> None:
+        """Drop every in-process entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+settings = get_settings()
+
+# Shared permission cache for every PermissionChecker in the process
+permission_cache = PermissionCache(
+    max_entries=settings.PERMISSION_CACHE_SIZE,
+    local_ttl=settings.PERMISSION_CACHE_LOCAL_TTL,
+    ttl=settings.PERMISSION_CACHE_TTL
+)
@@ -1,7 +1,11 @@
-from typing import Optional
+from typing import FrozenSet, List, Optional
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.concurrency.executor import run_blocking
 from app.core.db.session import get_db
+from app.core.security.permission_cache import PermissionCache, permission_cache
+from app.models.master.association_tables import RolePermissions, UserRoles
 from app.models.master.user import User
 from app.models.master.permission import Permission
 from app.models.master.role import Role
@@ -10,8 +14,9 @@ from app.models.master.role import Role
 class PermissionChecker:
     """Check user permissions in specific tenant context."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, cache: PermissionCache = permission_cache):
         self.db = db
+        self.cache = cache
 
     async def check_permission(
         self,
@@ -30,21 +35,42 @@ class PermissionChecker:
         Returns:
             bool: True if user has permission, False otherwise
         """
-        # Get user's roles in tenant
-        user = self.db.query(User).filter(User.user_id == user_id).first()
-        if not user:
-            return False
-
-        # Check if any of user's roles has the required permission
-        for role in user.roles:
-            if role.tenant_id != tenant_id:
-                continue
-            
-            for permission in role.permissions:
-                if permission.code == permission_code:
-                    return True
-
-        return False
+        permissions = await self.get_permissions(user_id, tenant_id)
+        return permission_code in permissions
+
+    async def get_permissions(self, user_id: int, tenant_id: int) -> FrozenSet[str]:
+        """
+        Get the effective permission codes of a user in a tenant.
+
+        Args:
+            user_id: User ID
+            tenant_id: Tenant ID
+
+        Returns:
+            FrozenSet[str]: Permission codes granted by the user's roles
+        """
+        async def load() -> List[str]:
+            # The lookup uses the sync session, so keep it off the event loop
+            return await run_blocking(self._load_permissions, user_id, tenant_id)
+
+        return await self.cache.get(user_id, tenant_id, load)
+
+    def _load_permissions(self, user_id: int, tenant_id: int) -> List[str]:
+        """Resolve permission codes in one query (runs on the db executor)."""
+        rows = self.db.execute(
+            select(Permission.Code)
+            .distinct()
+            .join(RolePermissions, RolePermissions.c.PermissionID == Permission.PermissionID)
+            .join(Role, Role.RoleID == RolePermissions.c.RoleID)
+            .join(UserRoles, UserRoles.c.RoleID == Role.RoleID)
+            .where(
+                UserRoles.c.UserID == user_id,
+                Role.TenantID == tenant_id,
+                Role.IsDeleted == False,
+                Permission.IsDeleted == False
+            )
+        )
+        return list(rows.scalars().all())
 
     async def require_permission(
         self,
@@ -64,7 +90,7 @@ class PermissionChecker:
             HTTPException: If user doesn't have required permission
         """
         # Superusers bypass permission check
-        if user.is_superuser:
+        if user.IsSuperuser:
             return
 
         if not tenant_id:
@@ -74,7 +100,7 @@ class PermissionChecker:
             )
 
         has_permission = await self.check_permission(
-            user.user_id,
+            user.UserID,
             tenant_id,
             permission_code
         )
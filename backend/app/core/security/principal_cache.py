@@ -0,0 +1,193 @@
+"""
+Principal Cache
+Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
+All rights reserved.
+"""
+
+from collections import OrderedDict
+from typing import Awaitable, Callable, Iterable, Optional, Tuple, Type
+import logging
+import time
+
+import redis.asyncio as redis
+from app.core.cache.read_through import SERIALIZERS, Row, from_row, to_row
+from app.core.cache.redis import get_redis_client
+from app.core.config.settings import get_settings
+from app.core.monitoring.metrics import PRINCIPAL_CACHE_HITS, PRINCIPAL_CACHE_MISSES
+from app.models.master.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCache:
+    """
+    Two-tier cache of the user behind a token subject.
+
+    Subjects are namespaced by the claim they hold (``email:...`` or
+    ``username:...``), since the two login flows put different user
+    columns in ``sub``.
+
+    Features:
+    1. In-process LRU with a short TTL in front of Redis
+    2. Redis entries tagged with the subject version they were loaded at;
+       ``invalidate`` bumps the version, making every older entry stale
+    3. Rows are merged into the request's session with ``load=False``,
+       so a hit issues no SQL and each request gets its own instance
+    4. Redis failures fall back to the loader instead of failing the
+       request; unknown subjects are never cached
+    5. Columns in ``exclude`` (the password hash by default) are never
+       cached and are not loaded on cached principals
+
+    Invalidation clears matching local entries immediately in this
+    process; other processes pick it up once their local entries expire
+    (``local_ttl`` seconds). The cache is used from the event loop only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        local_ttl: float,
+        ttl: int,
+        serializer: str = "json",
+        model: Type = User,
+        client_factory: Callable[[], redis.Redis] = get_redis_client,
+        exclude: Iterable[str] = ("HashedPassword",)
+    ):
+        self.model = model
+        self.exclude = frozenset(exclude)
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.ttl = ttl
+        self.serializer = SERIALIZERS[serializer]()
+        self._client_factory = client_factory
+        self._entries: "OrderedDict[str, Tuple[Row, float]]" = OrderedDict()
+
+    @property
+    def client(self) -> redis.Redis:
+        """Redis client (the shared pool by default)."""
+        return self._client_factory()
+
+    @staticmethod
+    def subjects(user: User) -> Tuple[str, ...]:
+        """Every subject a token for ``user`` may carry."""
+        return (f"email:{user.Email}", f"username:{user.Username}")
+
+    @staticmethod
+    def _version_key(subject: str) -> str:
+        return f"principal:ver:{subject}"
+
+    @staticmethod
+    def _entry_key(subject: str) -> str:
+        return f"principal:{subject}"
+
+    async def get(
+        self,
+        db,
+        subject: str,
+        loader: Callable[[], Awaitable[Optional[User]]]
+    ) -> Optional[User]:
+        """
+        Get the user behind a token subject.
+
+        Args:
+            db: Request session the user is attached to
+            subject: Namespaced subject, e.g. ``email:ana@example.com``
+            loader: Coroutine function loading the user from ``db``
+
+        Returns:
+            Optional[User]: User, or None if the subject is unknown
+        """
+        entry = self._entries.get(subject)
+        if entry is not None:
+            row, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(subject)
+                PRINCIPAL_CACHE_HITS.labels(tier="local").inc()
+                return await from_row(db, self.model, row, self.exclude)
+            del self._entries[subject]
+
+        version = None
+        try:
+            # Version and cached row in one round trip
+            current, cached = await self.client.mget(
+                self._version_key(subject),
+                self._entry_key(subject)
+            )
+            version = int(current or 0)
+            if cached:
+                payload = self.serializer.loads(cached)
+                if payload["v"] == version:
+                    user = await from_row(db, self.model, payload["row"], self.exclude)
+                    # Store the typed columns, not the decoded JSON
+                    self._store_local(subject, to_row(self.model, user, self.exclude))
+                    PRINCIPAL_CACHE_HITS.labels(tier="redis").inc()
+                    return user
+        except Exception as e:
+            logger.error(f"Error reading principal cache from Redis: {str(e)}")
+
+        PRINCIPAL_CACHE_MISSES.inc()
+        user = await loader()
+        row = to_row(self.model, user, self.exclude) if user is not None else None
+        if row is None:
+            return user
+        self._store_local(subject, row)
+
+        # The version was read before loading, so a concurrent
+        # invalidation leaves this entry stale instead of reviving it
+        if version is not None:
+            try:
+                await self.client.set(
+                    self._entry_key(subject),
+                    self.serializer.dumps({"v": version, "row": row}),
+                    ex=self.ttl
+                )
+            except Exception as e:
+                logger.error(f"Error writing principal cache to Redis: {str(e)}")
+        return user
+
+    def _store_local(self, subject: str, row: Optional[Row]) -> None:
+        """Store an entry in the in-process LRU."""
+        if row is None:
+            return
+        self._entries[subject] = (row, time.monotonic() + self.local_ttl)
+        self._entries.move_to_end(subject)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, *subjects: str) -> None:
+        """
+        Invalidate cached principals.
+
+        Call with ``subjects(user)`` after a user is updated, deactivated
+        or deleted, or their password changes. When the email or username
+        changes, include the subjects taken before the change too.
+        """
+        subjects = tuple(dict.fromkeys(subjects))
+        for subject in subjects:
+            self._entries.pop(subject, None)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for subject in subjects:
+                    pipe.incr(self._version_key(subject))
+                    pipe.expire(self._version_key(subject), self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error invalidating principal cache for {subjects}: {str(e)}")
+
+    def clear_local(self) -> None:
+        """Drop every in-process entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+settings = get_settings()
+
+# Shared principal cache for both get_current_user dependencies
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_SIZE,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    serializer=settings.CACHE_SERIALIZER
+)
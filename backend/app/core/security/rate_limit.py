@@ -4,17 +4,34 @@ Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
 All rights reserved.
 """
 
-from typing import Dict, Tuple, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Tuple, Optional
+import asyncio
+import math
 import time
-from fastapi import HTTPException, Request, status
+from fastapi import HTTPException, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 import logging
 from app.core.cache.redis import RedisCache, get_redis_cache
+from app.core.config.settings import get_settings
+from app.core.middleware.asgi import send_with_headers
+from app.core.monitoring.metrics import RATE_LIMIT_DECISIONS
+from app.core.resilience.circuit_breaker import CircuitBreaker
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# Shared by every Redis-backed limiter in this process
+redis_breaker = CircuitBreaker(
+    failure_threshold=settings.RATE_LIMIT_BREAKER_FAILURES,
+    recovery_timeout=settings.RATE_LIMIT_BREAKER_RECOVERY,
+    half_open_timeout=settings.RATE_LIMIT_BREAKER_RECOVERY
+)
+
 class RateLimitConfig(BaseModel):
     """Configuration for rate limiting"""
     requests_per_minute: int = 60
@@ -28,7 +45,260 @@ class RateLimitInfo(BaseModel):
     limit: int
     used: int
 
-class RateLimiter:
+# Token bucket in one round trip. Refill uses the Redis server clock so
+# every worker sees the same time.
+# KEYS[1] bucket hash; ARGV: capacity, refill rate (tokens/s), cost,
+# lease (tokens to take when allowed, at least cost; defaults to cost)
+# Returns {allowed (0/1), remaining tokens, seconds until reset, tokens taken}
+TOKEN_BUCKET_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local lease = tonumber(ARGV[4]) or cost
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local taken = 0
+if tokens >= cost then
+    taken = math.max(cost, math.min(lease, math.floor(tokens)))
+    tokens = tokens - taken
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+
+local missing = capacity - tokens
+if allowed == 0 then
+    missing = cost - tokens
+end
+return {allowed, math.floor(tokens), math.ceil(missing / rate), taken}
+"""
+
+
+# Sliding window counter: one hash per key holding the request count of
+# the current and the previous fixed window, so memory per key is
+# constant. The previous window is weighted by how much of it still
+# overlaps the sliding window.
+# KEYS[1] counter hash; ARGV: limit, window (seconds), cost
+# Returns {allowed (0/1), remaining requests, seconds until reset}
+SLIDING_WINDOW_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local current = math.floor(now / window)
+local elapsed = now - current * window
+local counts = redis.call('HMGET', KEYS[1], current, current - 1)
+local count = tonumber(counts[1]) or 0
+local previous = tonumber(counts[2]) or 0
+local weight = previous * (window - elapsed) / window
+local estimate = weight + count
+
+local allowed = 0
+if estimate + cost <= limit then
+    count = redis.call('HINCRBY', KEYS[1], current, cost)
+    estimate = weight + count
+    allowed = 1
+end
+
+if redis.call('HLEN', KEYS[1]) > 2 then
+    for _, field in ipairs(redis.call('HKEYS', KEYS[1])) do
+        if tonumber(field) < current - 1 then
+            redis.call('HDEL', KEYS[1], field)
+        end
+    end
+end
+redis.call('EXPIRE', KEYS[1], window * 2)
+
+-- Time until the weighted previous window has decayed enough for cost
+local reset = window - elapsed
+local excess = estimate + cost - limit
+if allowed == 0 and previous > 0 and excess <= weight then
+    reset = excess * window / previous
+end
+return {allowed, math.max(0, math.floor(limit - estimate)), math.ceil(reset)}
+"""
+
+
+class RedisUnavailableError(Exception):
+    """Raised instead of calling Redis while the circuit breaker is open"""
+
+
+class LocalRateLimiter:
+    """
+    In-process token buckets used while Redis is unavailable.
+
+    Each worker only knows its own traffic, so it enforces its share of
+    the limit: ``capacity`` and ``rate`` are already divided by the
+    number of workers. A bucket always holds at least one token so small
+    limits split across many workers do not block every request.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        rate: float,
+        limit: int,
+        max_keys: int = 10000
+    ):
+        self.capacity = max(capacity, 1.0)
+        self.rate = rate
+        self.limit = limit
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    def check_rate_limit(
+        self,
+        key: str,
+        cost: int = 1
+    ) -> Tuple[bool, RateLimitInfo]:
+        """
+        Check and update the local bucket for a key.
+
+        Args:
+            key: Unique identifier for the client/endpoint
+            cost: Cost of the current request (default: 1)
+
+        Returns:
+            Tuple[bool, RateLimitInfo]: (is_allowed, rate_limit_info)
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [self.capacity, now]
+            self._buckets[key] = bucket
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        tokens = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        bucket[0], bucket[1] = tokens, now
+
+        missing = (self.capacity - tokens) if allowed else (cost - tokens)
+        info = RateLimitInfo(
+            remaining=int(tokens),
+            reset=math.ceil(missing / self.rate) if self.rate else 0,
+            limit=self.limit,
+            used=int(self.capacity - tokens)
+        )
+        return allowed, info
+
+
+class RedisRateLimiter(ABC):
+    """
+    Base class for rate limiters backed by Redis.
+
+    Subclasses implement ``fallback_limits`` and ``_check``.
+
+    Redis calls go through a circuit breaker and a timeout. When a call
+    fails, times out, or the breaker is open, the check is answered by
+    a ``LocalRateLimiter`` enforcing this worker's share of the limit
+    instead of failing open. While the breaker is open, Redis is not
+    called at all, so a dead server does not add a connect timeout to
+    every request.
+    """
+
+    def __init__(
+        self,
+        redis: RedisCache,
+        config: RateLimitConfig = RateLimitConfig(),
+        breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[float] = None,
+        workers: Optional[int] = None
+    ):
+        self.redis = redis
+        self.config = config
+        self.breaker = breaker or redis_breaker
+        self.timeout = timeout if timeout is not None else settings.RATE_LIMIT_REDIS_TIMEOUT
+        share = 1 / max(workers or settings.RATE_LIMIT_WORKERS, 1)
+        capacity, rate = self.fallback_limits()
+        self.fallback = LocalRateLimiter(
+            capacity=capacity * share,
+            rate=rate * share,
+            limit=config.requests_per_minute
+        )
+
+    @abstractmethod
+    def fallback_limits(self) -> Tuple[float, float]:
+        """Bucket capacity and refill rate (tokens/s) of the whole limit."""
+
+    async def call_redis(self, func: Callable[..., Awaitable], *args):
+        """
+        Run a Redis operation through the circuit breaker.
+
+        Raises:
+            RedisUnavailableError: If the breaker is open
+            Exception: Whatever the operation raised, or asyncio.TimeoutError
+        """
+        if not self.breaker.can_execute():
+            raise RedisUnavailableError("Rate limit circuit breaker is open")
+        try:
+            result = await asyncio.wait_for(func(*args), self.timeout)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def check_rate_limit(
+        self,
+        key: str,
+        cost: int = 1
+    ) -> Tuple[bool, RateLimitInfo]:
+        """
+        Check if request is within rate limits.
+        
+        Args:
+            key: Unique identifier for the client/endpoint
+            cost: Cost of the current request (default: 1)
+            
+        Returns:
+            Tuple[bool, RateLimitInfo]: (is_allowed, rate_limit_info)
+        """
+        try:
+            result = await self.call_redis(self._check, key, cost)
+        except Exception as e:
+            return self.check_fallback(key, cost, e)
+        RATE_LIMIT_DECISIONS.labels(source="redis").inc()
+        return result
+
+    def check_fallback(
+        self,
+        key: str,
+        cost: int,
+        error: Exception
+    ) -> Tuple[bool, RateLimitInfo]:
+        """Answer a check from the local limiter after a Redis failure."""
+        if not isinstance(error, RedisUnavailableError):
+            logger.error(f"Rate limit check failed, using local limits: {str(error)}")
+        RATE_LIMIT_DECISIONS.labels(source="fallback").inc()
+        return self.fallback.check_rate_limit(key, cost)
+
+    @abstractmethod
+    async def _check(self, key: str, cost: int) -> Tuple[bool, RateLimitInfo]:
+        """Check and update the shared limit in Redis."""
+
+
+class RateLimiter(RedisRateLimiter):
     """
     Redis-based rate limiter using the Token Bucket algorithm.
     
@@ -37,15 +307,187 @@ class RateLimiter:
     2. Implements Token Bucket algorithm for burst handling
     3. Provides detailed rate limit information in headers
     4. Supports different limits per endpoint/user
+
+    The bucket is checked and updated by a Lua script (EVALSHA, SHA
+    cached by the client), so a check is a single atomic round trip and
+    concurrent requests cannot overdraw the bucket.
     """
 
     def __init__(
         self,
         redis: RedisCache,
-        config: RateLimitConfig = RateLimitConfig()
+        config: RateLimitConfig = RateLimitConfig(),
+        **kwargs
     ):
-        self.redis = redis
-        self.config = config
+        super().__init__(redis, config, **kwargs)
+        self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added to a bucket per second."""
+        return self.config.requests_per_minute / self.config.window_size
+
+    def fallback_limits(self) -> Tuple[float, float]:
+        return self.config.burst_size, self.refill_rate
+
+    async def _check(self, key: str, cost: int) -> Tuple[bool, RateLimitInfo]:
+        allowed, _, info = await self.take(key, cost)
+        return allowed, info
+
+    async def take(
+        self,
+        key: str,
+        cost: int = 1,
+        lease: Optional[int] = None
+    ) -> Tuple[bool, int, RateLimitInfo]:
+        """
+        Take tokens from the bucket in one round trip.
+
+        Args:
+            key: Unique identifier for the client/endpoint
+            cost: Tokens the current request needs
+            lease: Tokens to take if allowed (at least cost, at most what is left)
+
+        Returns:
+            Tuple[bool, int, RateLimitInfo]: (is_allowed, tokens_taken, rate_limit_info)
+
+        Raises:
+            redis.RedisError: If Redis cannot be reached
+        """
+        allowed, remaining, reset, taken = await self._script(
+            keys=[f"ratelimit:{key}:bucket"],
+            args=[self.config.burst_size, self.refill_rate, cost, lease or cost]
+        )
+        info = RateLimitInfo(
+            remaining=int(remaining),
+            reset=int(reset),
+            limit=self.config.requests_per_minute,
+            used=self.config.burst_size - int(remaining)
+        )
+        return bool(allowed), int(taken), info
+
+
+class SlidingWindowRateLimiter(RedisRateLimiter):
+    """
+    Redis-based rate limiter using the sliding window counter algorithm.
+
+    Allows ``requests_per_minute`` requests per ``window_size`` seconds,
+    estimated from two fixed-window counters. Unlike a sorted set of
+    request timestamps, a key uses constant memory and a check is O(1)
+    whatever the traffic. The estimate assumes requests in the previous
+    window were evenly spread, so it can be off when they were not.
+    """
+
+    def __init__(
+        self,
+        redis: RedisCache,
+        config: RateLimitConfig = RateLimitConfig(),
+        **kwargs
+    ):
+        super().__init__(redis, config, **kwargs)
+        self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+
+    def fallback_limits(self) -> Tuple[float, float]:
+        limit = self.config.requests_per_minute
+        return limit, limit / self.config.window_size
+
+    async def _check(self, key: str, cost: int) -> Tuple[bool, RateLimitInfo]:
+        allowed, remaining, reset = await self._script(
+            keys=[f"ratelimit:{key}:window"],
+            args=[self.config.requests_per_minute, self.config.window_size, cost]
+        )
+        info = RateLimitInfo(
+            remaining=int(remaining),
+            reset=int(reset),
+            limit=self.config.requests_per_minute,
+            used=self.config.requests_per_minute - int(remaining)
+        )
+        return bool(allowed), info
+
+
+RATE_LIMIT_ALGORITHMS = {
+    "token_bucket": RateLimiter,
+    "sliding_window": SlidingWindowRateLimiter,
+}
+
+
+def create_rate_limiter(
+    redis: RedisCache,
+    config: RateLimitConfig,
+    algorithm: str = "token_bucket"
+):
+    """
+    Create a rate limiter for the given algorithm.
+
+    Args:
+        redis: Redis cache
+        config: Limits to enforce
+        algorithm: ``token_bucket`` (allows bursts up to ``burst_size``)
+            or ``sliding_window`` (smooth limit per window)
+
+    Raises:
+        ValueError: If the algorithm is unknown
+    """
+    try:
+        limiter_class = RATE_LIMIT_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+    return limiter_class(redis, config)
+
+
+class _Lease:
+    """Tokens taken from Redis and spent locally, or a cached denial."""
+
+    __slots__ = ("tokens", "expires_at", "info")
+
+    def __init__(self, tokens: int, expires_at: float, info: RateLimitInfo):
+        self.tokens = tokens
+        self.expires_at = expires_at
+        self.info = info
+
+
+class HybridRateLimiter:
+    """
+    In-process pre-filter in front of the Redis token bucket.
+
+    Each worker takes tokens from the shared Redis bucket in leases of up
+    to ``lease_size`` and spends them locally, so Redis is only called
+    when a lease runs out or expires after ``lease_ttl`` seconds. A
+    denial is also cached until the lease TTL or the bucket reset,
+    whichever is first.
+
+    Tokens are taken from Redis before they are spent, so the global
+    limit is never exceeded. Once a lease is spent and the bucket last
+    reported fewer tokens than the request costs, the key is refused
+    locally until the lease expires. Leased tokens that expire unused are lost,
+    which can make a key at most ``workers * lease_size`` tokens stricter
+    than the configured limit; ``lease_size`` bounds that error. Leases
+    are capped at a quarter of the bucket so one worker cannot hold all
+    of a small bucket.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        lease_size: int = 10,
+        lease_ttl: float = 1.0,
+        max_keys: int = 10000
+    ):
+        self.limiter = limiter
+        max_lease = max(1, limiter.config.burst_size // 4)
+        if lease_size > max_lease:
+            logger.warning(
+                f"Rate limit lease size {lease_size} exceeds a quarter of the burst size "
+                f"{limiter.config.burst_size}; using {max_lease}"
+            )
+        self.lease_size = max(1, min(lease_size, max_lease))
+        self.lease_ttl = lease_ttl
+        self.max_keys = max_keys
+        self._leases: "OrderedDict[str, _Lease]" = OrderedDict()
+
+    @property
+    def config(self) -> RateLimitConfig:
+        return self.limiter.config
 
     async def check_rate_limit(
         self,
@@ -53,67 +495,59 @@ class RateLimiter:
         cost: int = 1
     ) -> Tuple[bool, RateLimitInfo]:
         """
-        Check if request is within rate limits.
-        
+        Check if request is within rate limits, using the local lease when possible.
+
         Args:
             key: Unique identifier for the client/endpoint
             cost: Cost of the current request (default: 1)
-            
+
         Returns:
             Tuple[bool, RateLimitInfo]: (is_allowed, rate_limit_info)
         """
-        now = time.time()
-        window_key = f"ratelimit:{key}:window"
-        tokens_key = f"ratelimit:{key}:tokens"
+        now = time.monotonic()
+        lease = self._leases.get(key)
+        if lease is not None and lease.expires_at > now:
+            self._leases.move_to_end(key)
+            if lease.tokens >= cost:
+                lease.tokens -= cost
+                RATE_LIMIT_DECISIONS.labels(source="local").inc()
+                return True, self._local_info(lease)
+            if lease.tokens == 0 and lease.info.remaining < cost:
+                # The bucket had nothing left for this cost when last asked
+                RATE_LIMIT_DECISIONS.labels(source="local").inc()
+                return False, lease.info
 
         try:
-            # Get current window and tokens
-            window_start = float(await self.redis.get(window_key) or now)
-            current_tokens = int(await self.redis.get(tokens_key) or self.config.burst_size)
-
-            # Calculate token refill
-            elapsed = now - window_start
-            if elapsed > self.config.window_size:
-                window_start = now
-                current_tokens = self.config.burst_size
-            else:
-                refill = int((elapsed * self.config.requests_per_minute) / self.config.window_size)
-                current_tokens = min(
-                    self.config.burst_size,
-                    current_tokens + refill
-                )
-
-            # Check if we have enough tokens
-            is_allowed = current_tokens >= cost
-
-            if is_allowed:
-                current_tokens -= cost
-
-            # Update Redis
-            await self.redis.set(window_key, str(window_start), expire=self.config.window_size * 2)
-            await self.redis.set(tokens_key, str(current_tokens), expire=self.config.window_size * 2)
-
-            # Calculate rate limit info
-            reset_time = int(window_start + self.config.window_size - now)
-            info = RateLimitInfo(
-                remaining=current_tokens,
-                reset=reset_time,
-                limit=self.config.requests_per_minute,
-                used=self.config.burst_size - current_tokens
+            allowed, taken, info = await self.limiter.call_redis(
+                self.limiter.take,
+                key,
+                cost,
+                max(cost, self.lease_size)
             )
+        except Exception as e:
+            return self.limiter.check_fallback(key, cost, e)
+        RATE_LIMIT_DECISIONS.labels(source="redis").inc()
 
-            return is_allowed, info
+        ttl = self.lease_ttl if allowed else min(self.lease_ttl, max(info.reset, 0))
+        lease = _Lease(taken - cost if allowed else 0, now + ttl, info)
+        self._leases[key] = lease
+        self._leases.move_to_end(key)
+        while len(self._leases) > self.max_keys:
+            self._leases.popitem(last=False)
+        return allowed, self._local_info(lease) if allowed else info
 
-        except Exception as e:
-            logger.error(f"Rate limit check failed: {str(e)}")
-            return True, RateLimitInfo(
-                remaining=1,
-                reset=60,
-                limit=self.config.requests_per_minute,
-                used=0
-            )
+    @staticmethod
+    def _local_info(lease: _Lease) -> RateLimitInfo:
+        """Approximate info: tokens left in Redis plus tokens left in the lease."""
+        remaining = lease.info.remaining + lease.tokens
+        return RateLimitInfo(
+            remaining=remaining,
+            reset=lease.info.reset,
+            limit=lease.info.limit,
+            used=max(lease.info.used - lease.tokens, 0)
+        )
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Middleware to apply rate limiting to requests.
     
@@ -122,47 +556,69 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     2. Path-based rate limiting
     3. Detailed rate limit information in headers
     4. Configurable limits per endpoint
+
+    Pure ASGI: headers are added to the response start message and the
+    body is streamed through.
     """
 
-    def __init__(self, app, redis: Optional[RedisCache] = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, redis: Optional[RedisCache] = None):
+        self.app = app
         self.redis = redis or get_redis_cache()
-        self.limiter = RateLimiter(self.redis)
+        config = RateLimitConfig(
+            requests_per_minute=settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
+            burst_size=settings.RATE_LIMIT_BURST_SIZE,
+            window_size=settings.RATE_LIMIT_WINDOW_SIZE
+        )
+        self.limiter = HybridRateLimiter(
+            RateLimiter(self.redis, config),
+            lease_size=settings.RATE_LIMIT_LEASE_SIZE,
+            lease_ttl=settings.RATE_LIMIT_LEASE_TTL,
+            max_keys=settings.RATE_LIMIT_LOCAL_KEYS
+        )
+        # Probes and scrapes are never limited and never touch Redis
+        self.exclude_paths = frozenset(settings.RATE_LIMIT_EXCLUDE_PATHS)
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Apply rate limiting to the request"""
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
         # Get client identifier (IP + User ID if authenticated)
-        client_id = self._get_client_id(request)
+        client_id = self._get_client_id(scope)
         
         # Check rate limit
         is_allowed, info = await self.limiter.check_rate_limit(client_id)
         
         if not is_allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "detail": "Too many requests",
                     "retry_after": info.reset
                 }
             )
+            await response(scope, receive, send)
+            return
 
         # Add rate limit headers
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(info.limit)
-        response.headers["X-RateLimit-Remaining"] = str(info.remaining)
-        response.headers["X-RateLimit-Reset"] = str(info.reset)
-        
-        return response
+        headers = {
+            "X-RateLimit-Limit": str(info.limit),
+            "X-RateLimit-Remaining": str(info.remaining),
+            "X-RateLimit-Reset": str(info.reset),
+        }
+        await self.app(scope, receive, send_with_headers(send, headers))
 
-    def _get_client_id(self, request: Request) -> str:
+    def _get_client_id(self, scope: Scope) -> str:
         """Get unique identifier for the client"""
         # Get client IP
         client_ip = "test_client"
-        if request.client and request.client.host:
-            client_ip = request.client.host
+        client = scope.get("client")
+        if client and client[0]:
+            client_ip = client[0]
             
         # Add user ID if authenticated
-        user_id = getattr(request.state, "user_id", None)
+        user_id = scope.get("state", {}).get("user_id")
         if user_id:
             return f"{client_ip}:{user_id}"
             
@@ -1,71 +1,271 @@
-from datetime import datetime, timedelta
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException, Request
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import ResponseError
 import json
+import time
 import uuid
+from app.core.cache.redis import get_redis_client
 from app.core.config.settings import get_settings
 
 settings = get_settings()
 
+# Write last_activity and the index score only if the session still
+# exists, so a session ended or expired since it was read is not
+# recreated as a partial hash without a TTL
+TOUCH_SESSION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'last_activity', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[4])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', ARGV[5])
+redis.call('EXPIRE', KEYS[2], ARGV[6])
+return 1
+"""
+
+# Fields every stored session has
+SESSION_FIELDS = ("user_id", "tenant_id", "created_at", "last_activity")
+
 class SessionManager:
-    def __init__(self):
-        self.redis: Redis = Redis.from_url(settings.REDIS_URL)
+    """
+    Redis-backed user sessions.
+
+    Sessions are hashes at ``session:{id}``. Validating one costs a
+    single pipelined HGETALL + EXPIRE; ``last_activity`` (and the
+    session's score in the user index) is only written when it is older
+    than ``SESSION_ACTIVITY_INTERVAL`` seconds. Validated sessions are
+    also kept in a small in-process cache for ``SESSION_LOCAL_CACHE_TTL``
+    seconds, so bursts from one client do not reach Redis at all; a
+    session ended by another process stays valid here for at most that
+    long.
+
+    Besides the session, each user has a sorted set
+    ``user_sessions:{user_id}`` of session ids scored by last activity.
+    The set is written in the same MULTI/EXEC transaction as the session,
+    so listing a user's sessions or ending all of them only touches that
+    user's keys. Members older than the session timeout, or whose session
+    key is gone, are removed whenever the index is read or written.
+
+    Sessions stored by older versions as JSON strings, or hashes missing
+    a field, are treated as ended and deleted when they are read.
+    """
+
+    def __init__(self, redis: Optional[Redis] = None):
+        self._redis = redis
         self.session_timeout = settings.SESSION_TIMEOUT_MINUTES * 60  # Convert to seconds
+        self.activity_interval = settings.SESSION_ACTIVITY_INTERVAL
+        self.local_ttl = settings.SESSION_LOCAL_CACHE_TTL
+        self.local_size = settings.SESSION_LOCAL_CACHE_SIZE
+        self._local: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+        self._touch: Optional[AsyncScript] = None
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis or get_redis_client()
+
+    @property
+    def index_ttl(self) -> int:
+        # Index scores may lag the session by up to one activity interval
+        return self.session_timeout + self.activity_interval
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        return f"session:{session_id}"
+
+    @staticmethod
+    def _index_key(user_id: int) -> str:
+        return f"user_sessions:{user_id}"
+
+    @staticmethod
+    def _from_hash(data: Dict[str, str]) -> Optional[dict]:
+        """Session from its stored hash, or None if the hash is incomplete."""
+        if not data or any(field not in data for field in SESSION_FIELDS):
+            return None
+        session = dict(data)
+        try:
+            session["user_id"] = int(session["user_id"])
+        except ValueError:
+            return None
+        return session
+
+    @staticmethod
+    def _legacy_user_id(value: Optional[str]) -> Optional[int]:
+        """User of a session stored by older versions as a JSON string."""
+        try:
+            return int(json.loads(value)["user_id"])
+        except (TypeError, ValueError, KeyError):
+            return None
+
+    def _index(self, pipe, session_id: str, user_id: int) -> None:
+        """Queue the index update for a session on a pipeline."""
+        now = time.time()
+        index_key = self._index_key(user_id)
+        pipe.zadd(index_key, {session_id: now})
+        pipe.zremrangebyscore(index_key, "-inf", now - self.index_ttl)
+        pipe.expire(index_key, self.index_ttl)
+
+    def _cache_local(self, session_id: str, session: dict) -> None:
+        self._local[session_id] = (session, time.monotonic() + self.local_ttl)
+        self._local.move_to_end(session_id)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
 
     async def create_session(self, user_id: int, tenant_id: str) -> str:
         session_id = str(uuid.uuid4())
+        now = datetime.utcnow().isoformat()
         session_data = {
             "user_id": user_id,
             "tenant_id": tenant_id,
-            "created_at": datetime.utcnow().isoformat(),
-            "last_activity": datetime.utcnow().isoformat()
+            "created_at": now,
+            "last_activity": now
         }
-        
-        await self.redis.setex(
-            f"session:{session_id}",
-            self.session_timeout,
-            json.dumps(session_data)
-        )
-        
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._session_key(session_id), mapping=session_data)
+            pipe.expire(self._session_key(session_id), self.session_timeout)
+            self._index(pipe, session_id, user_id)
+            await pipe.execute()
+
         return session_id
 
     async def validate_session(self, session_id: str) -> dict:
-        session_data = await self.redis.get(f"session:{session_id}")
-        if not session_data:
+        cached = self._local.get(session_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return dict(cached[0])
+
+        key = self._session_key(session_id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hgetall(key)
+                pipe.expire(key, self.session_timeout)
+                data, _ = await pipe.execute()
+            session = self._from_hash(data)
+        except ResponseError:
+            # A session stored in an older format
+            data, session = True, None
+        if session is None:
+            self._local.pop(session_id, None)
+            if data:
+                await self.redis.delete(key)
             raise HTTPException(status_code=401, detail="Session expired")
-        
-        session = json.loads(session_data)
-        
-        # Update last activity
-        session["last_activity"] = datetime.utcnow().isoformat()
-        await self.redis.setex(
-            f"session:{session_id}",
-            self.session_timeout,
-            json.dumps(session)
+
+        # Update last activity at most once per interval
+        now = datetime.utcnow()
+        last_activity = datetime.fromisoformat(session["last_activity"])
+        if (now - last_activity).total_seconds() >= self.activity_interval:
+            session["last_activity"] = now.isoformat()
+            if not await self._touch_session(session_id, session):
+                # Ended or expired since it was read
+                self._local.pop(session_id, None)
+                raise HTTPException(status_code=401, detail="Session expired")
+
+        self._cache_local(session_id, session)
+        return dict(session)
+
+    async def _touch_session(self, session_id: str, session: dict) -> bool:
+        """Write last_activity and the index score; False if the session is gone."""
+        if self._touch is None:
+            self._touch = self.redis.register_script(TOUCH_SESSION_SCRIPT)
+        now = time.time()
+        touched = await self._touch(
+            keys=[self._session_key(session_id), self._index_key(session["user_id"])],
+            args=[
+                session["last_activity"],
+                self.session_timeout,
+                now,
+                session_id,
+                now - self.index_ttl,
+                self.index_ttl
+            ],
+            client=self.redis
         )
-        
-        return session
+        return bool(touched)
 
     async def end_session(self, session_id: str):
-        await self.redis.delete(f"session:{session_id}")
+        self._local.pop(session_id, None)
+        key = self._session_key(session_id)
+        try:
+            user_id = await self.redis.hget(key, "user_id")
+        except ResponseError:
+            # A session stored in an older format
+            user_id = self._legacy_user_id(await self.redis.get(key))
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._session_key(session_id))
+            if user_id:
+                pipe.zrem(self._index_key(int(user_id)), session_id)
+            await pipe.execute()
 
     async def get_active_sessions(self, user_id: int) -> list:
-        pattern = "session:*"
+        """List a user's live sessions from the per-user index."""
+        index_key = self._index_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(index_key, "-inf", time.time() - self.index_ttl)
+            pipe.zrange(index_key, 0, -1)
+            _, session_ids = await pipe.execute()
+        if not session_ids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hgetall(self._session_key(session_id))
+            values = await pipe.execute(raise_on_error=False)
         sessions = []
-        
-        async for key in self.redis.scan_iter(match=pattern):
-            session_data = await self.redis.get(key)
-            if session_data:
-                session = json.loads(session_data)
-                if session.get("user_id") == user_id:
-                    sessions.append({
-                        "session_id": key.decode().split(":")[1],
-                        **session
-                    })
+        missing = []
+        invalid = []
+        for session_id, data in zip(session_ids, values):
+            session = None if isinstance(data, Exception) else self._from_hash(data)
+            if session is not None:
+                sessions.append({"session_id": session_id, **session})
+                continue
+            missing.append(session_id)
+            if data:
+                invalid.append(self._session_key(session_id))
+        if missing:
+            # Sessions that expired, were deleted without the index, or
+            # were stored in an older format
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.zrem(index_key, *missing)
+                if invalid:
+                    pipe.delete(*invalid)
+                await pipe.execute()
         
         return sessions
 
+    async def end_all_sessions(
+        self,
+        user_id: int,
+        except_session_id: Optional[str] = None
+    ) -> int:
+        """
+        End every session of a user ("log out everywhere").
+
+        Args:
+            user_id: User whose sessions are ended
+            except_session_id: Session to keep, e.g. the caller's own
+
+        Returns:
+            int: Number of sessions ended
+        """
+        index_key = self._index_key(user_id)
+        session_ids: List[str] = [
+            sid for sid in await self.redis.zrange(index_key, 0, -1)
+            if sid != except_session_id
+        ]
+        if not session_ids:
+            return 0
+        for session_id in session_ids:
+            self._local.pop(session_id, None)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*[self._session_key(sid) for sid in session_ids])
+            pipe.zrem(index_key, *session_ids)
+            ended, _ = await pipe.execute()
+        return ended
+
 class SessionMiddleware:
     def __init__(self):
         self.session_manager = SessionManager()
@@ -2,20 +2,25 @@ import pyotp
 import qrcode
 import base64
 from io import BytesIO
-from typing import Tuple
+from typing import Optional, Tuple
 from datetime import datetime, timedelta
 from fastapi import HTTPException
 from redis.asyncio import Redis
+from app.core.cache.redis import get_redis_client
 from app.core.config.settings import get_settings
 
 settings = get_settings()
 
 class TwoFactorAuth:
-    def __init__(self):
-        self.redis: Redis = Redis.from_url(settings.REDIS_URL)
+    def __init__(self, redis: Optional[Redis] = None):
+        self._redis = redis
         self.backup_codes_count = 10
         self.backup_code_length = 10
         self.totp_issuer = settings.PROJECT_NAME
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis or get_redis_client()
     
     def generate_secret(self) -> str:
         """Generate a new TOTP secret"""
@@ -67,7 +72,7 @@ class TwoFactorAuth:
         secret = await self.redis.get(key)
         if not secret:
             raise HTTPException(status_code=400, detail="2FA setup expired")
-        return secret.decode()
+        return secret
     
     async def clear_temp_secret(self, user_id: int):
         """Clear temporary secret after 2FA setup"""
@@ -90,9 +95,12 @@ class TwoFactorAuth:
         await self.redis.delete(key)
 
 class TwoFactorMiddleware:
-    def __init__(self):
-        self.two_factor = TwoFactorAuth()
-        self.redis: Redis = Redis.from_url(settings.REDIS_URL)
+    def __init__(self, redis: Optional[Redis] = None):
+        self.two_factor = TwoFactorAuth(redis)
+
+    @property
+    def redis(self) -> Redis:
+        return self.two_factor.redis
     
     async def __call__(self, request, call_next):
         # Skip 2FA check for excluded paths
@@ -4,8 +4,9 @@ Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
 All rights reserved.
 """
 
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 from app.core.tenant.context import TenantContext
 from app.core.config.settings import Settings, get_settings
 from uuid import UUID
@@ -15,12 +16,15 @@ logger = logging.getLogger(__name__)
 
 TEST_TENANT_ID = UUID("00000000-0000-0000-0000-000000000001")
 
-class TenantMiddleware(BaseHTTPMiddleware):
+class TenantMiddleware:
     """
     Middleware to handle tenant context in requests.
+
+    Pure ASGI: the tenant is set in this task's context and the response
+    is streamed through untouched.
     """
-    def __init__(self, app, settings: Settings = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, settings: Settings = None):
+        self.app = app
         self.settings = settings or get_settings()
         self.public_paths = {
             "/docs",
@@ -30,30 +34,37 @@ class TenantMiddleware(BaseHTTPMiddleware):
             "/",
             "/api/v1/docs",
             "/api/v1/openapi.json",
-            "/api/v1/health/"
+            "/api/v1/health/",
+            "/metrics",
+            "/livez",
+            "/readyz"
         }
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request, setting the tenant context.
         """
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip tenant check for public paths
-        if path in self.public_paths:
+        if scope["path"] in self.public_paths:
             try:
-                response = await call_next(request)
-                return response
+                await self.app(scope, receive, send)
             finally:
                 TenantContext.clear()
+            return
 
         # Get tenant from header
-        tenant_id = request.headers.get("X-Tenant-ID")
+        tenant_id = Headers(scope=scope).get("X-Tenant-ID")
         if not tenant_id:
-            raise HTTPException(
+            response = JSONResponse(
                 status_code=400,
-                detail="X-Tenant-ID header is required"
+                content={"detail": "X-Tenant-ID header is required"}
             )
+            await response(scope, receive, send)
+            return
 
         try:
             # Handle test tenant
@@ -61,14 +72,16 @@ class TenantMiddleware(BaseHTTPMiddleware):
                 tenant_uuid = TEST_TENANT_ID
             else:
                 tenant_uuid = UUID(tenant_id)
-
-            TenantContext.set_tenant_id(tenant_uuid)
-            response = await call_next(request)
-            return response
         except ValueError:
-            raise HTTPException(
+            response = JSONResponse(
                 status_code=400,
-                detail="Invalid tenant ID format. Must be a valid UUID."
+                content={"detail": "Invalid tenant ID format. Must be a valid UUID."}
             )
+            await response(scope, receive, send)
+            return
+
+        TenantContext.set_tenant_id(tenant_uuid)
+        try:
+            await self.app(scope, receive, send)
         finally:
             TenantContext.clear()
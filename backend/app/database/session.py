@@ -1,55 +1,45 @@
-from sqlalchemy import create_engine
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
 from app.core.config.settings import get_settings
+from app.core.db.engine_registry import (
+    AsyncTenantEngineRegistry,
+    TenantEngineRegistry,
+    async_tenant_engine_registry,
+    tenant_engine_registry,
+)
 from app.core.tenant.context import TenantContext
-from typing import Dict, Optional
-import pyodbc
 
 settings = get_settings()
 
 class DatabaseSessionManager:
-    def __init__(self):
-        self._engines: Dict[str, create_engine] = {}
-        self._session_factories: Dict[str, sessionmaker] = {}
-    
-    def get_connection_string(self, tenant_id: str) -> str:
-        return (
-            f"mssql+pyodbc://{settings.DB_USER}:{settings.DB_PASS}@"
-            f"{settings.DB_HOST}:{settings.DB_PORT}/{tenant_id}?"
-            f"driver={settings.DB_DRIVER}"
-        )
+    def __init__(
+        self,
+        registry: TenantEngineRegistry = tenant_engine_registry,
+        async_registry: AsyncTenantEngineRegistry = async_tenant_engine_registry
+    ):
+        self.registry = registry
+        self.async_registry = async_registry
     
     def get_engine(self, tenant_id: str):
-        if tenant_id not in self._engines:
-            connection_string = self.get_connection_string(tenant_id)
-            self._engines[tenant_id] = create_engine(
-                connection_string,
-                poolclass=QueuePool,
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30,
-                pool_recycle=1800
-            )
-        return self._engines[tenant_id]
+        return self.registry.get_engine(str(tenant_id))
     
     def get_session_factory(self, tenant_id: str) -> sessionmaker:
-        if tenant_id not in self._session_factories:
-            engine = self.get_engine(tenant_id)
-            self._session_factories[tenant_id] = sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=engine
-            )
-        return self._session_factories[tenant_id]
+        return self.registry.get_session_factory(str(tenant_id))
     
     def get_session(self) -> Session:
         tenant_id = TenantContext.get_tenant_id()
         if not tenant_id:
             raise ValueError("Tenant ID not set in context")
         
-        session_factory = self.get_session_factory(tenant_id)
-        return session_factory()
+        return self.get_session_factory(tenant_id)()
+    
+    def get_async_session(self) -> AsyncSession:
+        tenant_id = TenantContext.get_tenant_id()
+        if not tenant_id:
+            raise ValueError("Tenant ID not set in context")
+        
+        return self.async_registry.get_session(str(tenant_id))
 
 db_manager = DatabaseSessionManager()
 
@@ -59,3 +49,7 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+async def get_async_tenant_db() -> AsyncGenerator[AsyncSession, None]:
+    async with db_manager.get_async_session() as db:
+        yield db
@@ -4,20 +4,65 @@ Copyright (c) 2025 BControlTech Consultoria em Gestão e Tecnologia
 All rights reserved.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.auth.router import router as auth_router
+from app.core.cache.redis import close_redis, init_redis
+from app.core.concurrency.executor import crypto_executor, db_executor
 from app.core.config.settings import get_settings
+from app.core.config.database import get_database_settings
+from app.core.db.engine_registry import async_tenant_engine_registry, tenant_engine_registry
+from app.core.db.session import async_engine
+from app.core.monitoring.business import business_metrics_task
+from app.core.monitoring.metrics import MetricsMiddleware, metrics_endpoint
+from app.core.monitoring.readiness import readiness_checker, router as probe_router
+from app.core.monitoring.sampler import health_sampler
+from app.core.security.audit_writer import audit_writer
 from app.core.tenant.middleware import TenantMiddleware
 from app.core.security.rate_limit import RateLimitMiddleware
 from app.api.v1.api import api_router
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start background maintenance tasks and release resources on shutdown
+    """
+    reap_interval = get_database_settings().TENANT_ENGINE_REAP_INTERVAL
+    tenant_engine_registry.start_reaper(reap_interval)
+    async_tenant_engine_registry.start_reaper(reap_interval)
+    init_redis()
+    audit_writer.start()
+    business_metrics_task.start()
+    await health_sampler.start()
+    await readiness_checker.start()
+    try:
+        yield
+    finally:
+        await readiness_checker.stop()
+        await health_sampler.stop()
+        await business_metrics_task.stop()
+        # Flush queued audit events while the database engines are still open
+        await audit_writer.stop()
+        await close_redis()
+        await tenant_engine_registry.stop_reaper()
+        await async_tenant_engine_registry.stop_reaper()
+        tenant_engine_registry.dispose_all()
+        async_tenant_engine_registry.dispose_all()
+        await async_tenant_engine_registry.wait_closed()
+        await async_engine.dispose()
+        db_executor.shutdown()
+        crypto_executor.shutdown()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.APP_VERSION,
+    lifespan=lifespan,
 )
 
 # CORS
@@ -36,6 +81,15 @@ app.add_middleware(RateLimitMiddleware)
 # Tenant Middleware
 app.add_middleware(TenantMiddleware)
 
+# Metrics Middleware (outermost, so rejected requests are counted too)
+app.add_middleware(MetricsMiddleware)
+
+# Prometheus scrape endpoint
+app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+# Liveness and readiness probes
+app.include_router(probe_router)
+
 # Test route
 @app.get("/test")
 async def test():
@@ -12,6 +12,7 @@ class AuditLog(Base):
     __table_args__ = {"schema": "dbo"}
 
     AuditLogID = Column(Integer, primary_key=True, index=True)
+    EventID = Column(String(36), index=True)  # Client-generated ID, makes spool replay idempotent
     UserID = Column(Integer, ForeignKey("dbo.Users.UserID"))
     TenantID = Column(Integer, ForeignKey("dbo.Tenants.TenantID"))
     Action = Column(String(100), nullable=False)
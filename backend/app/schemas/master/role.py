@@ -1,5 +1,5 @@
 from typing import Optional, List
-from pydantic import BaseModel, constr
+from pydantic import AliasChoices, BaseModel, Field, constr
 
 
 class PermissionBase(BaseModel):
@@ -15,7 +15,13 @@ class PermissionCreate(PermissionBase):
 
 class PermissionInDB(PermissionBase):
     """Schema for permission stored in database."""
-    permission_id: int
+    code: constr(min_length=1, max_length=100) = Field(
+        validation_alias=AliasChoices("code", "Code")
+    )
+    description: Optional[str] = Field(
+        None, validation_alias=AliasChoices("description", "Description")
+    )
+    permission_id: int = Field(validation_alias=AliasChoices("permission_id", "PermissionID"))
 
     class Config:
         from_attributes = True
@@ -40,8 +46,17 @@ class RoleUpdate(RoleBase):
 
 class RoleInDB(RoleBase):
     """Schema for role stored in database."""
-    role_id: int
-    permissions: List[PermissionInDB]
+    name: constr(min_length=1, max_length=100) = Field(
+        validation_alias=AliasChoices("name", "Name")
+    )
+    description: Optional[str] = Field(
+        None, validation_alias=AliasChoices("description", "Description")
+    )
+    role_id: int = Field(validation_alias=AliasChoices("role_id", "RoleID"))
+    # Read from the eagerly loaded Role.Permissions collection
+    permissions: List[PermissionInDB] = Field(
+        validation_alias=AliasChoices("permissions", "Permissions")
+    )
 
     class Config:
         from_attributes = True
@@ -1,6 +1,9 @@
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db.pagination import Keyset
+from app.core.security.audit_writer import audit_writer
 from app.models.master.audit import AuditLog
 from app.models.master.user import User
 
@@ -8,27 +11,38 @@ from app.models.master.user import User
 class AuditService:
     """Service for audit operations."""
 
-    def __init__(self, db: Session):
+    # Newest first; AuditLogID breaks ties between rows with the same CreatedAt
+    keyset = Keyset(AuditLog.CreatedAt, AuditLog.AuditLogID, descending=True)
+
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def log_action(
+    async def log_action(
         self,
-        user: User,
-        tenant_id: int,
         action: str,
+        user: Optional[User] = None,
+        tenant_id: Optional[int] = None,
         entity_type: Optional[str] = None,
         entity_id: Optional[str] = None,
         old_values: Optional[Dict[str, Any]] = None,
         new_values: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
-        additional_data: Optional[Dict[str, Any]] = None
-    ) -> AuditLog:
-        """Create audit log entry."""
-        audit_log = AuditLog(
-            user_id=user.user_id,
-            tenant_id=tenant_id,
+        additional_data: Optional[Dict[str, Any]] = None,
+        user_id: Optional[Any] = None
+    ) -> bool:
+        """
+        Queue an audit log entry on the background audit writer.
+
+        The entry is written in a later batch, outside this session.
+
+        Returns:
+            bool: False if the entry was dropped because the queue stayed full
+        """
+        return await audit_writer.log(
             action=action,
+            user_id=user.UserID if user is not None else user_id,
+            tenant_id=tenant_id,
             entity_type=entity_type,
             entity_id=entity_id,
             old_values=old_values,
@@ -37,12 +51,29 @@ class AuditService:
             user_agent=user_agent,
             additional_data=additional_data
         )
-        self.db.add(audit_log)
-        self.db.commit()
-        self.db.refresh(audit_log)
-        return audit_log
 
-    def get_audit_logs(
+    async def log_change(
+        self,
+        user_id: Any,
+        action: str,
+        table_name: str,
+        record_id: str,
+        old_values: Optional[Dict[str, Any]] = None,
+        new_values: Optional[Dict[str, Any]] = None,
+        tenant_id: Optional[int] = None
+    ) -> bool:
+        """Queue an audit entry for a change to a table row."""
+        return await audit_writer.log(
+            action=action,
+            user_id=user_id,
+            tenant_id=tenant_id,
+            entity_type=table_name,
+            entity_id=record_id,
+            old_values=old_values,
+            new_values=new_values
+        )
+
+    async def get_audit_logs(
         self,
         tenant_id: int,
         user_id: Optional[int] = None,
@@ -52,31 +83,43 @@ class AuditService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[AuditLog]:
-        """Get audit logs with filters."""
-        query = self.db.query(AuditLog).filter(AuditLog.tenant_id == tenant_id)
+        """
+        Get audit logs with filters, newest first.
+
+        Pages start after ``cursor`` when given, otherwise at offset ``skip``.
+        """
+        query = select(AuditLog).where(AuditLog.TenantID == tenant_id)
 
         if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
+            query = query.where(AuditLog.UserID == user_id)
         if action:
-            query = query.filter(AuditLog.action == action)
+            query = query.where(AuditLog.Action == action)
         if entity_type:
-            query = query.filter(AuditLog.entity_type == entity_type)
+            query = query.where(AuditLog.EntityType == entity_type)
         if entity_id:
-            query = query.filter(AuditLog.entity_id == entity_id)
+            query = query.where(AuditLog.EntityID == entity_id)
         if start_date:
-            query = query.filter(AuditLog.timestamp >= start_date)
+            query = query.where(AuditLog.CreatedAt >= start_date)
         if end_date:
-            query = query.filter(AuditLog.timestamp <= end_date)
+            query = query.where(AuditLog.CreatedAt <= end_date)
 
-        return query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit).all()
+        query = self.keyset.apply(query, cursor)
+        if not cursor:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
+        return result.scalars().all()
 
-    def get_audit_log(self, log_id: int) -> Optional[AuditLog]:
+    async def get_audit_log(self, log_id: int) -> Optional[AuditLog]:
         """Get audit log by ID."""
-        return self.db.query(AuditLog).filter(AuditLog.log_id == log_id).first()
+        result = await self.db.execute(
+            select(AuditLog).where(AuditLog.log_id == log_id)
+        )
+        return result.scalars().first()
 
-    def get_user_actions(
+    async def get_user_actions(
         self,
         user_id: int,
         tenant_id: int,
@@ -84,19 +127,19 @@ class AuditService:
         limit: int = 100
     ) -> List[AuditLog]:
         """Get all actions performed by a user in a tenant."""
-        return (
-            self.db.query(AuditLog)
-            .filter(
+        result = await self.db.execute(
+            select(AuditLog)
+            .where(
                 AuditLog.user_id == user_id,
                 AuditLog.tenant_id == tenant_id
             )
             .order_by(AuditLog.timestamp.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return result.scalars().all()
 
-    def get_entity_history(
+    async def get_entity_history(
         self,
         entity_type: str,
         entity_id: str,
@@ -105,9 +148,9 @@ class AuditService:
         limit: int = 100
     ) -> List[AuditLog]:
         """Get history of changes for an entity."""
-        return (
-            self.db.query(AuditLog)
-            .filter(
+        result = await self.db.execute(
+            select(AuditLog)
+            .where(
                 AuditLog.entity_type == entity_type,
                 AuditLog.entity_id == entity_id,
                 AuditLog.tenant_id == tenant_id
@@ -115,5 +158,5 @@ class AuditService:
             .order_by(AuditLog.timestamp.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return result.scalars().all()
@@ -2,7 +2,9 @@ from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.concurrency.executor import run_crypto
 from app.core.config.settings import get_settings
 from app.models.master.user import User
 from app.schemas.master.user import TokenData
@@ -14,7 +16,7 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 class AuthService:
     """Service for authentication operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -25,10 +27,15 @@ class AuthService:
         """Generate password hash."""
         return pwd_context.hash(password)
 
-    def authenticate_user(self, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Authenticate user with username and password."""
-        user = self.db.query(User).filter(User.username == username).first()
-        if not user or not self.verify_password(password, user.password_hash):
+        result = await self.db.execute(
+            select(User).where(User.username == username)
+        )
+        user = result.scalars().first()
+        if not user or not await run_crypto(
+            self.verify_password, password, user.password_hash
+        ):
             return None
         return user
 
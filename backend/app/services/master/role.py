@@ -1,5 +1,12 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from app.core.db.pagination import Keyset
+from app.core.cache.read_through import service_cache
+from app.core.concurrency.single_flight import coalesce
+from app.core.security.permission_cache import permission_cache
+from app.models.master.association_tables import RolePermissions
 from app.models.master.role import Role, Permission
 from app.schemas.master.role import RoleCreate, RoleUpdate
 
@@ -7,130 +14,201 @@ from app.schemas.master.role import RoleCreate, RoleUpdate
 class RoleService:
     """Service for role and permission operations."""
 
-    def __init__(self, db: Session):
+    # Listing order and cursor key
+    keyset = Keyset(Role.RoleID)
+
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_role(self, role_id: int) -> Optional[Role]:
-        """Get role by ID."""
-        return self.db.query(Role).filter(Role.role_id == role_id).first()
+    @coalesce("roles")
+    async def get_role(
+        self,
+        role_id: int,
+        tenant_id: Optional[int] = None
+    ) -> Optional[Role]:
+        """
+        Get role by ID, optionally scoped to a tenant.
+
+        Concurrent identical calls share one query, so the result must be
+        treated as read-only; use ``get_role_for_update`` before changing it.
+        """
+        return await self.get_role_for_update(role_id, tenant_id)
+
+    async def get_role_for_update(
+        self,
+        role_id: int,
+        tenant_id: Optional[int] = None
+    ) -> Optional[Role]:
+        """Get role by ID from this service's own session, never coalesced."""
+        # AsyncSession cannot lazy-load, so permissions are joined in the
+        # same query
+        query = (
+            select(Role)
+            .options(joinedload(Role.Permissions))
+            .where(Role.RoleID == role_id)
+        )
+        if tenant_id is not None:
+            query = query.where(Role.TenantID == tenant_id)
+        result = await self.db.execute(query)
+        return result.unique().scalars().first()
 
-    def get_role_by_name(self, name: str) -> Optional[Role]:
+    async def get_role_by_name(self, name: str) -> Optional[Role]:
         """Get role by name."""
-        return self.db.query(Role).filter(Role.name == name).first()
+        result = await self.db.execute(select(Role).where(Role.Name == name))
+        return result.scalars().first()
 
-    def get_roles(
+    @coalesce("roles")
+    async def get_roles(
         self,
+        tenant_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Role]:
-        """Get list of roles."""
-        return self.db.query(Role).offset(skip).limit(limit).all()
-
-    def create_role(self, role_data: RoleCreate) -> Role:
+        """
+        Get list of roles, optionally scoped to a tenant.
+
+        Pages start after ``cursor`` when given, otherwise at offset ``skip``.
+        """
+        # selectinload keeps offset/limit on role rows and loads every
+        # page's permissions in one extra query
+        query = select(Role).options(selectinload(Role.Permissions))
+        if tenant_id is not None:
+            query = query.where(Role.TenantID == tenant_id)
+        query = self.keyset.apply(query, cursor)
+        if not cursor:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
+        return result.scalars().all()
+
+    async def create_role(
+        self,
+        role_data: RoleCreate,
+        tenant_id: Optional[int] = None
+    ) -> Role:
         """Create new role."""
+        # Load permissions first so the role is inserted with them in one commit
+        permissions = []
+        if role_data.permission_ids:
+            result = await self.db.execute(
+                select(Permission)
+                .where(Permission.PermissionID.in_(role_data.permission_ids))
+            )
+            permissions = list(result.scalars().all())
+
         # Create role
         db_role = Role(
-            name=role_data.name,
-            description=role_data.description
+            Name=role_data.name,
+            Description=role_data.description,
+            TenantID=tenant_id,
+            Permissions=permissions
         )
         self.db.add(db_role)
-        self.db.commit()
-        self.db.refresh(db_role)
-
-        # Assign permissions
-        if role_data.permission_ids:
-            permissions = (
-                self.db.query(Permission)
-                .filter(Permission.permission_id.in_(role_data.permission_ids))
-                .all()
-            )
-            db_role.permissions = permissions
-            self.db.commit()
+        await self.db.commit()
 
-        return db_role
+        # Reload server-generated columns together with the permissions
+        return await self.get_role_for_update(db_role.RoleID)
 
-    def update_role(
+    async def update_role(
         self,
         role_id: int,
-        role_data: RoleUpdate
+        role_data: RoleUpdate,
+        tenant_id: Optional[int] = None
     ) -> Optional[Role]:
         """Update role."""
-        db_role = self.get_role(role_id)
+        db_role = await self.get_role_for_update(role_id, tenant_id)
         if not db_role:
             return None
 
         update_data = role_data.model_dump(exclude_unset=True)
-        
+
         # Update basic fields
-        for field in ["name", "description"]:
+        for field, model_field in [("name", "Name"), ("description", "Description")]:
             if field in update_data:
-                setattr(db_role, field, update_data[field])
+                setattr(db_role, model_field, update_data[field])
 
         # Update permissions if provided
         if "permission_ids" in update_data:
-            permissions = (
-                self.db.query(Permission)
-                .filter(Permission.permission_id.in_(update_data["permission_ids"]))
-                .all()
+            result = await self.db.execute(
+                select(Permission)
+                .where(Permission.PermissionID.in_(update_data["permission_ids"]))
             )
-            db_role.permissions = permissions
+            db_role.Permissions = list(result.scalars().all())
 
-        self.db.commit()
-        self.db.refresh(db_role)
+        await self.db.commit()
+        await permission_cache.bump_tenant(db_role.TenantID)
         return db_role
 
-    def delete_role(self, role_id: int) -> bool:
+    async def delete_role(self, role_id: int, tenant_id: Optional[int] = None) -> bool:
         """Delete role."""
-        db_role = self.get_role(role_id)
+        db_role = await self.get_role_for_update(role_id, tenant_id)
         if not db_role:
             return False
 
-        self.db.delete(db_role)
-        self.db.commit()
+        tenant_id = db_role.TenantID
+        await self.db.delete(db_role)
+        await self.db.commit()
+        await permission_cache.bump_tenant(tenant_id)
         return True
 
-    def get_permission(self, permission_id: int) -> Optional[Permission]:
+    async def get_permission(self, permission_id: int) -> Optional[Permission]:
         """Get permission by ID."""
-        return (
-            self.db.query(Permission)
-            .filter(Permission.permission_id == permission_id)
-            .first()
+        result = await self.db.execute(
+            select(Permission)
+            .where(Permission.PermissionID == permission_id)
         )
+        return result.scalars().first()
 
-    def get_permission_by_code(self, code: str) -> Optional[Permission]:
+    @service_cache.cached("permission", "code:{code}", Permission, tags=("permission:{PermissionID}",))
+    async def get_permission_by_code(self, code: str) -> Optional[Permission]:
         """Get permission by code."""
-        return (
-            self.db.query(Permission)
-            .filter(Permission.code == code)
-            .first()
+        result = await self.db.execute(
+            select(Permission)
+            .where(Permission.Code == code)
         )
+        return result.scalars().first()
 
-    def get_permissions(
+    async def get_permissions(
         self,
         skip: int = 0,
         limit: int = 100
     ) -> List[Permission]:
         """Get list of permissions."""
-        return self.db.query(Permission).offset(skip).limit(limit).all()
+        result = await self.db.execute(
+            select(Permission).offset(skip).limit(limit)
+        )
+        return result.scalars().all()
 
-    def create_permission(
+    async def create_permission(
         self,
         code: str,
         description: Optional[str] = None
     ) -> Permission:
         """Create new permission."""
-        db_permission = Permission(code=code, description=description)
+        db_permission = Permission(Name=code, Code=code, Description=description)
         self.db.add(db_permission)
-        self.db.commit()
-        self.db.refresh(db_permission)
+        await self.db.commit()
+        await self.db.refresh(db_permission)
         return db_permission
 
-    def delete_permission(self, permission_id: int) -> bool:
+    async def delete_permission(self, permission_id: int) -> bool:
         """Delete permission."""
-        db_permission = self.get_permission(permission_id)
+        db_permission = await self.get_permission(permission_id)
         if not db_permission:
             return False
 
-        self.db.delete(db_permission)
-        self.db.commit()
+        # Tenants whose roles grant the permission lose it with the delete
+        result = await self.db.execute(
+            select(Role.TenantID)
+            .distinct()
+            .join(RolePermissions, RolePermissions.c.RoleID == Role.RoleID)
+            .where(RolePermissions.c.PermissionID == permission_id)
+        )
+        tenant_ids = result.scalars().all()
+
+        await self.db.delete(db_permission)
+        await self.db.commit()
+        await service_cache.invalidate(f"permission:{permission_id}")
+        for tenant_id in tenant_ids:
+            await permission_cache.bump_tenant(tenant_id)
         return True
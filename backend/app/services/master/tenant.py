@@ -1,5 +1,9 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache.read_through import service_cache
+from app.core.concurrency.single_flight import coalesce
+from app.core.db.pagination import Keyset
 from app.models.master.tenant import Tenant
 from app.models.master.user import User
 from app.schemas.master.tenant import TenantCreate, TenantUpdate
@@ -8,30 +12,49 @@ from app.schemas.master.tenant import TenantCreate, TenantUpdate
 class TenantService:
     """Service for tenant operations."""
 
-    def __init__(self, db: Session):
+    # Listing order and cursor key
+    keyset = Keyset(Tenant.TenantID)
+
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_tenant(self, tenant_id: int) -> Optional[Tenant]:
+    @service_cache.cached("tenant", "id:{tenant_id}", Tenant, tags=("tenant:{TenantID}",))
+    async def get_tenant(self, tenant_id: int) -> Optional[Tenant]:
         """Get tenant by ID."""
-        return self.db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
+        result = await self.db.execute(
+            select(Tenant).where(Tenant.TenantID == tenant_id)
+        )
+        return result.scalars().first()
 
-    def get_tenant_by_name(self, name: str) -> Optional[Tenant]:
+    @service_cache.cached("tenant", "name:{name}", Tenant, tags=("tenant:{TenantID}",))
+    async def get_tenant_by_name(self, name: str) -> Optional[Tenant]:
         """Get tenant by name."""
-        return self.db.query(Tenant).filter(Tenant.name == name).first()
+        result = await self.db.execute(select(Tenant).where(Tenant.Name == name))
+        return result.scalars().first()
 
-    def get_tenants(
+    @coalesce("tenants")
+    async def get_tenants(
         self,
         skip: int = 0,
         limit: int = 100,
-        active_only: bool = True
+        active_only: bool = True,
+        cursor: Optional[str] = None
     ) -> List[Tenant]:
-        """Get list of tenants."""
-        query = self.db.query(Tenant)
+        """
+        Get list of tenants.
+
+        Pages start after ``cursor`` when given, otherwise at offset ``skip``.
+        """
+        query = select(Tenant)
         if active_only:
-            query = query.filter(Tenant.is_active == True)
-        return query.offset(skip).limit(limit).all()
+            query = query.where(Tenant.IsActive == True)
+        query = self.keyset.apply(query, cursor)
+        if not cursor:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
+        return result.scalars().all()
 
-    def create_tenant(
+    async def create_tenant(
         self,
         tenant_data: TenantCreate,
         created_by: User
@@ -42,17 +65,17 @@ class TenantService:
             created_by=created_by.user_id
         )
         self.db.add(db_tenant)
-        self.db.commit()
-        self.db.refresh(db_tenant)
+        await self.db.commit()
+        await self.db.refresh(db_tenant)
         return db_tenant
 
-    def update_tenant(
+    async def update_tenant(
         self,
         tenant_id: int,
         tenant_data: TenantUpdate
     ) -> Optional[Tenant]:
         """Update tenant."""
-        db_tenant = self.get_tenant(tenant_id)
+        db_tenant = await self.get_tenant(tenant_id)
         if not db_tenant:
             return None
 
@@ -60,37 +83,39 @@ class TenantService:
         for field, value in update_data.items():
             setattr(db_tenant, field, value)
 
-        self.db.commit()
-        self.db.refresh(db_tenant)
+        await self.db.commit()
+        await service_cache.invalidate(f"tenant:{db_tenant.TenantID}")
+        await self.db.refresh(db_tenant)
         return db_tenant
 
-    def delete_tenant(self, tenant_id: int) -> bool:
+    async def delete_tenant(self, tenant_id: int) -> bool:
         """Delete tenant."""
-        db_tenant = self.get_tenant(tenant_id)
+        db_tenant = await self.get_tenant(tenant_id)
         if not db_tenant:
             return False
 
         # Soft delete - just mark as inactive
-        db_tenant.is_active = False
-        self.db.commit()
+        db_tenant.IsActive = False
+        await self.db.commit()
+        await service_cache.invalidate(f"tenant:{db_tenant.TenantID}")
         return True
 
-    def get_tenant_users(
+    async def get_tenant_users(
         self,
         tenant_id: int,
         skip: int = 0,
         limit: int = 100
     ) -> List[User]:
         """Get users in tenant."""
-        tenant = self.get_tenant(tenant_id)
+        tenant = await self.get_tenant(tenant_id)
         if not tenant:
             return []
-        
-        return (
-            self.db.query(User)
+
+        result = await self.db.execute(
+            select(User)
             .join(User.tenant_roles)
-            .filter(User.tenant_roles.any(tenant_id=tenant_id))
+            .where(User.tenant_roles.any(tenant_id=tenant_id))
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return result.scalars().all()
@@ -1,5 +1,5 @@
 from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.master.tenant import TenantService
 from app.services.master.user import UserService
 from app.services.master.role import RoleService
@@ -11,7 +11,7 @@ from app.models.master.user import User
 
 
 class TenantWizardService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.tenant_service = TenantService(db)
         self.user_service = UserService(db)
@@ -34,10 +34,10 @@ class TenantWizardService:
         """
         try:
             # Start transaction
-            self.db.begin()
+            await self.db.begin()
 
             # 1. Create tenant record
-            tenant = self.tenant_service.create_tenant(tenant_data, current_user)
+            tenant = await self.tenant_service.create_tenant(tenant_data, current_user)
 
             # 2. Create tenant database with security
             db_name = f"tenant_{tenant.tenant_id}"
@@ -48,7 +48,7 @@ class TenantWizardService:
             )
 
             # 3. Create admin user
-            admin_user = self.user_service.create_user(
+            admin_user = await self.user_service.create_user(
                 user_data=admin_data,
                 tenant_id=tenant.tenant_id,
                 is_admin=True
@@ -65,7 +65,7 @@ class TenantWizardService:
                 )
 
             # Commit transaction
-            self.db.commit()
+            await self.db.commit()
 
             return {
                 "tenant": tenant,
@@ -75,7 +75,7 @@ class TenantWizardService:
 
         except Exception as e:
             # Rollback in case of error
-            self.db.rollback()
+            await self.db.rollback()
             # Log error details
             raise Exception(f"Failed to create tenant: {str(e)}")
 
@@ -135,7 +135,7 @@ class TenantWizardService:
 
     async def validate_tenant_name(self, name: str) -> bool:
         """Check if tenant name is available"""
-        existing = self.tenant_service.get_tenant_by_name(name)
+        existing = await self.tenant_service.get_tenant_by_name(name)
         return existing is None
 
     async def get_available_templates(self) -> list:
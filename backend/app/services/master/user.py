@@ -1,19 +1,63 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.master.user import User
+from app.core.cache.read_through import service_cache
+from app.core.concurrency.executor import run_crypto
+from app.core.db.pagination import Keyset
 from app.core.security import get_password_hash, verify_password
+from app.core.security.principal_cache import principal_cache
+from app.core.security.permission_cache import permission_cache
+from app.models.master.association_tables import UserRoles
 from app.schemas.master.user import UserCreate, UserUpdate
 
 
 class UserService:
-    def __init__(self, db: Session):
+    # Listing order and cursor key
+    keyset = Keyset(User.UserID)
+
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
-        return self.db.query(User).filter(User.Email == email).first()
+    async def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[User]:
+        """
+        Get list of users that are not deleted.
+
+        Pages start after ``cursor`` when given, otherwise at offset ``skip``.
+        """
+        query = self.keyset.apply(select(User).where(User.IsDeleted == False), cursor)
+        if not cursor:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
+        return result.scalars().all()
+
+    async def get_user(self, user_id: UUID) -> Optional[User]:
+        result = await self.db.execute(select(User).where(User.UserID == user_id))
+        return result.scalars().first()
 
-    def create_user(self, user_data: UserCreate) -> User:
-        hashed_password = get_password_hash(user_data.password)
+    @service_cache.cached(
+        "user",
+        "email:{email}",
+        User,
+        tags=("user:{UserID}",),
+        exclude=("HashedPassword",)
+    )
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        """Get user by email; ``HashedPassword`` is not loaded on cache hits."""
+        return await self._load_user_by_email(email)
+
+    async def _load_user_by_email(self, email: str) -> Optional[User]:
+        result = await self.db.execute(select(User).where(User.Email == email))
+        return result.scalars().first()
+
+    async def create_user(self, user_data: UserCreate) -> User:
+        hashed_password = await run_crypto(get_password_hash, user_data.password)
         db_user = User(
             Email=user_data.email,
             Username=user_data.username,
@@ -25,14 +69,18 @@ class UserService:
             LastName=user_data.last_name
         )
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
         return db_user
 
-    def update_user(self, user: User, user_data: UserUpdate) -> User:
+    async def update_user(self, user: User, user_data: UserUpdate) -> User:
         update_data = user_data.dict(exclude_unset=True)
+        # Tokens keep carrying the old email or username
+        previous_subjects = principal_cache.subjects(user)
         if "password" in update_data:
-            update_data["HashedPassword"] = get_password_hash(update_data.pop("password"))
+            update_data["HashedPassword"] = await run_crypto(
+                get_password_hash, update_data.pop("password")
+            )
         
         # Map schema fields to model fields
         field_mapping = {
@@ -48,18 +96,50 @@ class UserService:
             setattr(user, model_field, value)
             
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await service_cache.invalidate(f"user:{user.UserID}")
+        await principal_cache.invalidate(*previous_subjects, *principal_cache.subjects(user))
+        await self.db.refresh(user)
         return user
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
-        user = self.get_user_by_email(email)
+    async def delete_user(self, user_id: UUID) -> bool:
+        """Soft delete and deactivate a user, dropping their cached principal."""
+        user = await self.get_user(user_id)
+        if not user:
+            return False
+        user.IsDeleted = True
+        user.IsActive = False
+        await self.db.commit()
+        await service_cache.invalidate(f"user:{user.UserID}")
+        await principal_cache.invalidate(*principal_cache.subjects(user))
+        return True
+
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
+        # Credentials are always checked against the database, never the cache
+        user = await self._load_user_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.HashedPassword):
+        if not await run_crypto(verify_password, password, user.HashedPassword):
             return None
         return user
 
+    async def assign_role(self, user_id: int, role_id: int) -> None:
+        """Grant a role to a user and invalidate their cached permissions."""
+        await self.db.execute(
+            insert(UserRoles).values(UserID=user_id, RoleID=role_id)
+        )
+        await self.db.commit()
+        await permission_cache.bump_user(user_id)
+
+    async def remove_role(self, user_id: int, role_id: int) -> None:
+        """Revoke a role from a user and invalidate their cached permissions."""
+        await self.db.execute(
+            delete(UserRoles)
+            .where(UserRoles.c.UserID == user_id, UserRoles.c.RoleID == role_id)
+        )
+        await self.db.commit()
+        await permission_cache.bump_user(user_id)
+
 
 # Create a singleton instance
 user_service = UserService(None)  # Will be initialized with DB session later
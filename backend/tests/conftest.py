@@ -1,11 +1,15 @@
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config.database import get_database_settings
 from app.core.db.base import Base
 from app.main import app
-from app.core.db.session import get_db
+from app.core.db.session import get_async_db, get_db
+from app.core.db.query_counter import QueryCounter
 import os
 import logging
 from datetime import datetime
@@ -25,6 +29,12 @@ TEST_DB_URL = os.getenv(
     db_settings.get_tenant_database_url("fdw00_test")
 )
 
+# Same test database through the asyncio driver
+TEST_ASYNC_DB_URL = os.getenv(
+    "TEST_ASYNC_DATABASE_URL",
+    TEST_DB_URL.replace("mssql+pyodbc", "mssql+aioodbc", 1)
+)
+
 @pytest.fixture(scope="session")
 def test_engine():
     """Create test database engine"""
@@ -40,6 +50,15 @@ def test_engine():
     
     return engine
 
+@pytest.fixture(scope="session")
+def test_async_engine():
+    """Create asyncio test database engine"""
+    # NullPool: each TestClient runs its own event loop, so connections
+    # must not be pooled across loops
+    engine = create_async_engine(TEST_ASYNC_DB_URL, poolclass=NullPool)
+    yield engine
+    engine.sync_engine.dispose()
+
 @pytest.fixture(scope="session")
 def TestingSessionLocal(test_engine):
     """Create test database session factory"""
@@ -59,7 +78,7 @@ def db_session(TestingSessionLocal):
         session.close()
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_session, test_async_engine):
     """Create a test client with a test database session"""
     def override_get_db():
         try:
@@ -67,11 +86,26 @@ def client(db_session):
         finally:
             pass
     
+    async def override_get_async_db():
+        async with AsyncSession(test_async_engine, expire_on_commit=False) as session:
+            yield session
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
+@pytest.fixture(scope="function")
+def assert_max_queries(test_engine, test_async_engine):
+    """Fail a block that issues more than ``limit`` queries on the test database"""
+    @contextmanager
+    def check(limit):
+        with QueryCounter(test_engine, test_async_engine) as counter:
+            yield counter
+        counter.assert_at_most(limit)
+    return check
+
 # Test data fixtures
 @pytest.fixture(scope="function")
 def test_tenant(db_session):
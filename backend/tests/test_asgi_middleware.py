@@ -0,0 +1,161 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from app.core.middleware.security import AuditMiddleware
+from app.core.security.rate_limit import RateLimitInfo, RateLimitMiddleware
+from app.core.tenant.context import TenantContext
+from app.core.tenant.middleware import TEST_TENANT_ID, TenantMiddleware
+
+
+class CountingLimiter:
+    """Allows the first ``limit`` checks per key"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.counts = {}
+
+    async def check_rate_limit(self, key, cost=1):
+        count = self.counts.get(key, 0) + cost
+        self.counts[key] = count
+        remaining = max(self.limit - count, 0)
+        info = RateLimitInfo(remaining=remaining, reset=60, limit=self.limit, used=count)
+        return count <= self.limit, info
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.events = []
+
+    async def log(self, **event):
+        self.events.append(event)
+        return True
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/tenant")
+    async def tenant():
+        return {"tenant_id": str(TenantContext.get_tenant_id())}
+
+    return app
+
+
+async def request(app, path, headers=None):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path, headers=headers or {})
+
+
+async def test_tenant_middleware_sets_context():
+    app = make_app()
+    app.add_middleware(TenantMiddleware)
+
+    response = await request(app, "/tenant", {"X-Tenant-ID": "test_tenant"})
+
+    assert response.json() == {"tenant_id": str(TEST_TENANT_ID)}
+    assert TenantContext.get_tenant_id() is None
+
+
+@pytest.mark.parametrize("headers,detail", [
+    ({}, "X-Tenant-ID header is required"),
+    ({"X-Tenant-ID": "acme"}, "Invalid tenant ID format. Must be a valid UUID."),
+])
+async def test_tenant_middleware_rejects_bad_header(headers, detail):
+    app = make_app()
+    app.add_middleware(TenantMiddleware)
+
+    response = await request(app, "/tenant", headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+async def test_rate_limit_middleware_headers_and_rejection():
+    app = make_app()
+    app.add_middleware(RateLimitMiddleware)
+    middleware = app.build_middleware_stack()
+    while not isinstance(middleware, RateLimitMiddleware):
+        middleware = middleware.app
+    middleware.limiter = CountingLimiter(limit=1)
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        allowed = await client.get("/tenant")
+        denied = await client.get("/tenant")
+
+    assert allowed.status_code == 200
+    assert allowed.headers["X-RateLimit-Limit"] == "1"
+    assert allowed.headers["X-RateLimit-Remaining"] == "0"
+    assert denied.status_code == 429
+    assert denied.json() == {"detail": "Too many requests", "retry_after": 60}
+
+
+async def test_audit_middleware_records_status_from_response_start():
+    writer = RecordingWriter()
+    app = AuditMiddleware(make_app(), writer=writer)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/tenant", headers={"User-Agent": "probe"})
+        await client.get("/nowhere")
+
+    assert len(writer.events) == 1
+    event = writer.events[0]
+    assert event["action"] == "GET http://test/tenant"
+    assert event["new_values"]["status_code"] == 200
+    assert event["user_agent"] == "probe"
+
+
+async def test_layers_stream_the_response_body():
+    """Each chunk reaches the server before the next one is produced"""
+    delivered = asyncio.Event()
+
+    async def chunks():
+        yield b"first"
+        # Times out if a middleware buffers the body
+        await asyncio.wait_for(delivered.wait(), timeout=1)
+        yield b"second"
+
+    async def endpoint(scope, receive, send):
+        await StreamingResponse(chunks())(scope, receive, send)
+
+    app = AuditMiddleware(endpoint, writer=RecordingWriter())
+    app = TenantMiddleware(app)
+    rate_limited = RateLimitMiddleware(app)
+    rate_limited.limiter = CountingLimiter(limit=10)
+
+    body = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            headers = dict(message["headers"])
+            assert headers[b"x-ratelimit-limit"] == b"10"
+        elif message.get("body"):
+            body.append(message["body"])
+            if message["body"] == b"first":
+                delivered.set()
+
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # The client stays connected
+        await asyncio.Event().wait()
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "headers": [(b"x-tenant-id", b"test_tenant"), (b"host", b"test")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+        "scheme": "http",
+        "root_path": "",
+    }
+    await rate_limited(scope, receive, send)
+
+    assert b"".join(body) == b"firstsecond"
+
@@ -0,0 +1,71 @@
+import asyncio
+from app.core.security.audit_writer import AuditWriter
+
+
+class RecordingWriter(AuditWriter):
+    """Audit writer that records batches instead of inserting them"""
+
+    def __init__(self, write_delay=0.0, **kwargs):
+        options = dict(queue_size=100, batch_size=10, flush_interval=0.05, enqueue_timeout=0.05)
+        options.update(kwargs)
+        super().__init__(**options)
+        self.batches = []
+        self.write_delay = write_delay
+
+    async def _write_batch(self, batch, skip_existing=False):
+        await asyncio.sleep(self.write_delay)
+        self.batches.append(list(batch))
+        return len(batch)
+
+    @property
+    def written(self):
+        return [event["Action"] for batch in self.batches for event in batch]
+
+
+async def test_flush_by_size():
+    """A full batch is written without waiting for the flush interval"""
+    writer = RecordingWriter(batch_size=5, flush_interval=10)
+    writer.start()
+    for i in range(5):
+        await writer.log(action=f"A{i}")
+    await asyncio.sleep(0.01)
+    assert [len(batch) for batch in writer.batches] == [5]
+    await writer.stop()
+
+
+async def test_flush_by_time():
+    """A partial batch is written after the flush interval"""
+    writer = RecordingWriter(batch_size=100, flush_interval=0.02)
+    writer.start()
+    await writer.log(action="A")
+    await asyncio.sleep(0.05)
+    assert writer.written == ["A"]
+    await writer.stop()
+
+
+async def test_stop_flushes_queue():
+    """Graceful shutdown writes every queued event"""
+    writer = RecordingWriter(batch_size=3, flush_interval=10, write_delay=0.01)
+    writer.start()
+    for i in range(10):
+        await writer.log(action=f"A{i}")
+    await writer.stop()
+    assert writer.written == [f"A{i}" for i in range(10)]
+    assert max(len(batch) for batch in writer.batches) <= 3
+
+
+async def test_backpressure_drops_after_timeout():
+    """A full queue makes callers wait, then drop when the writer cannot keep up"""
+    writer = RecordingWriter(queue_size=2, batch_size=1, write_delay=0.2, enqueue_timeout=0.02)
+    writer.start()
+    results = [await writer.log(action=f"A{i}") for i in range(5)]
+    assert results[:3] == [True, True, True]
+    assert False in results
+    await writer.stop()
+
+
+async def test_writes_directly_when_not_running():
+    """Events are written immediately outside the application lifespan"""
+    writer = RecordingWriter()
+    assert await writer.log(action="A", user_id=1, entity_id=7)
+    assert writer.batches[0][0]["EntityID"] == "7"
@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from prometheus_client import REGISTRY
+from app.core.db.query_counter import QueryCounter
+from app.core.monitoring.metrics import update_business_metrics
+# Every model the User relationships name, as in the running app
+import app.models.master.audit  # noqa: F401
+
+
+class AsyncSessionAdapter:
+    """The AsyncSession method the refresh uses, over a sync session"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement):
+        await asyncio.sleep(0)
+        return self.session.execute(statement)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach_dbo(connection, record):
+        connection.execute("ATTACH DATABASE ':memory:' AS dbo")
+
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE dbo.Tenants (TenantID TEXT PRIMARY KEY, Name TEXT, IsActive BOOLEAN)"))
+        connection.execute(text("CREATE TABLE dbo.Users (UserID TEXT PRIMARY KEY, TenantID TEXT, IsActive BOOLEAN)"))
+        connection.execute(text(
+            "INSERT INTO dbo.Tenants VALUES ('t1', 'metrics-acme', 1), ('t2', 'metrics-globex', 1), ('t3', 'metrics-empty', 1)"
+        ))
+        connection.execute(text(
+            "INSERT INTO dbo.Users VALUES ('u1', 't1', 1), ('u2', 't1', 1), ('u3', 't1', 0), ('u4', 't2', 1)"
+        ))
+    yield engine
+    engine.dispose()
+
+
+def user_count(tenant):
+    return REGISTRY.get_sample_value("user_count", {"tenant": tenant})
+
+
+async def test_one_query_fills_every_tenant(engine):
+    db = AsyncSessionAdapter(sessionmaker(bind=engine)())
+
+    with QueryCounter(engine) as counter:
+        await update_business_metrics(db)
+
+    assert counter.count == 1
+    assert REGISTRY.get_sample_value("tenant_count") == 3
+    assert user_count("metrics-acme") == 2
+    assert user_count("metrics-globex") == 1
+    assert user_count("metrics-empty") == 0
+
+
+async def test_inactive_tenants_series_are_removed(engine):
+    db = AsyncSessionAdapter(sessionmaker(bind=engine)())
+    await update_business_metrics(db)
+
+    db.session.execute(text("UPDATE dbo.Tenants SET IsActive = 0 WHERE TenantID = 't2'"))
+    await update_business_metrics(db)
+
+    assert user_count("metrics-globex") is None
+    assert user_count("metrics-acme") == 2
+    assert REGISTRY.get_sample_value("tenant_count") == 2
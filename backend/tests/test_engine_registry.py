@@ -0,0 +1,69 @@
+import time
+import pytest
+from app.core.db.engine_registry import TenantEngineRegistry
+
+
+def sqlite_url(db_name: str) -> str:
+    return "sqlite://"
+
+
+@pytest.fixture
+def registry():
+    """Create a small registry backed by in-memory SQLite engines"""
+    registry = TenantEngineRegistry(
+        max_engines=2,
+        idle_timeout=60,
+        url_builder=sqlite_url
+    )
+    yield registry
+    registry.dispose_all()
+
+
+def test_engine_is_cached(registry):
+    """Test repeated lookups return the same engine"""
+    engine = registry.get_engine("tenant_1")
+    assert registry.get_engine("tenant_1") is engine
+    assert registry.stats["hits"] == 1
+    assert registry.stats["misses"] == 1
+
+
+def test_lru_eviction(registry):
+    """Test the least recently used engine is evicted when full"""
+    registry.get_engine("tenant_1")
+    registry.get_engine("tenant_2")
+    registry.get_engine("tenant_1")
+    registry.get_engine("tenant_3")
+
+    assert len(registry) == 2
+    assert "tenant_1" in registry
+    assert "tenant_2" not in registry
+    assert registry.stats["evictions"] == 1
+
+
+def test_sample_does_not_touch_lru(registry):
+    """Test sampling returns cached engines without creating or refreshing any"""
+    engine_1 = registry.get_engine("tenant_1")
+    engine_2 = registry.get_engine("tenant_2")
+
+    assert registry.sample(1) == {"tenant_2": engine_2}
+    assert registry.sample(5) == {"tenant_2": engine_2, "tenant_1": engine_1}
+
+    registry.get_engine("tenant_3")
+    assert "tenant_1" not in registry
+    assert registry.stats["misses"] == 3
+
+
+def test_reap_idle(registry):
+    """Test idle engines are reaped"""
+    registry.get_engine("tenant_1")
+    registry.idle_timeout = 0
+    time.sleep(0.01)
+
+    assert registry.reap_idle() == 1
+    assert len(registry) == 0
+
+
+async def test_reaper_task(registry):
+    """Test the background reaper can be started and stopped"""
+    registry.start_reaper(interval=60)
+    await registry.stop_reaper()
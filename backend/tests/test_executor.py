@@ -0,0 +1,45 @@
+import asyncio
+import contextvars
+import time
+import pytest
+from app.core.concurrency.executor import BlockingExecutor
+from app.core.monitoring.metrics import EXECUTOR_QUEUE_DEPTH
+
+request_tenant = contextvars.ContextVar("request_tenant", default=None)
+
+
+@pytest.fixture
+def executor():
+    pool = BlockingExecutor("test", max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+async def test_run_returns_result(executor):
+    """Blocking calls return their result to the awaiting coroutine"""
+    assert await executor.run(sum, [1, 2, 3]) == 6
+
+
+async def test_context_is_propagated(executor):
+    """Context variables set by the handler are visible in the worker"""
+    request_tenant.set("tenant_1")
+    assert await executor.run(request_tenant.get) == "tenant_1"
+
+
+async def test_queue_depth_drains(executor):
+    """Calls queued behind busy workers are counted and drained"""
+    gauge = EXECUTOR_QUEUE_DEPTH.labels(pool="test")
+    await asyncio.gather(*(executor.run(time.sleep, 0.01) for _ in range(6)))
+    assert gauge._value.get() == 0
+
+
+async def test_event_loop_stays_responsive(executor):
+    """A burst of blocking calls does not stall other coroutines"""
+    burst = asyncio.gather(*(executor.run(time.sleep, 0.05) for _ in range(4)))
+
+    start = time.perf_counter()
+    await asyncio.sleep(0.01)
+    stall = time.perf_counter() - start
+
+    await burst
+    assert stall < 0.04
@@ -0,0 +1,83 @@
+import asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from app.api.v1.endpoints import health
+from app.core.monitoring.sampler import HealthSampler, health_sampler
+
+
+def make_sampler(**services):
+    sampler = HealthSampler(interval=60, timeout=0.05)
+    for name, collector in services.items():
+        sampler.add_service(name, collector)
+    return sampler
+
+
+async def test_round_reports_each_service():
+    """Failures and timeouts are reported per service, not raised"""
+    async def ok():
+        return {"version": "1.0"}
+
+    async def down():
+        raise ConnectionError("connection refused")
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    snapshot = await make_sampler(database=ok, redis=down, search=slow).sample()
+
+    assert snapshot.services["database"] == {"status": "ok", "details": {"version": "1.0"}}
+    assert snapshot.services["redis"] == {"status": "error", "details": {"error": "connection refused"}}
+    assert snapshot.services["search"]["status"] == "error"
+    assert snapshot.status == "error"
+    assert set(snapshot.system) == {"cpu", "memory", "disk"}
+    assert 0 <= snapshot.system["memory"]["percent"] <= 100
+
+
+async def test_rounds_replace_the_snapshot():
+    async def ok():
+        return {}
+
+    sampler = make_sampler(database=ok)
+    assert sampler.snapshot.status == "error"
+
+    first = await sampler.sample()
+    second = await sampler.sample()
+
+    assert sampler.snapshot is second and first is not second
+    assert second.status == "ok" and second.sampled_at >= first.sampled_at
+
+
+async def test_probes_serve_the_snapshot_without_io(monkeypatch):
+    """However often the endpoints are probed, services are only sampled per round"""
+    calls = []
+
+    async def database():
+        calls.append(1)
+        return {"version": "test"}
+
+    sampler = make_sampler(database=database)
+    monkeypatch.setattr(health_sampler, "snapshot", await sampler.sample())
+
+    app = FastAPI()
+    app.include_router(health.router, prefix="/health")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        responses = [await client.get("/health/detailed") for _ in range(50)]
+        summary = await client.get("/health/")
+
+    assert len(calls) == 1
+    assert responses[-1].json()["services"]["database"]["details"] == {"version": "test"}
+    assert summary.json() == {"services": {"database": "ok"}}
+
+
+async def test_unhealthy_snapshot_returns_503(monkeypatch):
+    async def down():
+        raise ConnectionError("connection refused")
+
+    monkeypatch.setattr(health_sampler, "snapshot", await make_sampler(redis=down).sample())
+
+    app = FastAPI()
+    app.include_router(health.router, prefix="/health")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/health/")
+
+    assert response.status_code == 503
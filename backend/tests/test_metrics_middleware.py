@@ -0,0 +1,86 @@
+import pytest
+from fastapi import FastAPI, status
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from app.core.monitoring.metrics import UNMATCHED_ENDPOINT, MetricsMiddleware, metrics_endpoint
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/metrics-test/users/{user_id}")
+    async def get_user(user_id: int):
+        return {"id": user_id}
+
+    @app.post("/metrics-test/items", status_code=status.HTTP_201_CREATED)
+    async def create_item(item: dict):
+        return item
+
+    @app.get("/metrics-test/fail")
+    async def fail():
+        raise RuntimeError("boom")
+
+    app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=make_app(), raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def test_requests_are_labelled_by_route_template(client):
+    """Different ids share one series"""
+    template = "/metrics-test/users/{user_id}"
+    before = sample("http_requests_total", method="GET", endpoint=template, status="200")
+
+    for user_id in range(5):
+        await client.get(f"/metrics-test/users/{user_id}")
+
+    assert sample("http_requests_total", method="GET", endpoint=template, status="200") == before + 5
+    assert sample("http_requests_total", method="GET", endpoint="/metrics-test/users/3", status="200") == 0
+
+
+async def test_unknown_paths_share_the_unmatched_series(client):
+    before = sample("http_requests_total", method="GET", endpoint=UNMATCHED_ENDPOINT, status="404")
+    await client.get("/metrics-test/nowhere/1")
+    await client.get("/metrics-test/nowhere/2")
+    assert sample("http_requests_total", method="GET", endpoint=UNMATCHED_ENDPOINT, status="404") == before + 2
+
+
+async def test_status_and_sizes_are_recorded(client):
+    labels = {"method": "POST", "endpoint": "/metrics-test/items"}
+    request_bytes = sample("http_request_size_bytes_sum", **labels)
+    response_bytes = sample("http_response_size_bytes_sum", **labels)
+
+    response = await client.post("/metrics-test/items", content=b'{"a": 1}')
+
+    assert response.status_code == 201
+    assert sample("http_requests_total", status="201", **labels) >= 1
+    assert sample("http_request_size_bytes_sum", **labels) == request_bytes + 8
+    assert sample("http_response_size_bytes_sum", **labels) == response_bytes + len(response.content)
+
+
+async def test_unhandled_errors_count_as_500(client):
+    labels = {"method": "GET", "endpoint": "/metrics-test/fail"}
+    before = sample("http_requests_total", status="500", **labels)
+
+    await client.get("/metrics-test/fail")
+
+    assert sample("http_requests_total", status="500", **labels) == before + 1
+    assert sample("http_requests_in_progress", method="GET") == 0
+
+
+async def test_metrics_endpoint_exposes_registry(client):
+    await client.get("/metrics-test/users/1")
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'endpoint="/metrics-test/users/{user_id}"' in response.text
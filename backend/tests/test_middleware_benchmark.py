@@ -0,0 +1,142 @@
+import asyncio
+import statistics
+import time
+import pytest
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.middleware.security import AuditMiddleware, SecurityMiddleware
+from app.core.security.rate_limit import RateLimitInfo, RateLimitMiddleware
+from app.core.tenant.middleware import TenantMiddleware
+
+REQUESTS = 2000
+CONCURRENCY = 64
+
+SCOPE = {
+    "type": "http",
+    "http_version": "1.1",
+    "method": "GET",
+    "path": "/items",
+    "raw_path": b"/items",
+    "query_string": b"",
+    "headers": [(b"host", b"test"), (b"x-tenant-id", b"test_tenant"), (b"user-agent", b"bench")],
+    "client": ("127.0.0.1", 1234),
+    "server": ("test", 80),
+    "scheme": "http",
+    "root_path": "",
+}
+
+
+class UnlimitedLimiter:
+    """Always allows, so the benchmark measures the middleware, not Redis"""
+
+    async def check_rate_limit(self, key, cost=1):
+        return True, RateLimitInfo(remaining=100, reset=60, limit=100, used=0)
+
+
+class DiscardingWriter:
+    async def log(self, **event):
+        return True
+
+
+class PassthroughMiddleware(BaseHTTPMiddleware):
+    """What each layer cost before: a BaseHTTPMiddleware doing nothing"""
+
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def endpoint_app():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return {"items": []}
+
+    return app
+
+
+def tenant_layer(app):
+    return TenantMiddleware(app)
+
+
+def rate_limit_layer(app):
+    middleware = RateLimitMiddleware(app)
+    middleware.limiter = UnlimitedLimiter()
+    return middleware
+
+
+def security_layer(app):
+    middleware = SecurityMiddleware(app)
+    middleware.rate_limiter = UnlimitedLimiter()
+    return middleware
+
+
+def audit_layer(app):
+    return AuditMiddleware(app, writer=DiscardingWriter())
+
+
+LAYERS = [
+    ("tenant", tenant_layer),
+    ("rate_limit", rate_limit_layer),
+    ("security", security_layer),
+    ("audit", audit_layer),
+]
+
+
+async def call(app):
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    await app(dict(SCOPE), receive, send)
+    return time.perf_counter() - start
+
+
+async def measure(app):
+    """Mean and p99 latency in microseconds at CONCURRENCY in-flight requests"""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            return await call(app)
+
+    await asyncio.gather(*(one() for _ in range(200)))
+    latencies = sorted(await asyncio.gather(*(one() for _ in range(REQUESTS))))
+    return (
+        statistics.mean(latencies) * 1e6,
+        latencies[int(len(latencies) * 0.99)] * 1e6
+    )
+
+
+@pytest.mark.slow
+async def test_added_latency_per_middleware_layer():
+    """Report the latency each layer adds and compare with BaseHTTPMiddleware"""
+    base_mean, base_p99 = await measure(endpoint_app())
+    print(f"\nendpoint only: mean {base_mean:.0f}us p99 {base_p99:.0f}us ({CONCURRENCY} concurrent)")
+
+    for name, layer in LAYERS:
+        mean, p99 = await measure(layer(endpoint_app()))
+        print(f"{name:>12}: +{mean - base_mean:.0f}us mean, +{p99 - base_p99:.0f}us p99")
+
+    app = endpoint_app()
+    for _, layer in LAYERS:
+        app = layer(app)
+    asgi_mean, asgi_p99 = await measure(app)
+
+    app = endpoint_app()
+    for _ in LAYERS:
+        app = PassthroughMiddleware(app)
+    legacy_mean, legacy_p99 = await measure(app)
+
+    print(f"{'asgi stack':>12}: +{asgi_mean - base_mean:.0f}us mean, +{asgi_p99 - base_p99:.0f}us p99")
+    print(f"{'BaseHTTP x4':>12}: +{legacy_mean - base_mean:.0f}us mean, +{legacy_p99 - base_p99:.0f}us p99")
+
+    # Four working ASGI layers cost less than four empty BaseHTTPMiddleware ones
+    assert asgi_mean < legacy_mean
@@ -0,0 +1,54 @@
+import asyncio
+from prometheus_client import REGISTRY
+from app.core.concurrency.periodic import PeriodicTask
+
+
+def runs(name, result):
+    return REGISTRY.get_sample_value("background_task_runs_total", {"name": name, "result": result}) or 0
+
+
+async def test_runs_never_overlap():
+    """A run requested while one is in progress is skipped"""
+    started = []
+
+    async def slow():
+        started.append(1)
+        await asyncio.sleep(0.05)
+
+    task = PeriodicTask("test-overlap", slow, interval=60)
+    results = await asyncio.gather(task.run_once(), task.run_once())
+
+    assert results == [True, False]
+    assert len(started) == 1
+    assert runs("test-overlap", "skipped") == 1
+
+
+async def test_timeouts_and_errors_keep_the_schedule():
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        if len(calls) == 2:
+            raise ConnectionError("database down")
+
+    task = PeriodicTask("test-flaky", flaky, interval=0.01, jitter=0, timeout=0.05)
+    task.start()
+    for _ in range(100):
+        if len(calls) >= 3:
+            break
+        await asyncio.sleep(0.01)
+    await task.stop()
+
+    assert runs("test-flaky", "timeout") == 1
+    assert runs("test-flaky", "error") == 1
+    assert runs("test-flaky", "ok") >= 1
+    assert task.last_success is not None and not task.running
+
+
+def test_delay_stays_within_jitter():
+    task = PeriodicTask("test-jitter", None, interval=10, jitter=0.2)
+    delays = [task._delay() for _ in range(1000)]
+    assert 8 <= min(delays) and max(delays) <= 12
+    assert len(set(delays)) > 1
@@ -0,0 +1,166 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from app.core.cache.read_through import service_cache
+from app.core.security.permission_cache import PermissionCache, permission_cache
+from app.services.master.role import RoleService
+# Every model the Role relationships name, as in the running app
+import app.models.master.audit  # noqa: F401
+
+
+class MemoryRedis:
+    """Minimal in-memory stand-in for the commands the cache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+
+class BrokenRedis:
+    async def mget(self, *keys):
+        raise ConnectionError("redis down")
+
+    async def incr(self, key):
+        raise ConnectionError("redis down")
+
+
+class AsyncSessionAdapter:
+    """The AsyncSession methods RoleService.delete_permission uses, over a sync session"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement):
+        return self.session.execute(statement)
+
+    async def delete(self, instance):
+        self.session.delete(instance)
+
+    async def commit(self):
+        self.session.commit()
+
+
+class Loader:
+    def __init__(self, codes):
+        self.codes = codes
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return list(self.codes)
+
+
+@pytest.fixture
+def redis_client():
+    return MemoryRedis()
+
+
+def make_cache(client, local_ttl=60):
+    return PermissionCache(
+        max_entries=2,
+        local_ttl=local_ttl,
+        ttl=3600,
+        client_factory=lambda: client
+    )
+
+
+async def test_permissions_loaded_once(redis_client):
+    """Repeated checks are served from the local tier"""
+    cache = make_cache(redis_client)
+    loader = Loader(["VIEW_ROLE", "LIST_ROLES"])
+
+    for _ in range(3):
+        codes = await cache.get(1, 10, loader)
+
+    assert codes == frozenset({"VIEW_ROLE", "LIST_ROLES"})
+    assert loader.calls == 1
+
+
+async def test_redis_tier_shared_between_processes(redis_client):
+    """A second process reuses the set resolved by the first"""
+    loader = Loader(["VIEW_ROLE"])
+    await make_cache(redis_client).get(1, 10, loader)
+    await make_cache(redis_client).get(1, 10, loader)
+    assert loader.calls == 1
+
+
+async def test_bump_invalidates(redis_client):
+    """Tenant and user version bumps force a reload everywhere"""
+    cache = make_cache(redis_client)
+    other = make_cache(redis_client, local_ttl=0)
+    loader = Loader(["VIEW_ROLE"])
+
+    await cache.get(1, 10, loader)
+    await cache.bump_user(1)
+    await cache.get(1, 10, loader)
+    assert loader.calls == 2
+
+    await cache.bump_tenant(10)
+    loader.codes = ["VIEW_ROLE", "MANAGE_ROLES"]
+    assert "MANAGE_ROLES" in await other.get(1, 10, loader)
+    assert loader.calls == 3
+
+
+async def test_local_lru_is_bounded(redis_client):
+    """The local tier never grows past max_entries"""
+    cache = make_cache(redis_client)
+    for user_id in range(5):
+        await cache.get(user_id, 10, Loader([]))
+    assert len(cache) == 2
+
+
+async def test_redis_failure_falls_back_to_loader():
+    """Permission checks keep working when Redis is unavailable"""
+    cache = make_cache(BrokenRedis())
+    loader = Loader(["VIEW_ROLE"])
+    assert await cache.get(1, 10, loader) == frozenset({"VIEW_ROLE"})
+    await cache.bump_tenant(10)
+    assert loader.calls == 1
+
+
+async def test_deleting_a_permission_bumps_granting_tenants(monkeypatch):
+    """Every tenant with a role granting the permission has its cached sets invalidated"""
+    bumped = []
+
+    async def bump_tenant(tenant_id):
+        bumped.append(tenant_id)
+
+    async def invalidate(*tags):
+        pass
+
+    monkeypatch.setattr(permission_cache, "bump_tenant", bump_tenant)
+    monkeypatch.setattr(service_cache, "invalidate", invalidate)
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach_dbo(connection, record):
+        connection.execute("ATTACH DATABASE ':memory:' AS dbo")
+
+    audit_columns = "IsActive BOOLEAN, CreatedAt DATETIME, CreatedBy INTEGER, UpdatedAt DATETIME, UpdatedBy INTEGER, IsDeleted BOOLEAN"
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"CREATE TABLE dbo.Roles (RoleID INTEGER PRIMARY KEY, Name TEXT, Description TEXT, TenantID INTEGER, {audit_columns})"
+        ))
+        connection.execute(text(
+            f"CREATE TABLE dbo.Permissions (PermissionID INTEGER PRIMARY KEY, Name TEXT, Code TEXT, Description TEXT, {audit_columns})"
+        ))
+        connection.execute(text("CREATE TABLE dbo.RolePermissions (RoleID INTEGER, PermissionID INTEGER)"))
+        connection.execute(text("INSERT INTO dbo.Roles (RoleID, Name, TenantID) VALUES (1, 'a', 10), (2, 'b', 20), (3, 'c', 30)"))
+        connection.execute(text("INSERT INTO dbo.Permissions (PermissionID, Name, Code) VALUES (1, 'x', 'X'), (2, 'y', 'Y')"))
+        connection.execute(text("INSERT INTO dbo.RolePermissions VALUES (1, 1), (2, 1), (3, 2)"))
+
+    with sessionmaker(bind=engine)() as session:
+        assert await RoleService(AsyncSessionAdapter(session)).delete_permission(1)
+
+    assert sorted(bumped) == [10, 20]
+    engine.dispose()
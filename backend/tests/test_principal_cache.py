@@ -0,0 +1,172 @@
+import asyncio
+import os
+import pytest
+import redis.asyncio as redis
+from datetime import datetime
+from uuid import UUID, uuid4
+from sqlalchemy import Boolean, Column, DateTime, String, Uuid, create_engine, inspect, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+from app.core.db.query_counter import QueryCounter
+from app.core.security.principal_cache import PrincipalCache
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+LocalBase = declarative_base()
+
+
+class Principal(LocalBase):
+    __tablename__ = "principals"
+    UserID = Column(Uuid, primary_key=True)
+    Email = Column(String(100), nullable=False)
+    Username = Column(String(100), nullable=False)
+    HashedPassword = Column(String(100), nullable=False)
+    IsActive = Column(Boolean, nullable=False)
+    CreatedAt = Column(DateTime, nullable=False)
+
+
+class AsyncSessionAdapter:
+    """The two AsyncSession methods the cache uses, over a sync session"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement):
+        await asyncio.sleep(0)
+        return self.session.execute(statement)
+
+    async def merge(self, instance, load=True):
+        return self.session.merge(instance, load=load)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    LocalBase.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(Principal(
+            UserID=uuid4(),
+            Email="ana@example.com",
+            Username="ana",
+            HashedPassword="secret-hash",
+            IsActive=True,
+            CreatedAt=datetime(2025, 1, 2, 3, 4, 5)
+        ))
+        db.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+async def redis_client():
+    client = redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.close()
+        pytest.skip("Redis is not available")
+    yield client
+    await client.close()
+
+
+def make_cache(client_factory, local_ttl=60):
+    return PrincipalCache(
+        max_entries=100,
+        local_ttl=local_ttl,
+        ttl=60,
+        model=Principal,
+        client_factory=client_factory
+    )
+
+
+def unreachable():
+    return redis.from_url("redis://127.0.0.1:1", socket_connect_timeout=0.5)
+
+
+async def lookup(cache, engine, subject="email:ana@example.com"):
+    """Resolve a subject in a fresh request session"""
+    db = AsyncSessionAdapter(sessionmaker(bind=engine)())
+
+    async def load():
+        email = subject.split(":", 1)[1]
+        result = await db.execute(select(Principal).where(Principal.Email == email))
+        return result.scalars().first()
+
+    return db, await cache.get(db, subject, load)
+
+
+async def test_local_hit_runs_no_query(engine):
+    """A cached principal is attached to the request session without SQL"""
+    client = unreachable()
+    cache = make_cache(lambda: client)
+    await lookup(cache, engine)
+
+    with QueryCounter(engine) as counter:
+        db, user = await lookup(cache, engine)
+
+    assert counter.count == 0
+    assert user.Username == "ana" and isinstance(user.UserID, UUID)
+    assert user in db.session
+
+
+async def test_password_hash_is_never_cached(engine):
+    client = unreachable()
+    cache = make_cache(lambda: client)
+    await lookup(cache, engine)
+
+    _, user = await lookup(cache, engine)
+
+    row, _ = cache._entries["email:ana@example.com"]
+    assert "HashedPassword" not in row
+    assert "HashedPassword" not in inspect(user).dict
+
+
+async def test_invalidate_drops_local_entry(engine):
+    client = unreachable()
+    cache = make_cache(lambda: client)
+    _, user = await lookup(cache, engine)
+
+    await cache.invalidate(*cache.subjects(user))
+
+    assert len(cache) == 0
+    with QueryCounter(engine) as counter:
+        await lookup(cache, engine)
+    assert counter.count == 1
+
+
+async def test_unknown_subject_is_not_cached(engine):
+    client = unreachable()
+    cache = make_cache(lambda: client)
+    _, user = await lookup(cache, engine, "email:nobody@example.com")
+    assert user is None and len(cache) == 0
+
+
+@pytest.mark.integration
+async def test_redis_tier_is_shared_and_versioned(engine, redis_client):
+    """Other processes are served from Redis until the subject's version is bumped"""
+    subject = f"email:{uuid4()}@example.com"
+    await redis_client.delete(f"principal:ver:{subject}", f"principal:{subject}")
+    with sessionmaker(bind=engine)() as db:
+        db.add(Principal(
+            UserID=uuid4(),
+            Email=subject.split(":", 1)[1],
+            Username=str(uuid4()),
+            HashedPassword="secret-hash",
+            IsActive=True,
+            CreatedAt=datetime(2025, 1, 2, 3, 4, 5)
+        ))
+        db.commit()
+    first = make_cache(lambda: redis_client)
+    second = make_cache(lambda: redis_client)
+    _, user = await lookup(first, engine, subject)
+
+    with QueryCounter(engine) as counter:
+        _, cached = await lookup(second, engine, subject)
+    assert counter.count == 0
+    assert cached.UserID == user.UserID and cached.CreatedAt == user.CreatedAt
+    assert "secret-hash" not in await redis_client.get(f"principal:{subject}")
+
+    await first.invalidate(*first.subjects(user))
+    second.clear_local()
+    with QueryCounter(engine) as counter:
+        await lookup(second, engine, subject)
+    assert counter.count == 1
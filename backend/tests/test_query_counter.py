@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, create_engine, select
+from sqlalchemy.orm import declarative_base, relationship, selectinload, sessionmaker
+from app.core.db.query_counter import QueryCounter
+
+LocalBase = declarative_base()
+
+
+class Parent(LocalBase):
+    __tablename__ = "parents"
+    id = Column(Integer, primary_key=True)
+    children = relationship("Child")
+
+
+class Child(LocalBase):
+    __tablename__ = "children"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("parents.id"))
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    LocalBase.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add_all(Parent(children=[Child(), Child()]) for _ in range(5))
+        db.commit()
+    with Session() as db:
+        yield db
+    engine.dispose()
+
+
+def test_lazy_loading_is_reported(session):
+    """Lazy loading a collection per row exceeds a constant query budget"""
+    with QueryCounter(session.get_bind()) as counter:
+        for parent in session.scalars(select(Parent)).all():
+            parent.children
+    assert counter.count == 6
+    with pytest.raises(AssertionError, match="Expected at most 2 queries"):
+        counter.assert_at_most(2)
+
+
+def test_eager_loading_is_constant(session):
+    """selectinload loads the whole graph in two queries"""
+    with QueryCounter(session.get_bind()) as counter:
+        parents = session.scalars(select(Parent).options(selectinload(Parent.children))).all()
+        assert sum(len(parent.children) for parent in parents) == 10
+    counter.assert_at_most(2)
@@ -0,0 +1,281 @@
+import asyncio
+import os
+import uuid
+import pytest
+import redis.asyncio as redis
+from app.core.cache.redis import RedisCache
+from app.core.config.settings import get_settings
+from app.core.resilience.circuit_breaker import CircuitBreaker, CircuitState
+from app.core.security.rate_limit import (
+    HybridRateLimiter,
+    RateLimitConfig,
+    RateLimitInfo,
+    RateLimitMiddleware,
+    RateLimiter,
+    RedisRateLimiter,
+    SlidingWindowRateLimiter,
+    create_rate_limiter,
+)
+
+settings = get_settings()
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+@pytest.fixture
+async def redis_cache():
+    client = redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.close()
+        pytest.skip("Redis is not available")
+    yield RedisCache(client)
+    await client.close()
+
+
+def make_limiter(redis_cache, burst_size=50):
+    # Refill so slowly that no tokens are added during the test
+    config = RateLimitConfig(requests_per_minute=1, burst_size=burst_size, window_size=3600)
+    return RateLimiter(redis_cache, config)
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+async def test_token_bucket_is_exact_under_concurrency(redis_cache):
+    """Concurrent checks never allow more requests than the bucket holds"""
+    limiter = make_limiter(redis_cache, burst_size=50)
+    key = f"load-test:{uuid.uuid4()}"
+
+    results = await asyncio.gather(*(
+        limiter.check_rate_limit(key) for _ in range(500)
+    ))
+
+    allowed = [info for is_allowed, info in results if is_allowed]
+    assert len(allowed) == 50
+    assert sorted(info.remaining for info in allowed) == list(range(50))
+
+
+@pytest.mark.integration
+async def test_token_bucket_cost(redis_cache):
+    """Requests are charged their cost and rejected when it exceeds the remaining tokens"""
+    limiter = make_limiter(redis_cache, burst_size=10)
+    key = f"cost-test:{uuid.uuid4()}"
+
+    is_allowed, info = await limiter.check_rate_limit(key, cost=7)
+    assert is_allowed and info.remaining == 3
+
+    is_allowed, info = await limiter.check_rate_limit(key, cost=5)
+    assert not is_allowed and info.remaining == 3
+    assert info.reset > 0
+
+
+@pytest.mark.integration
+async def test_script_reloaded_after_flush(redis_cache):
+    """The cached script SHA is reloaded if Redis lost its script cache"""
+    limiter = make_limiter(redis_cache)
+    key = f"reload-test:{uuid.uuid4()}"
+    assert (await limiter.check_rate_limit(key))[0]
+
+    await redis_cache._client.script_flush()
+    assert (await limiter.check_rate_limit(key))[0]
+
+
+@pytest.mark.integration
+async def test_sliding_window_limits_requests(redis_cache):
+    """The sliding window allows the limit, then rejects with a reset time"""
+    config = RateLimitConfig(requests_per_minute=20, burst_size=20, window_size=3600)
+    limiter = SlidingWindowRateLimiter(redis_cache, config)
+    key = f"window-test:{uuid.uuid4()}"
+
+    results = await asyncio.gather(*(limiter.check_rate_limit(key) for _ in range(50)))
+
+    allowed = [info for is_allowed, info in results if is_allowed]
+    assert len(allowed) == 20
+    is_allowed, info = await limiter.check_rate_limit(key)
+    assert not is_allowed and info.remaining == 0 and info.reset > 0
+
+
+@pytest.mark.integration
+async def test_sliding_window_uses_constant_memory(redis_cache):
+    """A key holds at most two counters however many requests it sees"""
+    config = RateLimitConfig(requests_per_minute=1000, burst_size=1000, window_size=1)
+    limiter = SlidingWindowRateLimiter(redis_cache, config)
+    key = f"window-memory:{uuid.uuid4()}"
+
+    for _ in range(3):
+        for _ in range(100):
+            await limiter.check_rate_limit(key)
+        await asyncio.sleep(1)
+    await limiter.check_rate_limit(key)
+
+    assert await redis_cache._client.hlen(f"ratelimit:{key}:window") <= 2
+
+
+def test_limiter_without_check_cannot_be_created():
+    """A subclass missing an abstract method fails at construction, not on the first request"""
+    class NoCheckLimiter(RedisRateLimiter):
+        def fallback_limits(self):
+            return 1, 1
+
+    with pytest.raises(TypeError):
+        NoCheckLimiter(None, RateLimitConfig(), breaker=CircuitBreaker(), timeout=1.0)
+
+
+def test_create_rate_limiter_rejects_unknown_algorithm():
+    """Routes must name a known algorithm"""
+    with pytest.raises(ValueError):
+        create_rate_limiter(None, RateLimitConfig(), "fixed_window")
+
+
+class MemoryBucketLimiter(RedisRateLimiter):
+    """Token bucket kept in a dict, counting calls that would go to Redis"""
+
+    def __init__(self, burst_size=100):
+        config = RateLimitConfig(requests_per_minute=1, burst_size=burst_size, window_size=3600)
+        super().__init__(None, config, breaker=CircuitBreaker(), timeout=1.0)
+        self.tokens = {}
+        self.calls = 0
+
+    def fallback_limits(self):
+        return self.config.burst_size, 0
+
+    async def _check(self, key, cost):
+        allowed, _, info = await self.take(key, cost)
+        return allowed, info
+
+    async def take(self, key, cost=1, lease=None):
+        self.calls += 1
+        tokens = self.tokens.get(key, self.config.burst_size)
+        taken = 0
+        if tokens >= cost:
+            taken = max(cost, min(lease or cost, tokens))
+            tokens -= taken
+        self.tokens[key] = tokens
+        info = RateLimitInfo(
+            remaining=tokens,
+            reset=60,
+            limit=self.config.requests_per_minute,
+            used=self.config.burst_size - tokens
+        )
+        return taken > 0, taken, info
+
+
+async def test_hybrid_limiter_spends_leases_locally():
+    """Only one call in lease_size reaches the shared bucket"""
+    backend = MemoryBucketLimiter(burst_size=100)
+    limiter = HybridRateLimiter(backend, lease_size=10, lease_ttl=60)
+
+    results = [await limiter.check_rate_limit("client") for _ in range(100)]
+
+    assert all(is_allowed for is_allowed, _ in results)
+    assert backend.calls == 10
+    assert results[-1][1].remaining == 0
+
+
+async def test_hybrid_limiter_never_exceeds_global_limit():
+    """Workers sharing a bucket together allow at most its capacity"""
+    backend = MemoryBucketLimiter(burst_size=40)
+    workers = [HybridRateLimiter(backend, lease_size=10, lease_ttl=60) for _ in range(3)]
+
+    allowed = 0
+    for _ in range(30):
+        for worker in workers:
+            allowed += (await worker.check_rate_limit("client"))[0]
+
+    assert allowed == 40
+
+
+async def test_hybrid_limiter_caches_denials():
+    """An empty bucket is not asked again until the lease expires"""
+    backend = MemoryBucketLimiter(burst_size=4)
+    limiter = HybridRateLimiter(backend, lease_size=10, lease_ttl=60)
+
+    results = [(await limiter.check_rate_limit("client"))[0] for _ in range(10)]
+
+    assert results == [True] * 4 + [False] * 6
+    assert backend.calls == 4
+
+
+async def test_hybrid_limiter_caps_lease_to_bucket_share(caplog):
+    """A lease never holds more than a quarter of the bucket, and clamping is logged"""
+    limiter = HybridRateLimiter(MemoryBucketLimiter(burst_size=8), lease_size=100)
+    assert limiter.lease_size == 2
+    assert "using 2" in caplog.text
+
+
+def test_middleware_limiter_uses_configured_limits():
+    """The middleware's limiter is built from settings, with the lease size as configured"""
+    middleware = RateLimitMiddleware(None)
+
+    assert middleware.limiter.config.burst_size == settings.RATE_LIMIT_BURST_SIZE
+    assert middleware.limiter.config.requests_per_minute == settings.RATE_LIMIT_REQUESTS_PER_MINUTE
+    assert middleware.limiter.config.window_size == settings.RATE_LIMIT_WINDOW_SIZE
+    assert middleware.limiter.lease_size == settings.RATE_LIMIT_LEASE_SIZE
+
+
+async def test_hybrid_limiter_bounds_tracked_keys():
+    """Least recently used leases are evicted beyond max_keys"""
+    limiter = HybridRateLimiter(MemoryBucketLimiter(), max_keys=2)
+    for key in ("a", "b", "c"):
+        await limiter.check_rate_limit(key)
+    assert list(limiter._leases) == ["b", "c"]
+
+
+def unreachable_limiter(limiter_class=RateLimiter, workers=2, **kwargs):
+    """Limiter whose Redis refuses connections"""
+    client = redis.from_url("redis://127.0.0.1:1", socket_connect_timeout=0.5)
+    config = RateLimitConfig(requests_per_minute=10, burst_size=10, window_size=3600)
+    return limiter_class(
+        RedisCache(client),
+        config,
+        breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+        workers=workers,
+        **kwargs
+    )
+
+
+@pytest.mark.parametrize("limiter_class", [RateLimiter, SlidingWindowRateLimiter])
+async def test_falls_back_to_local_share_when_redis_is_down(limiter_class):
+    """Without Redis each worker enforces its share of the limit"""
+    limiter = unreachable_limiter(limiter_class, workers=2)
+
+    results = [(await limiter.check_rate_limit("client"))[0] for _ in range(10)]
+
+    assert results == [True] * 5 + [False] * 5
+
+
+async def test_open_breaker_skips_redis():
+    """Once the breaker opens, checks no longer wait on Redis"""
+    limiter = unreachable_limiter()
+    for _ in range(2):
+        await limiter.check_rate_limit("client")
+    assert limiter.breaker.state == CircuitState.OPEN
+
+    async def fail(*args):
+        raise AssertionError("Redis was called while the breaker is open")
+
+    limiter.take = fail
+    assert (await limiter.check_rate_limit("client"))[0]
+
+
+async def test_slow_redis_times_out_to_fallback():
+    """A Redis call slower than the timeout is answered locally"""
+    limiter = unreachable_limiter(timeout=0.01)
+
+    async def slow(*args):
+        await asyncio.sleep(1)
+
+    limiter.take = slow
+    is_allowed, info = await limiter.check_rate_limit("client")
+    assert is_allowed and info.remaining == 4
+    assert limiter.breaker.failure_count == 1
+
+
+async def test_hybrid_limiter_falls_back_when_redis_is_down():
+    """Lease requests that fail are answered by the local share"""
+    limiter = HybridRateLimiter(unreachable_limiter(workers=1), lease_size=2)
+
+    results = [(await limiter.check_rate_limit("client"))[0] for _ in range(12)]
+
+    assert results == [True] * 10 + [False] * 2
@@ -0,0 +1,74 @@
+import os
+import time
+import uuid
+import pytest
+import redis.asyncio as redis
+from app.core.cache.redis import RedisCache
+from app.core.security.rate_limit import RateLimitConfig, create_rate_limiter
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+REQUESTS = 2000
+LIMIT = 1_000_000
+
+
+@pytest.fixture
+async def redis_cache():
+    client = redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.close()
+        pytest.skip("Redis is not available")
+    yield RedisCache(client)
+    await client.close()
+
+
+async def sorted_set_check(client, key: str, window: int = 60) -> None:
+    """Previous behaviour: one sorted-set member per request"""
+    now = time.time()
+    async with client.pipeline() as pipe:
+        pipe.zremrangebyscore(key, 0, now - window)
+        pipe.zcard(key)
+        pipe.zadd(key, {f"{now}:{uuid.uuid4()}": now})
+        pipe.expire(key, window)
+        await pipe.execute()
+
+
+async def measure(check, client, key: str):
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await check()
+    latency = (time.perf_counter() - start) / REQUESTS
+    memory = await client.memory_usage(key) or 0
+    await client.delete(key)
+    return latency, memory
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+async def test_rate_limit_algorithms_memory_and_latency(redis_cache):
+    """Compare Redis memory per key and check latency of the rate limit algorithms"""
+    client = redis_cache._client
+    config = RateLimitConfig(requests_per_minute=LIMIT, burst_size=LIMIT, window_size=60)
+    prefix = f"benchmark:{uuid.uuid4()}"
+    results = {}
+
+    key = f"{prefix}:zset"
+    results["sorted_set"] = await measure(lambda: sorted_set_check(client, key), client, key)
+
+    for algorithm in ("sliding_window", "token_bucket"):
+        limiter = create_rate_limiter(redis_cache, config, algorithm)
+        suffix = "window" if algorithm == "sliding_window" else "bucket"
+        results[algorithm] = await measure(
+            lambda: limiter.check_rate_limit(f"{prefix}:{algorithm}"),
+            client,
+            f"ratelimit:{prefix}:{algorithm}:{suffix}"
+        )
+
+    print()
+    for name, (latency, memory) in results.items():
+        print(f"{name}: {latency * 1e6:.1f}us per check, {memory} bytes per key")
+
+    assert results["sliding_window"][1] < results["sorted_set"][1] / 10
+    assert results["token_bucket"][1] < results["sorted_set"][1] / 10
@@ -0,0 +1,195 @@
+import asyncio
+import pytest
+from datetime import datetime
+from uuid import UUID, uuid4
+from sqlalchemy import Column, DateTime, String, Uuid, create_engine, inspect, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+from app.core.cache.read_through import ReadThroughCache
+from app.core.cache.redis import RedisCache
+from app.core.db.query_counter import QueryCounter
+
+LocalBase = declarative_base()
+
+
+class Account(LocalBase):
+    __tablename__ = "accounts"
+    AccountID = Column(Uuid, primary_key=True)
+    Name = Column(String(50), nullable=False)
+    CreatedAt = Column(DateTime, nullable=False)
+    ApiKeyHash = Column(String(100), nullable=True)
+
+
+class MemoryCache(RedisCache):
+    """RedisCache stand-in keeping values and tag sets in dicts"""
+
+    def __init__(self):
+        super().__init__()
+        self.values = {}
+        self.tags = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, expire=None, tags=None):
+        self.values[key] = value
+        for tag in tags or ():
+            self.tags.setdefault(tag, set()).add(key)
+        return True
+
+    async def invalidate_tags(self, *tags):
+        removed = 0
+        for tag in tags:
+            for key in self.tags.pop(tag, set()):
+                removed += self.values.pop(key, None) is not None
+        return removed
+
+
+class AsyncSessionAdapter:
+    """The two AsyncSession methods the cache and service use, over a sync session"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement):
+        # Yield like a real driver so concurrent calls interleave
+        await asyncio.sleep(0.01)
+        return self.session.execute(statement)
+
+    async def merge(self, instance, load=True):
+        return self.session.merge(instance, load=load)
+
+
+cache = ReadThroughCache(MemoryCache(), ttls={"account": 60}, serializer="orjson")
+
+
+class AccountService:
+    def __init__(self, db):
+        self.db = db
+        self.loads = 0
+
+    @cache.cached("account", "id:{account_id}", Account, tags=("account:{AccountID}",))
+    async def get_account(self, account_id):
+        self.loads += 1
+        result = await self.db.execute(select(Account).where(Account.AccountID == account_id))
+        return result.scalars().first()
+
+    @cache.cached("account", "public:{account_id}", Account, exclude=("ApiKeyHash",))
+    async def get_public_account(self, account_id):
+        self.loads += 1
+        result = await self.db.execute(select(Account).where(Account.AccountID == account_id))
+        return result.scalars().first()
+
+    @cache.cached("account", "name:{name}", Account, tags=("account:{AccountID}",))
+    async def get_account_by_name(self, name):
+        self.loads += 1
+        result = await self.db.execute(select(Account).where(Account.Name == name))
+        return result.scalars().first()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    LocalBase.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def account_id(engine):
+    account_id = uuid4()
+    with sessionmaker(bind=engine)() as db:
+        db.add(Account(
+            AccountID=account_id,
+            Name=f"acme-{account_id}",
+            CreatedAt=datetime(2025, 1, 2, 3, 4, 5),
+            ApiKeyHash="secret-hash"
+        ))
+        db.commit()
+    return account_id
+
+
+def make_service(engine):
+    return AccountService(AsyncSessionAdapter(sessionmaker(bind=engine)()))
+
+
+async def test_hit_is_served_without_sql(engine, account_id):
+    """A cached row comes back as a persistent instance with typed columns"""
+    await make_service(engine).get_account(account_id)
+
+    service = make_service(engine)
+    with QueryCounter(engine) as counter:
+        account = await service.get_account(account_id)
+
+    assert counter.count == 0 and service.loads == 0
+    assert account.AccountID == account_id and isinstance(account.AccountID, UUID)
+    assert account.CreatedAt == datetime(2025, 1, 2, 3, 4, 5)
+    assert account in service.db.session
+
+
+async def test_excluded_columns_never_reach_the_cache(engine, account_id):
+    """Secrets are left out of the stored row and not loaded on hits"""
+    loaded = await make_service(engine).get_public_account(account_id)
+    assert loaded.ApiKeyHash == "secret-hash"
+
+    service = make_service(engine)
+    account = await service.get_public_account(account_id)
+
+    assert "secret-hash" not in cache.redis.values[f"cache:account:public:{account_id}"]
+    assert service.loads == 0
+    assert account.Name == f"acme-{account_id}"
+    assert "ApiKeyHash" not in inspect(account).dict
+
+
+async def test_concurrent_misses_share_one_load(engine, account_id):
+    """Identical concurrent lookups run one query; each caller gets its own instance"""
+    services = [make_service(engine) for _ in range(10)]
+
+    accounts = await asyncio.gather(*(service.get_account(account_id) for service in services))
+
+    assert sum(service.loads for service in services) == 1
+    assert all(account.AccountID == account_id for account in accounts)
+    assert len({id(account) for account in accounts}) == 10
+
+
+async def test_tag_invalidates_every_key_of_a_row(engine, account_id):
+    """One tag drops the row cached by id and by name"""
+    service = make_service(engine)
+    await service.get_account(account_id)
+    await service.get_account_by_name(f"acme-{account_id}")
+
+    await cache.invalidate(f"account:{account_id}")
+
+    service = make_service(engine)
+    await service.get_account(account_id)
+    await service.get_account_by_name(f"acme-{account_id}")
+    assert service.loads == 2
+
+
+async def test_missing_rows_are_not_cached(engine):
+    service = make_service(engine)
+    assert await service.get_account(uuid4()) is None
+    assert await service.get_account_by_name("nobody") is None
+    assert await service.get_account_by_name("nobody") is None
+    assert service.loads == 3
+
+
+async def test_failed_load_lets_waiters_retry(engine, account_id):
+    """If the shared load fails, concurrent callers load for themselves"""
+
+    class FailingAdapter(AsyncSessionAdapter):
+        async def execute(self, statement):
+            await asyncio.sleep(0.01)
+            raise ConnectionError("database down")
+
+    failing = AccountService(FailingAdapter(sessionmaker(bind=engine)()))
+    waiter = make_service(engine)
+    lookup_id = uuid4()
+
+    results = await asyncio.gather(
+        failing.get_account(lookup_id),
+        waiter.get_account(lookup_id),
+        return_exceptions=True
+    )
+
+    assert isinstance(results[0], ConnectionError)
+    assert results[1] is None and waiter.loads == 1
@@ -0,0 +1,120 @@
+import asyncio
+import time
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from app.core.monitoring import readiness
+from app.core.monitoring.readiness import CheckFailed, ReadinessChecker
+
+
+def make_checker(ttl=15, **checks):
+    checker = ReadinessChecker(interval=60, timeout=0.05, ttl=ttl)
+    for name, check in checks.items():
+        critical = not name.startswith("optional_")
+        checker.add_check(name, check, critical=critical)
+    return checker
+
+
+async def ok():
+    return None
+
+
+async def test_pending_until_first_round():
+    checker = make_checker(database=ok)
+
+    ready, checks = checker.status()
+
+    assert not ready
+    assert checks == {"database": {"status": "pending", "critical": True}}
+
+
+async def test_failures_and_timeouts_are_reported_per_check():
+    async def down():
+        raise ConnectionError("connection refused")
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    checker = make_checker(database=ok, redis=down, search=slow)
+    await checker.run_checks()
+
+    ready, checks = checker.status()
+
+    assert not ready
+    assert checks["database"]["status"] == "ok"
+    assert checks["redis"]["status"] == "error"
+    assert checks["redis"]["error"] == "connection refused"
+    assert checks["search"]["error"] == "timed out after 0.05s"
+
+
+async def test_only_critical_checks_decide_readiness():
+    async def tenant_down():
+        raise CheckFailed("1 of 2 tenant databases unreachable", {"databases": {"t1": {"status": "error"}}})
+
+    checker = make_checker(database=ok, optional_tenants=tenant_down)
+    await checker.run_checks()
+
+    ready, checks = checker.status()
+
+    assert ready
+    assert checks["optional_tenants"]["status"] == "error"
+    assert checks["optional_tenants"]["critical"] is False
+    assert checks["optional_tenants"]["details"] == {"databases": {"t1": {"status": "error"}}}
+
+
+async def test_results_older_than_ttl_are_stale():
+    checker = make_checker(ttl=0.01, database=ok)
+    await checker.run_checks()
+    assert checker.status()[0]
+
+    time.sleep(0.02)
+    ready, checks = checker.status()
+
+    assert not ready
+    assert checks["database"]["status"] == "stale"
+
+
+async def test_start_checks_before_serving():
+    """Readiness reflects real checks as soon as startup finishes"""
+    checker = make_checker(database=ok)
+    await checker.start()
+    try:
+        assert checker.status()[0]
+        assert checker._task.running
+    finally:
+        await checker.stop()
+    assert not checker._task.running
+
+
+async def test_probes_do_no_io(monkeypatch):
+    """Probes read recorded results; checks only run in the background"""
+    calls = []
+
+    async def database():
+        calls.append(1)
+
+    checker = make_checker(database=database)
+    await checker.run_checks()
+    monkeypatch.setattr(readiness, "readiness_checker", checker)
+
+    app = FastAPI()
+    app.include_router(readiness.router)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        live = await client.get("/livez")
+        ready = await client.get("/readyz")
+        checker.add_check("redis", ok)
+        not_ready = await client.get("/readyz")
+
+        iterations = 200
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await client.get("/readyz")
+        elapsed = (time.perf_counter() - start) / iterations
+
+    assert live.status_code == 200 and live.json() == {"status": "ok"}
+    assert ready.status_code == 200
+    assert ready.json()["checks"]["database"]["status"] == "ok"
+    assert not_ready.status_code == 503
+    assert not_ready.json()["checks"]["redis"]["status"] == "pending"
+    assert calls == [1]
+    # Includes the test client's own overhead
+    assert elapsed < 0.005
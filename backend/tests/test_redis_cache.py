@@ -0,0 +1,59 @@
+import os
+import uuid
+import pytest
+import redis.asyncio as redis
+from app.core.cache.redis import RedisCache
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+@pytest.fixture
+async def cache():
+    client = redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.close()
+        pytest.skip("Redis is not available")
+    yield RedisCache(client)
+    await client.close()
+
+
+@pytest.mark.integration
+async def test_invalidate_tags_removes_only_tagged_entries(cache):
+    """Invalidating one tenant leaves other tenants' entries alone"""
+    prefix = f"cache-test:{uuid.uuid4()}"
+    for i in range(1200):
+        await cache.set(f"{prefix}:a:{i}", "x", expire=60, tags=[f"{prefix}:tenant:a"])
+    await cache.set(f"{prefix}:b", "y", expire=60, tags=[f"{prefix}:tenant:b"])
+
+    assert await cache.invalidate_tags(f"{prefix}:tenant:a") == 1200
+    assert await cache.get(f"{prefix}:a:0") is None
+    assert await cache.get(f"{prefix}:b") == "y"
+    assert not await cache.exists(cache.tag_key(f"{prefix}:tenant:a"))
+    assert await cache.invalidate_tags(f"{prefix}:missing") == 0
+
+
+@pytest.mark.integration
+async def test_tag_set_outlives_its_entries(cache):
+    """A tag set expires no earlier than its longest-lived entry"""
+    tag = f"cache-test:{uuid.uuid4()}"
+    await cache.set(f"{tag}:long", "x", expire=600, tags=[tag])
+    await cache.set(f"{tag}:short", "x", expire=10, tags=[tag])
+    assert await cache.ttl(cache.tag_key(tag)) > 500
+
+    await cache.set(f"{tag}:forever", "x", tags=[tag])
+    assert await cache.ttl(cache.tag_key(tag)) == -1
+    await cache.invalidate_tags(tag)
+
+
+@pytest.mark.integration
+async def test_clear_pattern_scans_in_batches(cache):
+    """Pattern deletion removes every match without KEYS"""
+    prefix = f"cache-test:{uuid.uuid4()}"
+    for i in range(1100):
+        await cache.set(f"{prefix}:{i}", "x", expire=60)
+
+    assert len(await cache.keys(f"{prefix}:*")) == 1100
+    assert await cache.clear_pattern(f"{prefix}:*")
+    assert await cache.keys(f"{prefix}:*") == []
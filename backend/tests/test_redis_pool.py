@@ -0,0 +1,41 @@
+from prometheus_client import REGISTRY
+from app.core.cache import redis as redis_module
+from app.core.cache.redis import RedisCache, close_redis, get_redis_cache, get_redis_client, init_redis
+from app.core.config.settings import get_settings
+
+
+async def test_callers_share_one_pool():
+    """Every caller gets the same client and connection pool"""
+    client = init_redis()
+    try:
+        assert get_redis_client() is client
+        assert get_redis_cache()._client is client
+        assert client.connection_pool.max_connections == get_settings().REDIS_MAX_CONNECTIONS
+    finally:
+        await close_redis()
+
+
+async def test_close_releases_pool():
+    """Shutdown drops the pool; caches created earlier follow the next one"""
+    cache = RedisCache()
+    first = get_redis_client()
+    await close_redis()
+    assert redis_module._pool is None
+
+    second = get_redis_client()
+    try:
+        assert second is not first
+        assert cache._client is second
+    finally:
+        await close_redis()
+
+
+async def test_pool_metrics_exported():
+    """Pool size and usage are read from the live pool at scrape time"""
+    init_redis()
+    try:
+        assert REGISTRY.get_sample_value("redis_pool_max_connections") == get_settings().REDIS_MAX_CONNECTIONS
+        assert REGISTRY.get_sample_value("redis_pool_connections", {"state": "in_use"}) == 0
+    finally:
+        await close_redis()
+    assert REGISTRY.get_sample_value("redis_pool_max_connections") == 0
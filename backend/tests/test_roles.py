@@ -0,0 +1,99 @@
+import pytest
+from datetime import datetime
+from uuid import UUID
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security.dependencies import get_tenant_id
+from app.main import app
+from app.models.master.permission import Permission
+from app.models.master.role import Role
+from app.services.master.role import RoleService
+
+ROLE_COUNT = 5
+
+
+@pytest.fixture(scope="function")
+def roles_with_permissions(db_session):
+    """Create several roles, each granted its own permissions"""
+    timestamp = datetime.now()
+    roles = []
+    for index in range(ROLE_COUNT):
+        role = Role(
+            Name=f"query_count_role_{index}_{timestamp.timestamp()}",
+            Description="Role for query count tests",
+            CreatedAt=timestamp,
+            CreatedBy=UUID("00000000-0000-0000-0000-000000000001"),  # System user
+            UpdatedAt=timestamp,
+            UpdatedBy=UUID("00000000-0000-0000-0000-000000000001"),  # System user
+            IsDeleted=False
+        )
+        role.Permissions = [
+            Permission(
+                Name=f"query_count_permission_{index}_{p}",
+                Code=f"QUERY_COUNT_{index}_{p}_{int(timestamp.timestamp())}"
+            )
+            for p in range(3)
+        ]
+        db_session.add(role)
+        roles.append(role)
+    db_session.commit()
+    return roles
+
+
+@pytest.mark.integration
+async def test_get_roles_query_count(test_async_engine, roles_with_permissions, assert_max_queries):
+    """Listing roles loads every role's permissions in a constant number of queries"""
+    async with AsyncSession(test_async_engine, expire_on_commit=False) as session:
+        with assert_max_queries(2):
+            roles = await RoleService(session).get_roles(limit=ROLE_COUNT)
+            permission_codes = [p.Code for role in roles for p in role.Permissions]
+    assert len(permission_codes) >= ROLE_COUNT
+
+
+@pytest.mark.integration
+async def test_get_role_query_count(test_async_engine, roles_with_permissions, assert_max_queries):
+    """A single role and its permissions are loaded in one query"""
+    role_id = roles_with_permissions[0].RoleID
+    async with AsyncSession(test_async_engine, expire_on_commit=False) as session:
+        with assert_max_queries(1):
+            role = await RoleService(session).get_role(role_id)
+            assert len(role.Permissions) == 3
+
+
+@pytest.fixture(scope="function")
+def superuser_headers(db_session, test_user, test_tenant):
+    """Headers of a superuser, who passes every permission check, in the test tenant"""
+    from app.core.auth.jwt import create_access_token
+    test_user.IsSuperuser = True
+    db_session.commit()
+    access_token = create_access_token(data={"sub": test_user.Email})
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "X-Tenant-ID": str(test_tenant.TenantID)
+    }
+
+
+@pytest.mark.integration
+def test_list_roles_endpoint_query_count(
+    client,
+    db_session,
+    test_tenant,
+    superuser_headers,
+    roles_with_permissions,
+    assert_max_queries
+):
+    """The role listing endpoint does not issue a query per role"""
+    for role in roles_with_permissions:
+        role.TenantID = test_tenant.TenantID
+    db_session.commit()
+    app.dependency_overrides[get_tenant_id] = lambda: test_tenant.TenantID
+
+    # One user lookup (on a principal cache miss), the roles page and its
+    # permissions; superusers skip the permission query
+    with assert_max_queries(3):
+        response = client.get(f"/api/v1/roles/?limit={ROLE_COUNT}", headers=superuser_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    roles = response.json()
+    assert len(roles) == ROLE_COUNT
+    assert all(len(role["permissions"]) == 3 for role in roles)
@@ -0,0 +1,191 @@
+import json
+import os
+import random
+import time
+import pytest
+import redis.asyncio as redis
+from fastapi import HTTPException
+from app.core.security.session import SessionManager
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+@pytest.fixture
+async def sessions():
+    client = redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.close()
+        pytest.skip("Redis is not available")
+    yield SessionManager(client)
+    await client.close()
+
+
+def new_user_id():
+    return random.randint(10**9, 10**10)
+
+
+@pytest.mark.integration
+async def test_active_sessions_listed_from_index(sessions):
+    """Only the user's own sessions are listed"""
+    user_id, other_id = new_user_id(), new_user_id()
+    own = {await sessions.create_session(user_id, "t1") for _ in range(3)}
+    await sessions.create_session(other_id, "t1")
+
+    listed = await sessions.get_active_sessions(user_id)
+
+    assert {session["session_id"] for session in listed} == own
+    assert await sessions.redis.zcard(sessions._index_key(user_id)) == 3
+
+
+@pytest.mark.integration
+async def test_end_all_sessions_keeps_current(sessions):
+    """Log out everywhere ends every other session of the user"""
+    user_id = new_user_id()
+    current = await sessions.create_session(user_id, "t1")
+    others = [await sessions.create_session(user_id, "t1") for _ in range(2)]
+
+    assert await sessions.end_all_sessions(user_id, except_session_id=current) == 2
+
+    for session_id in others:
+        with pytest.raises(HTTPException):
+            await sessions.validate_session(session_id)
+    assert [s["session_id"] for s in await sessions.get_active_sessions(user_id)] == [current]
+
+
+@pytest.mark.integration
+async def test_index_drops_missing_and_stale_members(sessions):
+    """Sessions that expired or were deleted behind the index are cleaned up"""
+    user_id = new_user_id()
+    expired = await sessions.create_session(user_id, "t1")
+    live = await sessions.create_session(user_id, "t1")
+    await sessions.redis.delete(sessions._session_key(expired))
+    await sessions.redis.zadd(sessions._index_key(user_id), {"ancient": 0})
+
+    listed = await sessions.get_active_sessions(user_id)
+
+    assert [s["session_id"] for s in listed] == [live]
+    assert await sessions.redis.zrange(sessions._index_key(user_id), 0, -1) == [live]
+
+
+@pytest.mark.integration
+async def test_end_session_removes_index_member(sessions):
+    user_id = new_user_id()
+    session_id = await sessions.create_session(user_id, "t1")
+    await sessions.end_session(session_id)
+    assert await sessions.redis.zcard(sessions._index_key(user_id)) == 0
+
+
+@pytest.mark.integration
+async def test_sessions_stored_as_hashes(sessions):
+    user_id = new_user_id()
+    session_id = await sessions.create_session(user_id, "t1")
+    assert await sessions.redis.type(sessions._session_key(session_id)) == "hash"
+    session = await sessions.validate_session(session_id)
+    assert session["user_id"] == user_id and session["tenant_id"] == "t1"
+
+
+@pytest.mark.integration
+async def test_last_activity_written_once_per_interval(sessions):
+    """Validation only rewrites last_activity once the interval has passed"""
+    session_id = await sessions.create_session(new_user_id(), "t1")
+    key = sessions._session_key(session_id)
+    await sessions.redis.hset(key, "last_activity", "2025-01-01T00:00:00")
+    sessions.local_ttl = 0
+
+    sessions.activity_interval = 10**9
+    await sessions.validate_session(session_id)
+    assert await sessions.redis.hget(key, "last_activity") == "2025-01-01T00:00:00"
+
+    sessions.activity_interval = 60
+    await sessions.validate_session(session_id)
+    assert await sessions.redis.hget(key, "last_activity") != "2025-01-01T00:00:00"
+
+
+@pytest.mark.integration
+async def test_local_cache_serves_bursts(sessions):
+    """Repeated validations within the local TTL do not reach Redis"""
+    session_id = await sessions.create_session(new_user_id(), "t1")
+    await sessions.validate_session(session_id)
+    await sessions.redis.delete(sessions._session_key(session_id))
+
+    assert (await sessions.validate_session(session_id))["tenant_id"] == "t1"
+
+    sessions._local.clear()
+    with pytest.raises(HTTPException):
+        await sessions.validate_session(session_id)
+
+
+@pytest.mark.integration
+async def test_end_session_drops_local_entry(sessions):
+    session_id = await sessions.create_session(new_user_id(), "t1")
+    await sessions.validate_session(session_id)
+    await sessions.end_session(session_id)
+    with pytest.raises(HTTPException):
+        await sessions.validate_session(session_id)
+
+
+@pytest.mark.integration
+async def test_activity_update_does_not_recreate_ended_session(sessions):
+    """A session ended after it was read is not written back as a partial hash"""
+    user_id = new_user_id()
+    session_id = await sessions.create_session(user_id, "t1")
+    key = sessions._session_key(session_id)
+    session = sessions._from_hash(await sessions.redis.hgetall(key))
+    await sessions.end_session(session_id)
+
+    assert not await sessions._touch_session(session_id, session)
+    assert not await sessions.redis.exists(key)
+    assert await sessions.redis.zcard(sessions._index_key(user_id)) == 0
+
+
+@pytest.mark.integration
+async def test_activity_update_refreshes_ttl(sessions):
+    session_id = await sessions.create_session(new_user_id(), "t1")
+    key = sessions._session_key(session_id)
+    await sessions.redis.hset(key, "last_activity", "2025-01-01T00:00:00")
+    await sessions.redis.persist(key)
+    sessions.local_ttl = 0
+
+    await sessions.validate_session(session_id)
+
+    assert await sessions.redis.hget(key, "last_activity") != "2025-01-01T00:00:00"
+    assert 0 < await sessions.redis.ttl(key) <= sessions.session_timeout
+
+
+@pytest.mark.integration
+async def test_partial_session_is_invalid(sessions):
+    """A hash missing fields is rejected and deleted instead of raising KeyError"""
+    session_id = f"partial-{new_user_id()}"
+    key = sessions._session_key(session_id)
+    await sessions.redis.hset(key, "last_activity", "2025-01-01T00:00:00")
+
+    with pytest.raises(HTTPException):
+        await sessions.validate_session(session_id)
+    assert not await sessions.redis.exists(key)
+
+
+@pytest.mark.integration
+async def test_legacy_string_sessions_are_ended(sessions):
+    """Sessions stored as JSON strings can be ended, are skipped when listed and rejected"""
+    user_id = new_user_id()
+    live = await sessions.create_session(user_id, "t1")
+    legacy = [f"legacy-{new_user_id()}" for _ in range(3)]
+    for session_id in legacy:
+        await sessions.redis.set(
+            sessions._session_key(session_id),
+            json.dumps({"user_id": user_id, "tenant_id": "t1"}),
+            ex=60
+        )
+        await sessions.redis.zadd(sessions._index_key(user_id), {session_id: time.time()})
+
+    await sessions.end_session(legacy[0])
+    with pytest.raises(HTTPException):
+        await sessions.validate_session(legacy[1])
+    listed = await sessions.get_active_sessions(user_id)
+
+    assert [s["session_id"] for s in listed] == [live]
+    assert await sessions.redis.zrange(sessions._index_key(user_id), 0, -1) == [live]
+    for session_id in legacy:
+        assert not await sessions.redis.exists(sessions._session_key(session_id))
@@ -0,0 +1,164 @@
+import asyncio
+from prometheus_client import REGISTRY
+from sqlalchemy import Column, Integer, String, create_engine, event, select, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+from app.core.concurrency.single_flight import SingleFlight, coalesce
+from app.core.db.query_counter import QueryCounter
+from app.core.security.permission_cache import permission_cache
+from app.schemas.master.role import RoleUpdate
+from app.services.master.role import RoleService
+# Every model the Role relationships name, as in the running app
+import app.models.master.audit  # noqa: F401
+
+LocalBase = declarative_base()
+
+
+class Item(LocalBase):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    group = Column(String(20), nullable=False)
+
+
+class AsyncSessionAdapter:
+    """The two AsyncSession methods the service uses, over a sync session"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement):
+        await asyncio.sleep(0.01)
+        return self.session.execute(statement)
+
+    async def merge(self, instance, load=True):
+        return self.session.merge(instance, load=load)
+
+    async def commit(self):
+        await asyncio.sleep(0.01)
+        self.session.commit()
+
+
+class ItemService:
+    def __init__(self, db):
+        self.db = db
+
+    @coalesce("items")
+    async def get_items(self, group, limit=10):
+        result = await self.db.execute(select(Item).where(Item.group == group).limit(limit))
+        return result.scalars().all()
+
+
+def calls(name, role):
+    return REGISTRY.get_sample_value("single_flight_calls_total", {"name": name, "role": role}) or 0
+
+
+async def test_concurrent_calls_share_one_run():
+    """Only the first of identical concurrent calls runs; the rest are counted as coalesced"""
+    flight = SingleFlight("test-share")
+    runs = []
+
+    async def load():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(flight.do("key", load) for _ in range(20)))
+
+    assert len(runs) == 1
+    assert [value for value, _ in results] == ["value"] * 20
+    assert sum(shared for _, shared in results) == 19
+    assert calls("test-share", "coalesced") == 19
+    assert calls("test-share", "leader") == 1
+
+
+async def test_failed_leader_lets_waiters_run():
+    """Waiters do not inherit the leader's error"""
+    flight = SingleFlight("test-failure")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("session broken")
+
+    async def load():
+        return "value"
+
+    results = await asyncio.gather(flight.do("key", fail), flight.do("key", load), return_exceptions=True)
+
+    assert isinstance(results[0], ConnectionError)
+    assert results[1] == ("value", False)
+    assert calls("test-failure", "retried") == 1
+
+
+async def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight("test-sequential")
+
+    async def load():
+        return object()
+
+    first, _ = await flight.do("key", load)
+    second, shared = await flight.do("key", load)
+    assert first is not second and not shared
+
+
+async def test_coalesced_service_results_join_caller_session():
+    """One query serves every concurrent caller, each with its own session's instances"""
+    engine = create_engine("sqlite://")
+    LocalBase.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add_all(Item(group="a") for _ in range(3))
+        db.commit()
+
+    services = [ItemService(AsyncSessionAdapter(Session())) for _ in range(5)]
+    with QueryCounter(engine) as counter:
+        results = await asyncio.gather(*(service.get_items("a") for service in services))
+        other = await services[0].get_items("a", limit=1)
+
+    assert counter.count == 2
+    assert len(other) == 1
+    for service, items in zip(services, results):
+        assert len(items) == 3
+        assert all(item in service.db.session for item in items)
+    engine.dispose()
+
+
+async def test_role_update_does_not_share_instances_with_readers(monkeypatch):
+    """A write path loads its own role, so concurrent readers never merge a dirty instance"""
+    async def bump_tenant(tenant_id):
+        pass
+
+    monkeypatch.setattr(permission_cache, "bump_tenant", bump_tenant)
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach_dbo(connection, record):
+        connection.execute("ATTACH DATABASE ':memory:' AS dbo")
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE dbo.Roles (RoleID INTEGER PRIMARY KEY, Name TEXT, Description TEXT, "
+            "TenantID INTEGER, IsActive BOOLEAN, CreatedAt DATETIME, CreatedBy INTEGER, "
+            "UpdatedAt DATETIME, UpdatedBy INTEGER, IsDeleted BOOLEAN)"
+        ))
+        connection.execute(text(
+            "CREATE TABLE dbo.Permissions (PermissionID INTEGER PRIMARY KEY, Name TEXT, Code TEXT, "
+            "Description TEXT, IsActive BOOLEAN, CreatedAt DATETIME, CreatedBy INTEGER, "
+            "UpdatedAt DATETIME, UpdatedBy INTEGER, IsDeleted BOOLEAN)"
+        ))
+        connection.execute(text("CREATE TABLE dbo.RolePermissions (RoleID INTEGER, PermissionID INTEGER)"))
+        connection.execute(text(
+            "INSERT INTO dbo.Roles VALUES (1, 'viewer', NULL, 1, 1, '2025-01-01', NULL, '2025-01-01', NULL, 0)"
+        ))
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+    writer = RoleService(AsyncSessionAdapter(Session()))
+    readers = [RoleService(AsyncSessionAdapter(Session())) for _ in range(3)]
+    updated, *read = await asyncio.gather(
+        writer.update_role(1, RoleUpdate(name="editor"), tenant_id=1),
+        *(reader.get_role(1, 1) for reader in readers)
+    )
+
+    assert updated.Name == "editor"
+    assert all(role is not updated for role in read)
+    for reader, role in zip(readers, read):
+        assert role in reader.db.session
+    engine.dispose()